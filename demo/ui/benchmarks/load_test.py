@@ -0,0 +1,264 @@
+"""Load test for the demo UI backend using the fake agent manager.
+
+Boots ConversationServer with InMemoryFakeAgentManager on a local port in
+this process, drives concurrent conversations against it at a fixed message
+rate and reports latency percentiles per endpoint plus memory growth.
+Memory is measured with tracemalloc, which itself adds overhead, so compare
+latencies between runs of this harness rather than against production.
+
+run:
+  uv run python -m benchmarks.load_test --conversations 20 --rate 2
+"""
+
+import asyncio
+import gc
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+
+
+# Add the samples to the Python path, as main.py does
+sys.path.append(
+    os.path.abspath(
+        os.path.join(
+            os.path.dirname(__file__), '..', '..', '..', 'samples', 'python'
+        )
+    )
+)
+
+import click
+import httpx
+import uvicorn
+
+from a2a.types import Message, Part, Role, TextPart
+from fastapi import FastAPI
+from service.client.client import ConversationClient
+from service.server.in_memory_manager import InMemoryFakeAgentManager
+from service.server.server import ConversationServer
+from service.types import (
+    CreateConversationRequest,
+    GetStateRequest,
+    ListConversationRequest,
+    ListMessageRequest,
+    SendMessageRequest,
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(response_delay: float) -> tuple[uvicorn.Server, str]:
+    """Starts the conversation server on a background thread."""
+    os.environ['A2A_HOST'] = 'FAKE'
+    app = FastAPI()
+    conversation_server = ConversationServer(app, httpx.AsyncClient())
+    conversation_server.manager = InMemoryFakeAgentManager(
+        response_delay=response_delay
+    )
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host='127.0.0.1', port=port, log_level='warning')
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f'http://127.0.0.1:{port}'
+
+
+class LoadStats:
+    """Collects request latencies and errors per endpoint."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    async def timed(self, endpoint: str, coro):
+        start = time.perf_counter()
+        try:
+            return await coro
+        except Exception:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+            return None
+        finally:
+            self.latencies.setdefault(endpoint, []).append(
+                (time.perf_counter() - start) * 1000
+            )
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        rval = {}
+        for endpoint, values in sorted(self.latencies.items()):
+            if len(values) > 1:
+                q = statistics.quantiles(values, n=100, method='inclusive')
+                p50, p95, p99 = q[49], q[94], q[98]
+            else:
+                p50 = p95 = p99 = values[0]
+            rval[endpoint] = {
+                'count': len(values),
+                'errors': self.errors.get(endpoint, 0),
+                'p50_ms': round(p50, 2),
+                'p95_ms': round(p95, 2),
+                'p99_ms': round(p99, 2),
+                'max_ms': round(max(values), 2),
+            }
+        return rval
+
+
+async def run_conversation(
+    client: ConversationClient,
+    stats: LoadStats,
+    rate: float,
+    deadline: float,
+):
+    """Sends messages at the given rate and lists after each send."""
+    response = await stats.timed(
+        'conversation/create',
+        client.create_conversation(CreateConversationRequest()),
+    )
+    if not response or not response.result:
+        return
+    conversation_id = response.result.conversation_id
+    interval = 1 / rate
+    next_send = time.monotonic()
+    while next_send < deadline:
+        message = Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text='Hello'))],
+            messageId=str(uuid.uuid4()),
+            contextId=conversation_id,
+        )
+        await stats.timed(
+            'message/send',
+            client.send_message(SendMessageRequest(params=message)),
+        )
+        await stats.timed(
+            'message/list',
+            client.list_messages(ListMessageRequest(params=conversation_id)),
+        )
+        await stats.timed(
+            'conversation/list',
+            client.list_conversation(ListConversationRequest()),
+        )
+        await stats.timed(
+            'state/get',
+            client.get_state(GetStateRequest(params=conversation_id)),
+        )
+        next_send += interval
+        await asyncio.sleep(max(0, next_send - time.monotonic()))
+
+
+async def sample_memory(
+    samples: list[tuple[float, int]], start: float, deadline: float
+):
+    while time.monotonic() < deadline:
+        current, _ = tracemalloc.get_traced_memory()
+        samples.append((round(time.monotonic() - start, 1), current))
+        await asyncio.sleep(1)
+
+
+async def run_load_test(
+    conversations: int,
+    rate: float,
+    duration: float,
+    response_delay: float,
+) -> dict:
+    tracemalloc.start()
+    server, base_url = start_server(response_delay)
+    stats = LoadStats()
+    memory: list[tuple[float, int]] = []
+    limits = httpx.Limits(max_connections=conversations * 2)
+    try:
+        async with httpx.AsyncClient(limits=limits, timeout=30) as http_client:
+            client = ConversationClient(base_url, http_client)
+            start = time.monotonic()
+            deadline = start + duration
+            await asyncio.gather(
+                sample_memory(memory, start, deadline),
+                *(
+                    run_conversation(client, stats, rate, deadline)
+                    for _ in range(conversations)
+                ),
+            )
+            elapsed = time.monotonic() - start
+        # Let in-flight fake responses settle before the final sample.
+        await asyncio.sleep(response_delay)
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        memory.append((round(time.monotonic() - start, 1), current))
+    finally:
+        server.should_exit = True
+        tracemalloc.stop()
+    sent = len(stats.latencies.get('message/send', []))
+    return {
+        'conversations': conversations,
+        'rate_per_conversation': rate,
+        'duration_s': round(elapsed, 2),
+        'messages_sent': sent,
+        'throughput_msgs_per_s': round(sent / elapsed, 2),
+        'endpoints': stats.summary(),
+        'memory': {
+            'start_bytes': memory[0][1],
+            'end_bytes': memory[-1][1],
+            'peak_bytes': peak,
+            'growth_bytes': memory[-1][1] - memory[0][1],
+            'growth_per_message_bytes': (memory[-1][1] - memory[0][1])
+            // max(sent, 1),
+            'samples': memory,
+        },
+    }
+
+
+def print_report(report: dict):
+    print(
+        f'{report["messages_sent"]} messages over {report["duration_s"]}s '
+        f'from {report["conversations"]} conversations '
+        f'({report["throughput_msgs_per_s"]} msgs/s)'
+    )
+    print(
+        f'{"endpoint":<20}{"count":>8}{"errors":>8}'
+        f'{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}'
+    )
+    for endpoint, s in report['endpoints'].items():
+        print(
+            f'{endpoint:<20}{s["count"]:>8}{s["errors"]:>8}'
+            f'{s["p50_ms"]:>10}{s["p95_ms"]:>10}{s["p99_ms"]:>10}'
+        )
+    memory = report['memory']
+    print(
+        f'memory: start {memory["start_bytes"] / 1e6:.1f}MB, '
+        f'end {memory["end_bytes"] / 1e6:.1f}MB, '
+        f'peak {memory["peak_bytes"] / 1e6:.1f}MB, '
+        f'{memory["growth_per_message_bytes"]} bytes/message'
+    )
+
+
+@click.command()
+@click.option('--conversations', default=10, help='Concurrent conversations.')
+@click.option(
+    '--rate', default=1.0, help='Messages per second per conversation.'
+)
+@click.option('--duration', default=30.0, help='Test duration in seconds.')
+@click.option(
+    '--response-delay', default=0.1, help='Fake agent response delay (s).'
+)
+@click.option('--json-output', is_flag=True, help='Print the report as JSON.')
+def main(conversations, rate, duration, response_delay, json_output):
+    report = asyncio.run(
+        run_load_test(conversations, rate, duration, response_delay)
+    )
+    if json_output:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@ import os
 
 import mesop as me
 
+from service.client.client import closes_conversation_clients
 from state.host_agent_service import UpdateApiKey
 from state.state import AppState
 
@@ -14,6 +15,7 @@ def on_api_key_change(e: me.InputBlurEvent):
     state.api_key = e.value
 
 
+@closes_conversation_clients
 async def save_api_key(e: me.ClickEvent):
     """Save API key and close dialog"""
     yield  # Yield to allow UI update
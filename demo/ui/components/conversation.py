@@ -3,6 +3,7 @@ import uuid
 import mesop as me
 
 from a2a.types import Message, Part, Role, TextPart
+from service.client.client import closes_conversation_clients
 from state.host_agent_service import (
     ListConversations,
     SendMessage,
@@ -61,9 +62,10 @@ async def send_message(message: str, message_id: str = ''):
     )
     if conversation:
         conversation.message_ids.append(state_message.message_id)
-    await SendMessage(request)
+    await SendMessage(request, app_state.user_id)
 
 
+@closes_conversation_clients
 async def send_message_enter(e: me.InputEnterEvent):  # pylint: disable=unused-argument
     """Send message handler"""
     yield
@@ -77,6 +79,7 @@ async def send_message_enter(e: me.InputEnterEvent):  # pylint: disable=unused-a
     yield
 
 
+@closes_conversation_clients
 async def send_message_button(e: me.ClickEvent):  # pylint: disable=unused-argument
     """Send message button handler"""
     yield
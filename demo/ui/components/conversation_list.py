@@ -1,6 +1,7 @@
 import mesop as me
 import pandas as pd
 
+from service.client.client import closes_conversation_clients
 from state.host_agent_service import CreateConversation
 from state.state import AppState, StateConversation
 
@@ -55,10 +56,12 @@ def conversation_list(conversations: list[StateConversation]):
             me.icon(icon='add')
 
 
+@closes_conversation_clients
 async def add_conversation(e: me.ClickEvent):  # pylint: disable=unused-argument
     """Add conversation button handler"""
-    response = await CreateConversation()
-    me.state(AppState).messages = []
+    app_state = me.state(AppState)
+    response = await CreateConversation(app_state.user_id)
+    app_state.messages = []
     me.navigate(
         '/conversation',
         query_params={'conversation_id': response.conversation_id},
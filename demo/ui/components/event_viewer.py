@@ -1,8 +1,7 @@
-import asyncio
-
 import mesop as me
 import pandas as pd
 
+from service.client.client import run_sync
 from state.host_agent_service import GetEvents, convert_event_to_state
 
 
@@ -27,7 +26,7 @@ def event_list():
         'Id': [],
         'Content': [],
     }
-    events = asyncio.run(GetEvents())
+    events = run_sync(GetEvents())
     for e in events:
         event = convert_event_to_state(e)
         df_data['Conversation ID'].append(event.context_id)
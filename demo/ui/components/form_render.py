@@ -7,6 +7,7 @@ from typing import Any, Literal
 import mesop as me
 
 from a2a.types import DataPart, Message, Part, Role, TextPart
+from service.client.client import closes_conversation_clients
 from state.host_agent_service import SendMessage
 from state.state import AppState, StateMessage
 
@@ -305,6 +306,7 @@ def on_blur(e: me.InputBlurEvent):
     state.forms[id] = form_state_to_string(form)
 
 
+@closes_conversation_clients
 async def cancel_form(e: me.ClickEvent):
     message_id = str(uuid.uuid4())
     app_state = me.state(AppState)
@@ -320,7 +322,7 @@ async def cancel_form(e: me.ClickEvent):
         role=Role.user,
         parts=[Part(root=TextPart(text='rejected form entry'))],
     )
-    response = await SendMessage(request)
+    response = await SendMessage(request, app_state.user_id)
 
 
 async def send_response(
@@ -338,9 +340,10 @@ async def send_response(
         role=Role.user,
         parts=[Part(root=DataPart(data=form.data))],
     )
-    await SendMessage(request)
+    await SendMessage(request, app_state.user_id)
 
 
+@closes_conversation_clients
 async def submit_form(e: me.ClickEvent):
     try:
         state = me.state(State)
@@ -1,6 +1,7 @@
 import mesop as me
 import mesop.labs as mel
 
+from service.client.client import closes_conversation_clients
 from state.host_agent_service import UpdateAppState
 from state.state import AppState
 from styles.styles import (
@@ -15,6 +16,7 @@ from .async_poller import AsyncAction, async_poller
 from .side_nav import sidenav
 
 
+@closes_conversation_clients
 async def refresh_app_state(e: mel.WebEvent):  # pylint: disable=unused-argument
     """Refresh app state event handler"""
     yield
@@ -1,5 +1,6 @@
 import mesop as me
 
+from service.client.client import closes_conversation_clients
 from state.host_agent_service import UpdateAppState
 from state.state import AppState
 
@@ -43,6 +44,7 @@ def on_change(e: me.ButtonToggleChangeEvent):
     state.polling_interval = int(e.value)
 
 
+@closes_conversation_clients
 async def force_refresh(e: me.ClickEvent):
     """Refresh app state event handler"""
     yield
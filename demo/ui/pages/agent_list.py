@@ -1,11 +1,10 @@
-import asyncio
-
 import mesop as me
 
 from components.agent_list import agents_list
 from components.dialog import dialog, dialog_actions
 from components.header import header
 from components.page_scaffold import page_frame, page_scaffold
+from service.client.client import closes_conversation_clients, run_sync
 from state.agent_state import AgentState
 from state.host_agent_service import AddRemoteAgent, ListRemoteAgents
 from state.state import AppState
@@ -19,7 +18,7 @@ def agent_list_page(app_state: AppState):
         with page_frame():
             with header('Remote Agents', 'smart_toy'):
                 pass
-            agents = asyncio.run(ListRemoteAgents())
+            agents = run_sync(ListRemoteAgents())
             agents_list(agents)
             with dialog(state.agent_dialog_open):
                 with me.box(
@@ -99,6 +98,7 @@ def cancel_agent_dialog(e: me.ClickEvent):
     state.agent_dialog_open = False
 
 
+@closes_conversation_clients
 async def save_agent(e: me.ClickEvent):
     state = me.state(AgentState)
     await AddRemoteAgent(state.agent_address)
@@ -4,6 +4,7 @@ import mesop as me
 
 from components.header import header
 from components.page_scaffold import page_frame, page_scaffold
+from service.client.client import closes_conversation_clients
 from state.host_agent_service import UpdateApiKey
 from state.state import AppState, SettingsState
 
@@ -25,6 +26,7 @@ class UpdateStatus:
     show_success: bool = False
 
 
+@closes_conversation_clients
 async def update_api_key(e: me.ClickEvent):
     yield  # Allow UI to update
 
@@ -1,6 +1,11 @@
+import asyncio
+import functools
+import inspect
 import json
+import weakref
 
-from typing import Any
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
 
 import httpx
 
@@ -11,6 +16,8 @@ from service.types import (
     CreateConversationResponse,
     GetEventRequest,
     GetEventResponse,
+    GetStateRequest,
+    GetStateResponse,
     JSONRPCRequest,
     ListAgentRequest,
     ListAgentResponse,
@@ -29,9 +36,112 @@ from service.types import (
 )
 
 
+# Connection pool settings for the shared client. The UI polls the server
+# every second, so keeping connections alive avoids a TCP handshake per call.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=30,
+)
+_POOL_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+T = TypeVar('T')
+
+# httpx.AsyncClient is bound to the event loop it was first used on, so the
+# shared clients are kept per loop. Mesop runs every async event handler on a
+# new loop it never closes, so handlers are wrapped with
+# closes_conversation_clients(), and synchronous code goes through run_sync().
+# Both close the clients before their short-lived loop is dropped.
+_shared_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, 'ConversationClient']
+] = weakref.WeakKeyDictionary()
+
+
+def get_conversation_client(base_url: str) -> 'ConversationClient':
+    """Returns the process-wide pooled ConversationClient for base_url.
+
+    Must be called from within a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _shared_clients.setdefault(loop, {})
+    key = base_url.rstrip('/')
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = ConversationClient(
+            key,
+            httpx.AsyncClient(limits=_POOL_LIMITS, timeout=_POOL_TIMEOUT),
+        )
+        clients[key] = client
+    return client
+
+
+async def close_conversation_clients():
+    """Closes the pooled clients that belong to the running event loop."""
+    clients = _shared_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Runs a coroutine from synchronous code in an event loop of its own.
+
+    asyncio.run() creates a new loop on every call, so the pooled clients
+    the coroutine used are closed before that loop ends instead of leaking
+    their connections.
+    """
+
+    async def run() -> T:
+        try:
+            return await coro
+        finally:
+            await close_conversation_clients()
+
+    return asyncio.run(run())
+
+
+def closes_conversation_clients(handler: Callable) -> Callable:
+    """Wraps an async Mesop event handler to close the clients it opened.
+
+    Works for handlers written as coroutines and as async generators.
+    """
+    if inspect.isasyncgenfunction(handler):
+
+        @functools.wraps(handler)
+        async def generator_wrapper(*args, **kwargs):
+            try:
+                async for update in handler(*args, **kwargs):
+                    yield update
+            finally:
+                await close_conversation_clients()
+
+        return generator_wrapper
+
+    @functools.wraps(handler)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await handler(*args, **kwargs)
+        finally:
+            await close_conversation_clients()
+
+    return wrapper
+
+
 class ConversationClient:
-    def __init__(self, base_url):
+    def __init__(self, base_url, http_client: httpx.AsyncClient | None = None):
         self.base_url = base_url.rstrip('/')
+        self._http_client = http_client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient | None:
+        return self._http_client
+
+    @property
+    def is_closed(self) -> bool:
+        return self._http_client is not None and self._http_client.is_closed
+
+    async def aclose(self):
+        if self._http_client is not None:
+            await self._http_client.aclose()
 
     async def send_message(
         self, payload: SendMessageRequest
@@ -39,22 +149,27 @@ class ConversationClient:
         return SendMessageResponse(**await self._send_request(payload))
 
     async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
+        if self._http_client is not None:
+            return await self._post(self._http_client, request)
         async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.base_url + '/' + request.method,
-                    json=request.model_dump(mode='json', exclude_none=True),
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                print('http error', e)
-                raise AgentClientHTTPError(
-                    e.response.status_code, str(e)
-                ) from e
-            except json.JSONDecodeError as e:
-                print('decode error', e)
-                raise AgentClientJSONError(str(e)) from e
+            return await self._post(client, request)
+
+    async def _post(
+        self, client: httpx.AsyncClient, request: JSONRPCRequest
+    ) -> dict[str, Any]:
+        try:
+            response = await client.post(
+                self.base_url + '/' + request.method,
+                json=request.model_dump(mode='json', exclude_none=True),
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            print('http error', e)
+            raise AgentClientHTTPError(e.response.status_code, str(e)) from e
+        except json.JSONDecodeError as e:
+            print('decode error', e)
+            raise AgentClientJSONError(str(e)) from e
 
     async def create_conversation(
         self, payload: CreateConversationRequest
@@ -79,6 +194,9 @@ class ConversationClient:
     ) -> PendingMessageResponse:
         return PendingMessageResponse(**await self._send_request(payload))
 
+    async def get_state(self, payload: GetStateRequest) -> GetStateResponse:
+        return GetStateResponse(**await self._send_request(payload))
+
     async def list_tasks(self, payload: ListTaskRequest) -> ListTaskResponse:
         return ListTaskResponse(**await self._send_request(payload))
 
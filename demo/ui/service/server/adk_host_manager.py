@@ -1,15 +1,17 @@
 import asyncio
 import base64
+import collections
+import dataclasses
 import datetime
 import json
 import os
+import time
 import uuid
 
 import httpx
 
 from a2a.types import (
     AgentCard,
-    Artifact,
     DataPart,
     FilePart,
     FileWithBytes,
@@ -38,9 +40,38 @@ from hosts.multiagent.remote_agent_connection import (
 from utils.agent_card import get_agent_card
 
 from service.server.application_manager import ApplicationManager
+from service.server.artifact_assembler import ArtifactAssembler
+from service.server.event_log import EventLog
 from service.types import Conversation, Event
 
 
+DEFAULT_USER_ID = 'test_user'
+
+
+@dataclasses.dataclass
+class _TenantHost:
+    """The ADK services and runner of a single user."""
+
+    user_id: str
+    session_service: InMemorySessionService = dataclasses.field(
+        default_factory=InMemorySessionService
+    )
+    artifact_service: InMemoryArtifactService = dataclasses.field(
+        default_factory=InMemoryArtifactService
+    )
+    memory_service: InMemoryMemoryService = dataclasses.field(
+        default_factory=InMemoryMemoryService
+    )
+    # Created lazily, reset whenever the host agent definition changes.
+    runner: Runner | None = None
+    # Maps session id to the time it was last used, least recent first.
+    sessions: collections.OrderedDict[str, float] = dataclasses.field(
+        default_factory=collections.OrderedDict
+    )
+    last_used: float = 0.0
+    active_messages: int = 0
+
+
 class ADKHostManager(ApplicationManager):
     """An implementation of memory based management with fake agent actions
 
@@ -54,20 +85,37 @@ class ADKHostManager(ApplicationManager):
         http_client: httpx.AsyncClient,
         api_key: str = '',
         uses_vertex_ai: bool = False,
+        event_log: EventLog | None = None,
+        max_tenants: int = 100,
+        max_sessions_per_tenant: int = 100,
+        tenant_idle_seconds: float = 3600.0,
     ):
         self._conversations: list[Conversation] = []
-        self._messages: list[Message] = []
+        self._event_log = event_log or EventLog()
+        # Messages are retained with the same bound as events
+        self._messages: collections.deque[Message] = collections.deque(
+            maxlen=self._event_log.max_events
+        )
         self._tasks: list[Task] = []
-        self._events: dict[str, Event] = {}
         self._pending_message_ids: list[str] = []
         self._agents: list[AgentCard] = []
-        self._artifact_chunks: dict[str, list[Artifact]] = {}
-        self._session_service = InMemorySessionService()
-        self._artifact_service = InMemoryArtifactService()
-        self._memory_service = InMemoryMemoryService()
+        self._artifact_assembler = ArtifactAssembler()
+        # Each user gets its own runner and session services, least recently
+        # used users are evicted first.
+        self._tenants: collections.OrderedDict[str, _TenantHost] = (
+            collections.OrderedDict()
+        )
+        self._max_tenants = max_tenants
+        self._max_sessions_per_tenant = max_sessions_per_tenant
+        self._tenant_idle_seconds = tenant_idle_seconds
+        # Maps conversation id to the user that owns it
+        self._conversation_users: dict[str, str] = {}
+        # Messages of one conversation are processed in order, different
+        # conversations are processed concurrently.
+        self._conversation_locks: dict[str, asyncio.Lock] = {}
         self._host_agent = HostAgent([], http_client, self.task_callback)
         self._context_to_conversation: dict[str, str] = {}
-        self.user_id = 'test_user'
+        self.user_id = DEFAULT_USER_ID
         self.app_name = 'A2A'
         self.api_key = api_key or os.environ.get('GOOGLE_API_KEY', '')
         self.uses_vertex_ai = (
@@ -94,20 +142,110 @@ class ADKHostManager(ApplicationManager):
         ] = {}  # dict[str, str]: previous message to next message
 
     def _initialize_host(self):
-        agent = self._host_agent.create_agent()
-        self._host_runner = Runner(
+        self._host_agent_definition = self._host_agent.create_agent()
+        # The runners pick up the new definition on their next use
+        for tenant in self._tenants.values():
+            tenant.runner = None
+
+    def _get_tenant(self, user_id: str) -> _TenantHost:
+        tenant = self._tenants.get(user_id)
+        if tenant is None:
+            tenant = _TenantHost(user_id=user_id)
+            self._tenants[user_id] = tenant
+        self._tenants.move_to_end(user_id)
+        tenant.last_used = time.monotonic()
+        self._evict_tenants()
+        return tenant
+
+    def _evict_tenants(self):
+        cutoff = time.monotonic() - self._tenant_idle_seconds
+        # The most recently used tenant is the one being requested, keep it
+        for user_id, tenant in list(self._tenants.items())[:-1]:
+            if len(self._tenants) <= self._max_tenants and (
+                tenant.last_used > cutoff
+            ):
+                # Everything after this one was used more recently
+                break
+            if tenant.active_messages:
+                continue
+            del self._tenants[user_id]
+            for session_id in tenant.sessions:
+                self._conversation_locks.pop(session_id, None)
+            self._conversation_users = {
+                conversation_id: owner
+                for conversation_id, owner in self._conversation_users.items()
+                if owner != user_id
+            }
+
+    def _get_runner(self, tenant: _TenantHost) -> Runner:
+        if tenant.runner is None:
+            tenant.runner = Runner(
+                app_name=self.app_name,
+                agent=self._host_agent_definition,
+                artifact_service=tenant.artifact_service,
+                session_service=tenant.session_service,
+                memory_service=tenant.memory_service,
+            )
+        return tenant.runner
+
+    def _tenant_for_conversation(
+        self, conversation_id: str | None, message: Message | None = None
+    ) -> _TenantHost:
+        user_id = self._conversation_users.get(conversation_id or '')
+        if not user_id and message and message.metadata:
+            user_id = message.metadata.get('user_id')
+        return self._get_tenant(user_id or DEFAULT_USER_ID)
+
+    async def _touch_session(self, tenant: _TenantHost, session_id: str):
+        tenant.sessions[session_id] = time.monotonic()
+        tenant.sessions.move_to_end(session_id)
+        idle = [
+            x
+            for x in tenant.sessions
+            if x != session_id
+            and not (
+                x in self._conversation_locks
+                and self._conversation_locks[x].locked()
+            )
+        ]
+        for evicted in idle[
+            : max(0, len(tenant.sessions) - self._max_sessions_per_tenant)
+        ]:
+            del tenant.sessions[evicted]
+            self._conversation_locks.pop(evicted, None)
+            await self._delete_session(tenant, evicted)
+
+    async def _delete_session(self, tenant: _TenantHost, session_id: str):
+        for filename in await tenant.artifact_service.list_artifact_keys(
             app_name=self.app_name,
-            agent=agent,
-            artifact_service=self._artifact_service,
-            session_service=self._session_service,
-            memory_service=self._memory_service,
+            user_id=tenant.user_id,
+            session_id=session_id,
+        ):
+            if filename.startswith('user:'):
+                # User scoped artifacts outlive the session
+                continue
+            await tenant.artifact_service.delete_artifact(
+                app_name=self.app_name,
+                user_id=tenant.user_id,
+                session_id=session_id,
+                filename=filename,
+            )
+        await tenant.session_service.delete_session(
+            app_name=self.app_name,
+            user_id=tenant.user_id,
+            session_id=session_id,
         )
 
-    async def create_conversation(self) -> Conversation:
-        session = await self._session_service.create_session(
-            app_name=self.app_name, user_id=self.user_id
+    async def create_conversation(
+        self, user_id: str | None = None
+    ) -> Conversation:
+        tenant = self._get_tenant(user_id or DEFAULT_USER_ID)
+        session = await tenant.session_service.create_session(
+            app_name=self.app_name, user_id=tenant.user_id
         )
         conversation_id = session.id
+        self._conversation_users[conversation_id] = tenant.user_id
+        await self._touch_session(tenant, conversation_id)
         c = Conversation(conversation_id=conversation_id, is_active=True)
         self._conversations.append(c)
         return c
@@ -160,11 +298,39 @@ class ADKHostManager(ApplicationManager):
                 timestamp=datetime.datetime.utcnow().timestamp(),
             )
         )
+        tenant = self._tenant_for_conversation(context_id, message)
+        tenant.active_messages += 1
+        lock = self._conversation_locks.setdefault(context_id, asyncio.Lock())
+        try:
+            async with lock:
+                await self._run_host(tenant, message, conversation)
+        finally:
+            tenant.active_messages -= 1
+            if message_id:
+                self._pending_message_ids.remove(message_id)
+
+    async def _run_host(
+        self,
+        tenant: _TenantHost,
+        message: Message,
+        conversation: Conversation | None,
+    ):
+        context_id = message.contextId
         final_event = None
+        await self._touch_session(tenant, context_id)
         # Determine if a task is to be resumed.
-        session = await self._session_service.get_session(
-            app_name='A2A', user_id='test_user', session_id=context_id
+        session = await tenant.session_service.get_session(
+            app_name=self.app_name,
+            user_id=tenant.user_id,
+            session_id=context_id,
         )
+        if session is None:
+            # The session was evicted while idle, start it over
+            session = await tenant.session_service.create_session(
+                app_name=self.app_name,
+                user_id=tenant.user_id,
+                session_id=context_id,
+            )
         task_id = message.taskId
         # Update state must happen in an event
         state_update = {
@@ -173,7 +339,7 @@ class ADKHostManager(ApplicationManager):
             'message_id': message.messageId,
         }
         # Need to upsert session state now, only way is to append an event.
-        await self._session_service.append_event(
+        await tenant.session_service.append_event(
             session,
             ADKEvent(
                 id=ADKEvent.new_id(),
@@ -182,8 +348,8 @@ class ADKHostManager(ApplicationManager):
                 actions=ADKEventActions(state_delta=state_update),
             ),
         )
-        async for event in self._host_runner.run_async(
-            user_id=self.user_id,
+        async for event in self._get_runner(tenant).run_async(
+            user_id=tenant.user_id,
             session_id=context_id,
             new_message=self.adk_content_from_message(message),
         ):
@@ -218,7 +384,6 @@ class ADKHostManager(ApplicationManager):
 
         if conversation and response:
             conversation.messages.append(response)
-        self._pending_message_ids.remove(message_id)
 
     def add_task(self, task: Task):
         self._tasks.append(task)
@@ -362,39 +527,17 @@ class ADKHostManager(ApplicationManager):
     def process_artifact_event(
         self, current_task: Task, task_update_event: TaskArtifactUpdateEvent
     ):
-        artifact = task_update_event.artifact
-        if not task_update_event.append:
-            # received the first chunk or entire payload for an artifact
-            if (
-                task_update_event.lastChunk is None
-                or task_update_event.lastChunk
-            ):
-                # lastChunk bit is missing or is set to true, so this is the entire payload
-                # add this to artifacts
-                if not current_task.artifacts:
-                    current_task.artifacts = []
-                current_task.artifacts.append(artifact)
-            else:
-                # this is a chunk of an artifact, stash it in temp store for assembling
-                if artifact.artifactId not in self._artifact_chunks:
-                    self._artifact_chunks[artifact.artifactId] = []
-                self._artifact_chunks[artifact.artifactId].append(artifact)
+        artifact = self._artifact_assembler.add(task_update_event)
+        if not artifact:
+            # a chunk of an artifact that is still being assembled
+            return
+        if current_task.artifacts:
+            current_task.artifacts.append(artifact)
         else:
-            # we received an append chunk, add to the existing temp artifact
-            current_temp_artifact = self._artifact_chunks[artifact.artifactId][
-                -1
-            ]
-            # TODO handle if current_temp_artifact is missing
-            current_temp_artifact.parts.extend(artifact.parts)
-            if task_update_event.lastChunk:
-                if current_task.artifacts:
-                    current_task.artifacts.append(current_temp_artifact)
-                else:
-                    current_task.artifacts = [current_temp_artifact]
-                del self._artifact_chunks[artifact.artifactId][-1]
+            current_task.artifacts = [artifact]
 
     def add_event(self, event: Event):
-        self._events[event.id] = event
+        self._event_log.add(event)
 
     def get_conversation(
         self, conversation_id: str | None
@@ -441,7 +584,7 @@ class ADKHostManager(ApplicationManager):
         if not agent_data.url:
             agent_data.url = url
         self._agents.append(agent_data)
-        self._host_agent.register_agent_card(agent_data)
+        self._host_agent.register_agent_card(agent_data, url)
         # Now update the host agent definition
         self._initialize_host()
 
@@ -459,7 +602,23 @@ class ADKHostManager(ApplicationManager):
 
     @property
     def events(self) -> list[Event]:
-        return sorted(self._events.values(), key=lambda x: x.timestamp)
+        return self._event_log.events
+
+    def query_events(
+        self,
+        conversation_id: str | None = None,
+        start_time: float | None = None,
+        end_time: float | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[Event]:
+        return self._event_log.query(
+            conversation_id=conversation_id,
+            start_time=start_time,
+            end_time=end_time,
+            offset=offset,
+            limit=limit,
+        )
 
     def adk_content_from_message(self, message: Message) -> types.Content:
         parts: list[types.Part] = []
@@ -579,27 +738,32 @@ class ADKHostManager(ApplicationManager):
                         parts.append(Part(root=DataPart(data=p)))
                 elif isinstance(p, DataPart):
                     if 'artifact-file-id' in p.data:
-                        file_part = await self._artifact_service.load_artifact(
-                            user_id=self.user_id,
+                        tenant = self._tenant_for_conversation(context_id)
+                        artifact_service = tenant.artifact_service
+                        file_part = await artifact_service.load_artifact(
+                            user_id=tenant.user_id,
                             session_id=context_id,
                             app_name=self.app_name,
                             filename=p.data['artifact-file-id'],
                         )
-                        file_data = file_part.inline_data
-                        base64_data = base64.b64encode(file_data.data).decode(
-                            'utf-8'
-                        )
-                        parts.append(
-                            Part(
-                                root=FilePart(
-                                    file=FileWithBytes(
-                                        bytes=base64_data,
-                                        mimeType=file_data.mime_type,
-                                        name='artifact_file',
-                                    )
-                                )
+                        if file_part.file_data:
+                            # Served by the remote agent, the UI fetches it
+                            # only when the file is displayed
+                            file = FileWithUri(
+                                uri=file_part.file_data.file_uri,
+                                mimeType=file_part.file_data.mime_type,
+                                name=p.data['artifact-file-id'],
                             )
-                        )
+                        else:
+                            file_data = file_part.inline_data
+                            file = FileWithBytes(
+                                bytes=base64.b64encode(file_data.data).decode(
+                                    'utf-8'
+                                ),
+                                mimeType=file_data.mime_type,
+                                name='artifact_file',
+                            )
+                        parts.append(Part(root=FilePart(file=file)))
                     else:
                         parts.append(Part(root=DataPart(data=p.data)))
                 else:
@@ -617,17 +781,6 @@ class ADKHostManager(ApplicationManager):
             )
         return parts
 
-    def process_message_threadsafe(
-        self, message: Message, loop: asyncio.AbstractEventLoop
-    ):
-        """Safely run process_message from a thread using the given event loop."""
-        future = asyncio.run_coroutine_threadsafe(
-            self.process_message(message), loop
-        )
-        return (
-            future  # You can call future.result() to get the result if needed
-        )
-
 
 def get_message_id(m: Message | None) -> str | None:
     if not m or not m.metadata or 'message_id' not in m.metadata:
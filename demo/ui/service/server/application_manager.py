@@ -7,7 +7,9 @@ from service.types import Conversation, Event
 
 class ApplicationManager(ABC):
     @abstractmethod
-    def create_conversation(self) -> Conversation:
+    async def create_conversation(
+        self, user_id: str | None = None
+    ) -> Conversation:
         pass
 
     @abstractmethod
@@ -32,6 +34,17 @@ class ApplicationManager(ABC):
     ) -> Conversation | None:
         pass
 
+    @abstractmethod
+    def query_events(
+        self,
+        conversation_id: str | None = None,
+        start_time: float | None = None,
+        end_time: float | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[Event]:
+        pass
+
     @property
     @abstractmethod
     def conversations(self) -> list[Conversation]:
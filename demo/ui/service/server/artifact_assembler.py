@@ -0,0 +1,193 @@
+import base64
+import binascii
+import dataclasses
+import time
+
+from a2a.types import (
+    Artifact,
+    FilePart,
+    FileWithBytes,
+    Part,
+    TaskArtifactUpdateEvent,
+    TextPart,
+)
+
+
+# Upper bound for the assembled payload of a single artifact.
+DEFAULT_MAX_ARTIFACT_BYTES = 32 * 1024 * 1024
+# Incomplete artifacts that receive no chunk for this long are dropped.
+DEFAULT_ARTIFACT_TIMEOUT_SECONDS = 300.0
+
+
+@dataclasses.dataclass
+class _PendingArtifact:
+    """An artifact whose chunks are still being received."""
+
+    artifact: Artifact
+    updated_at: float
+    parts: list[Part] = dataclasses.field(default_factory=list)
+    # Adjacent text chunks, joined once when the run of text ends.
+    text: list[str] = dataclasses.field(default_factory=list)
+    # Adjacent inline file chunks of the same file, decoded into one buffer.
+    binary: bytearray | None = None
+    binary_file: FileWithBytes | None = None
+    size: int = 0
+    discarded: bool = False
+
+
+class ArtifactAssembler:
+    """Assembles streamed artifact chunks into complete artifacts.
+
+    Chunks arrive as TaskArtifactUpdateEvents: the first one has append unset
+    and lastChunk false, the following ones have append set and the final one
+    has lastChunk set. Adjacent text chunks are coalesced into a single
+    TextPart and an inline file streamed over several chunks into a single
+    FilePart, so an artifact streamed token by token ends up with a handful
+    of parts rather than thousands. Only the first part of an appended chunk
+    continues a file; sibling files of one chunk are kept apart.
+    """
+
+    def __init__(
+        self,
+        max_artifact_bytes: int = DEFAULT_MAX_ARTIFACT_BYTES,
+        timeout_seconds: float = DEFAULT_ARTIFACT_TIMEOUT_SECONDS,
+        clock=time.monotonic,
+    ):
+        self._max_artifact_bytes = max_artifact_bytes
+        self._timeout_seconds = timeout_seconds
+        self._clock = clock
+        self._pending: dict[tuple[str, str], _PendingArtifact] = {}
+        self._last_sweep = clock()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def add(self, event: TaskArtifactUpdateEvent) -> Artifact | None:
+        """Adds a chunk, returning the artifact once it is complete."""
+        now = self._clock()
+        if now - self._last_sweep >= self._timeout_seconds:
+            self.collect_garbage()
+
+        artifact = event.artifact
+        key = (event.taskId, artifact.artifactId)
+        if not event.append:
+            if event.lastChunk is None or event.lastChunk:
+                # lastChunk bit is missing or set, this is the entire payload
+                self._pending.pop(key, None)
+                return artifact
+            # First chunk of a streamed artifact, (re)start assembling it.
+            pending = _PendingArtifact(artifact=artifact, updated_at=now)
+            self._pending[key] = pending
+        else:
+            pending = self._pending.get(key)
+            if pending is None:
+                # The first chunk was never seen, start from this one.
+                pending = _PendingArtifact(artifact=artifact, updated_at=now)
+                self._pending[key] = pending
+        pending.updated_at = now
+
+        if not pending.discarded:
+            for index, part in enumerate(artifact.parts):
+                self._add_part(
+                    pending, part, continues=bool(event.append) and index == 0
+                )
+            if pending.size > self._max_artifact_bytes:
+                print(
+                    'Artifact exceeded memory cap, discarding',
+                    artifact.artifactId,
+                    pending.size,
+                )
+                # Keep a tombstone so the remaining chunks are ignored.
+                pending.discarded = True
+                pending.parts = []
+                pending.text = []
+                pending.binary = None
+                pending.binary_file = None
+
+        if not event.lastChunk:
+            return None
+        del self._pending[key]
+        if pending.discarded:
+            return None
+        self._flush(pending)
+        return pending.artifact.model_copy(update={'parts': pending.parts})
+
+    def collect_garbage(self) -> list[str]:
+        """Drops incomplete artifacts that timed out, returning their ids."""
+        now = self._clock()
+        self._last_sweep = now
+        expired = [
+            key
+            for key, pending in self._pending.items()
+            if now - pending.updated_at >= self._timeout_seconds
+        ]
+        for key in expired:
+            del self._pending[key]
+        return [artifact_id for _, artifact_id in expired]
+
+    def _add_part(self, pending: _PendingArtifact, part: Part, continues: bool):
+        p = part.root
+        if isinstance(p, TextPart) and not p.metadata:
+            self._flush_binary(pending)
+            pending.text.append(p.text)
+            pending.size += len(p.text)
+            return
+        if (
+            isinstance(p, FilePart)
+            and isinstance(p.file, FileWithBytes)
+            and not p.metadata
+        ):
+            self._flush_text(pending)
+            if pending.binary_file is not None and (
+                not continues
+                or pending.binary_file.mimeType != p.file.mimeType
+                or pending.binary_file.name != p.file.name
+            ):
+                self._flush_binary(pending)
+            try:
+                data = base64.b64decode(p.file.bytes, validate=True)
+            except (binascii.Error, ValueError):
+                # Not decodable on its own, keep the chunk as it is.
+                self._flush_binary(pending)
+                self._append_part(pending, part, len(p.file.bytes))
+                return
+            if pending.binary is None:
+                pending.binary = bytearray()
+                pending.binary_file = p.file
+            pending.binary.extend(data)
+            pending.size += len(data)
+            return
+        self._flush(pending)
+        self._append_part(pending, part, 0)
+
+    def _append_part(self, pending: _PendingArtifact, part: Part, size: int):
+        pending.parts.append(part)
+        pending.size += size
+
+    def _flush(self, pending: _PendingArtifact):
+        self._flush_text(pending)
+        self._flush_binary(pending)
+
+    def _flush_text(self, pending: _PendingArtifact):
+        if not pending.text:
+            return
+        pending.parts.append(Part(root=TextPart(text=''.join(pending.text))))
+        pending.text = []
+
+    def _flush_binary(self, pending: _PendingArtifact):
+        if pending.binary is None:
+            return
+        pending.parts.append(
+            Part(
+                root=FilePart(
+                    file=FileWithBytes(
+                        bytes=base64.b64encode(pending.binary).decode('utf-8'),
+                        mimeType=pending.binary_file.mimeType,
+                        name=pending.binary_file.name,
+                    )
+                )
+            )
+        )
+        pending.binary = None
+        pending.binary_file = None
@@ -0,0 +1,111 @@
+import collections
+import time
+
+from pathlib import Path
+
+from service.types import Event
+
+
+DEFAULT_MAX_EVENTS = 10000
+
+
+class EventLog:
+    """A bounded, in-memory log of the events produced by a manager.
+
+    Events are kept in insertion order and evicted oldest first once the log
+    holds more than max_events, or once they were added more than
+    max_age_seconds ago. Evicted events are appended to spill_path as JSON
+    lines when it is set, so a long-running host keeps a full record on disk
+    without holding it in memory.
+    """
+
+    def __init__(
+        self,
+        max_events: int = DEFAULT_MAX_EVENTS,
+        max_age_seconds: float | None = None,
+        spill_path: str | Path | None = None,
+        clock=time.monotonic,
+    ):
+        if max_events <= 0:
+            raise ValueError('max_events must be positive')
+        self.max_events = max_events
+        self.max_age_seconds = max_age_seconds
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._clock = clock
+        # Maps event id to (time added, event)
+        self._events: collections.OrderedDict[str, tuple[float, Event]] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        self._prune()
+        return len(self._events)
+
+    def add(self, event: Event):
+        """Adds an event, replacing any event with the same id in place."""
+        if event.id in self._events:
+            added_at, _ = self._events[event.id]
+            self._events[event.id] = (added_at, event)
+        else:
+            self._events[event.id] = (self._clock(), event)
+        self._prune()
+
+    @property
+    def events(self) -> list[Event]:
+        """All retained events, ordered by timestamp."""
+        return self.query()
+
+    def query(
+        self,
+        conversation_id: str | None = None,
+        start_time: float | None = None,
+        end_time: float | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[Event]:
+        """Returns one page of retained events ordered by timestamp.
+
+        Args:
+          conversation_id: Only return events of this conversation.
+          start_time: Only return events with a timestamp at or after this.
+          end_time: Only return events with a timestamp before this.
+          offset: Number of matching events to skip.
+          limit: Maximum number of events to return, all if None.
+        """
+        self._prune()
+        matches = [
+            event
+            for _, event in self._events.values()
+            if (
+                conversation_id is None
+                or event.content.contextId == conversation_id
+            )
+            and (start_time is None or event.timestamp >= start_time)
+            and (end_time is None or event.timestamp < end_time)
+        ]
+        matches.sort(key=lambda x: x.timestamp)
+        if limit is None:
+            return matches[offset:]
+        return matches[offset : offset + limit]
+
+    def _prune(self):
+        evicted: list[Event] = []
+        while len(self._events) > self.max_events:
+            evicted.append(self._events.popitem(last=False)[1][1])
+        if self.max_age_seconds is not None:
+            cutoff = self._clock() - self.max_age_seconds
+            while self._events:
+                added_at, event = next(iter(self._events.values()))
+                if added_at > cutoff:
+                    break
+                self._events.popitem(last=False)
+                evicted.append(event)
+        if evicted and self.spill_path:
+            self._spill(evicted)
+
+    def _spill(self, events: list[Event]):
+        try:
+            with self.spill_path.open('a', encoding='utf-8') as f:
+                f.writelines(event.model_dump_json() + '\n' for event in events)
+        except OSError as e:
+            print('Failed to spill events to', self.spill_path, e)
@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import datetime
 import uuid
 
@@ -18,6 +19,7 @@ from utils.agent_card import get_agent_card
 
 from service.server import test_image
 from service.server.application_manager import ApplicationManager
+from service.server.event_log import EventLog
 from service.types import Conversation, Event
 
 
@@ -30,32 +32,39 @@ class InMemoryFakeAgentManager(ApplicationManager):
     """
 
     _conversations: list[Conversation]
-    _messages: list[Message]
+    _messages: collections.deque[Message]
     _tasks: list[Task]
-    _events: list[Event]
+    _event_log: EventLog
     _pending_message_ids: list[str]
     _next_message_idx: int
     _agents: list[AgentCard]
 
-    def __init__(self):
+    def __init__(
+        self,
+        event_log: EventLog | None = None,
+        response_delay: float | None = None,
+    ):
+        # Seconds to wait before responding, cycles through 0-4s if unset
+        self._response_delay = response_delay
         self._conversations = []
-        self._messages = []
+        self._event_log = event_log or EventLog()
+        self._messages = collections.deque(maxlen=self._event_log.max_events)
         self._tasks = []
-        self._events = []
         self._pending_message_ids = []
         self._next_message_idx = 0
         self._agents = []
         self._task_map = {}
 
-    def create_conversation(self) -> Conversation:
+    async def create_conversation(
+        self, user_id: str | None = None
+    ) -> Conversation:
         conversation_id = str(uuid.uuid4())
         c = Conversation(conversation_id=conversation_id, is_active=True)
         self._conversations.append(c)
         return c
 
     def sanitize_message(self, message: Message) -> Message:
-        if message.contextId:
-            conversation = self.get_conversation(message.contextId)
+        conversation = self.get_conversation(message.contextId)
         if not conversation:
             return message
         # Check if the last event in the conversation was tied to a task.
@@ -83,7 +92,7 @@ class InMemoryFakeAgentManager(ApplicationManager):
         conversation = self.get_conversation(context_id)
         if conversation:
             conversation.messages.append(message)
-        self._events.append(
+        self.add_event(
             Event(
                 id=str(uuid.uuid4()),
                 actor='host',
@@ -105,11 +114,15 @@ class InMemoryFakeAgentManager(ApplicationManager):
         )
         if self._next_message_idx != 0:
             self.add_task(task)
-        await asyncio.sleep(self._next_message_idx)
+        await asyncio.sleep(
+            self._next_message_idx
+            if self._response_delay is None
+            else self._response_delay
+        )
         response = self.next_message()
         if conversation:
             conversation.messages.append(response)
-        self._events.append(
+        self.add_event(
             Event(
                 id=str(uuid.uuid4()),
                 actor='host',
@@ -144,7 +157,7 @@ class InMemoryFakeAgentManager(ApplicationManager):
                 return
 
     def add_event(self, event: Event):
-        self._events.append(event)
+        self._event_log.add(event)
 
     def next_message(self) -> Message:
         message = _message_queue[self._next_message_idx]
@@ -214,7 +227,23 @@ class InMemoryFakeAgentManager(ApplicationManager):
 
     @property
     def events(self) -> list[Event]:
-        return []
+        return self._event_log.events
+
+    def query_events(
+        self,
+        conversation_id: str | None = None,
+        start_time: float | None = None,
+        end_time: float | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[Event]:
+        return self._event_log.query(
+            conversation_id=conversation_id,
+            start_time=start_time,
+            end_time=end_time,
+            offset=offset,
+            limit=limit,
+        )
 
 
 _contextId = str(uuid.uuid4())
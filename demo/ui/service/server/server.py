@@ -4,16 +4,17 @@ import os
 import threading
 import uuid
 
-from typing import cast
-
 import httpx
 
 from a2a.types import FilePart, FileWithUri, Message, Part
 from fastapi import FastAPI, Request, Response
 
 from service.types import (
+    AppStateSnapshot,
     CreateConversationResponse,
+    EventQuery,
     GetEventResponse,
+    GetStateResponse,
     ListAgentResponse,
     ListConversationResponse,
     ListMessageResponse,
@@ -26,6 +27,7 @@ from service.types import (
 
 from .adk_host_manager import ADKHostManager, get_message_id
 from .application_manager import ApplicationManager
+from .event_log import DEFAULT_MAX_EVENTS, EventLog
 from .in_memory_manager import InMemoryFakeAgentManager
 
 
@@ -46,16 +48,28 @@ class ConversationServer:
             os.environ.get('GOOGLE_GENAI_USE_VERTEXAI', '').upper() == 'TRUE'
         )
 
+        # Retention of the event log, events are kept in memory only by default
+        max_age = os.environ.get('A2A_UI_EVENT_MAX_AGE_SECONDS', '')
+        event_log = EventLog(
+            max_events=int(
+                os.environ.get('A2A_UI_EVENT_MAX_COUNT', DEFAULT_MAX_EVENTS)
+            ),
+            max_age_seconds=float(max_age) if max_age else None,
+            spill_path=os.environ.get('A2A_UI_EVENT_SPILL_PATH') or None,
+        )
+
         if agent_manager.upper() == 'ADK':
             self.manager = ADKHostManager(
                 http_client,
                 api_key=api_key,
                 uses_vertex_ai=uses_vertex_ai,
+                event_log=event_log,
             )
         else:
-            self.manager = InMemoryFakeAgentManager()
+            self.manager = InMemoryFakeAgentManager(event_log=event_log)
         self._file_cache = {}  # dict[str, FilePart] maps file id to message data
         self._message_to_cache = {}  # dict[str, str] maps message id to cache id
+        self._background_tasks: set[asyncio.Task] = set()
 
         app.add_api_route(
             '/conversation/create', self._create_conversation, methods=['POST']
@@ -72,6 +86,7 @@ class ConversationServer:
             '/message/pending', self._pending_messages, methods=['POST']
         )
         app.add_api_route('/task/list', self._list_tasks, methods=['POST'])
+        app.add_api_route('/state/get', self._get_state, methods=['POST'])
         app.add_api_route(
             '/agent/register', self._register_agent, methods=['POST']
         )
@@ -88,28 +103,27 @@ class ConversationServer:
         if isinstance(self.manager, ADKHostManager):
             self.manager.update_api_key(api_key)
 
-    async def _create_conversation(self):
-        c = await self.manager.create_conversation()
+    async def _create_conversation(self, request: Request):
+        message_data = await request.json()
+        c = await self.manager.create_conversation(message_data.get('params'))
         return CreateConversationResponse(result=c)
 
     async def _send_message(self, request: Request):
         message_data = await request.json()
         message = Message(**message_data['params'])
         message = self.manager.sanitize_message(message)
-        loop = asyncio.get_event_loop()
         if isinstance(self.manager, ADKHostManager):
-            t = threading.Thread(
-                target=lambda: cast(
-                    ADKHostManager, self.manager
-                ).process_message_threadsafe(message, loop)
-            )
+            # Messages are processed concurrently on the server's event loop
+            task = asyncio.create_task(self.manager.process_message(message))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
         else:
             t = threading.Thread(
                 target=lambda: asyncio.run(
                     self.manager.process_message(message)
                 )
             )
-        t.start()
+            t.start()
         return SendMessageResponse(
             result=MessageInfo(
                 message_id=message.messageId,
@@ -127,6 +141,22 @@ class ConversationServer:
             )
         return ListMessageResponse(result=[])
 
+    async def _get_state(self, request: Request):
+        """Returns everything the UI polls for in a single round trip."""
+        message_data = await request.json()
+        conversation_id = message_data.get('params')
+        conversation = self.manager.get_conversation(conversation_id)
+        return GetStateResponse(
+            result=AppStateSnapshot(
+                conversations=self.manager.conversations,
+                messages=self.cache_content(conversation.messages)
+                if conversation
+                else [],
+                tasks=self.manager.tasks,
+                pending_messages=self.manager.get_pending_messages(),
+            )
+        )
+
     def cache_content(self, messages: list[Message]):
         rval = []
         for m in messages:
@@ -171,8 +201,20 @@ class ConversationServer:
     def _list_conversation(self):
         return ListConversationResponse(result=self.manager.conversations)
 
-    def _get_events(self):
-        return GetEventResponse(result=self.manager.events)
+    async def _get_events(self, request: Request):
+        message_data = await request.json()
+        if not message_data.get('params'):
+            return GetEventResponse(result=self.manager.events)
+        query = EventQuery(**message_data['params'])
+        return GetEventResponse(
+            result=self.manager.query_events(
+                conversation_id=query.conversation_id,
+                start_time=query.start_time,
+                end_time=query.end_time,
+                offset=query.offset,
+                limit=query.limit,
+            )
+        )
 
     def _list_tasks(self):
         return ListTaskResponse(result=self.manager.tasks)
@@ -70,8 +70,18 @@ class SendMessageResponse(JSONRPCResponse):
     result: Message | MessageInfo | None = None
 
 
+class EventQuery(BaseModel):
+    conversation_id: str | None = None
+    start_time: float | None = None
+    end_time: float | None = None
+    offset: int = 0
+    limit: int | None = None
+
+
 class GetEventRequest(JSONRPCRequest):
     method: Literal['events/get'] = 'events/get'
+    # Returns all retained events if unset
+    params: EventQuery | None = None
 
 
 class GetEventResponse(JSONRPCResponse):
@@ -96,6 +106,8 @@ class PendingMessageResponse(JSONRPCResponse):
 
 class CreateConversationRequest(JSONRPCRequest):
     method: Literal['conversation/create'] = 'conversation/create'
+    # This is the id of the user that owns the conversation
+    params: str | None = None
 
 
 class CreateConversationResponse(JSONRPCResponse):
@@ -110,6 +122,24 @@ class ListTaskResponse(JSONRPCResponse):
     result: list[Task] | None = None
 
 
+class AppStateSnapshot(BaseModel):
+    conversations: list[Conversation] = Field(default_factory=list)
+    # Messages of the conversation requested in GetStateRequest.params
+    messages: list[Message] = Field(default_factory=list)
+    tasks: list[Task] = Field(default_factory=list)
+    pending_messages: list[tuple[str, str]] = Field(default_factory=list)
+
+
+class GetStateRequest(JSONRPCRequest):
+    method: Literal['state/get'] = 'state/get'
+    # This is the conversation id whose messages should be included
+    params: str | None = None
+
+
+class GetStateResponse(JSONRPCResponse):
+    result: AppStateSnapshot | None = None
+
+
 class RegisterAgentRequest(JSONRPCRequest):
     method: Literal['agent/register'] = 'agent/register'
     # This is the base url of the agent card
@@ -7,12 +7,15 @@ import uuid
 from typing import Any
 
 from a2a.types import FileWithBytes, Message, Part, Role, Task, TaskState
-from service.client.client import ConversationClient
+from service.client.client import get_conversation_client
 from service.types import (
+    AppStateSnapshot,
     Conversation,
     CreateConversationRequest,
     Event,
+    EventQuery,
     GetEventRequest,
+    GetStateRequest,
     ListAgentRequest,
     ListConversationRequest,
     ListMessageRequest,
@@ -37,7 +40,7 @@ server_url = 'http://localhost:12000'
 
 
 async def ListConversations() -> list[Conversation]:
-    client = ConversationClient(server_url)
+    client = get_conversation_client(server_url)
     try:
         response = await client.list_conversation(ListConversationRequest())
         return response.result if response.result else []
@@ -46,8 +49,13 @@ async def ListConversations() -> list[Conversation]:
     return []
 
 
-async def SendMessage(message: Message) -> Message | MessageInfo | None:
-    client = ConversationClient(server_url)
+async def SendMessage(
+    message: Message, user_id: str | None = None
+) -> Message | MessageInfo | None:
+    client = get_conversation_client(server_url)
+    if user_id:
+        # Routes the message when the server no longer knows the conversation
+        message.metadata = {**(message.metadata or {}), 'user_id': user_id}
     try:
         response = await client.send_message(SendMessageRequest(params=message))
         return response.result
@@ -57,10 +65,12 @@ async def SendMessage(message: Message) -> Message | MessageInfo | None:
     return None
 
 
-async def CreateConversation() -> Conversation:
-    client = ConversationClient(server_url)
+async def CreateConversation(user_id: str | None = None) -> Conversation:
+    client = get_conversation_client(server_url)
     try:
-        response = await client.create_conversation(CreateConversationRequest())
+        response = await client.create_conversation(
+            CreateConversationRequest(params=user_id)
+        )
         return (
             response.result
             if response.result
@@ -72,7 +82,7 @@ async def CreateConversation() -> Conversation:
 
 
 async def ListRemoteAgents():
-    client = ConversationClient(server_url)
+    client = get_conversation_client(server_url)
     try:
         response = await client.list_agents(ListAgentRequest())
         return response.result
@@ -81,17 +91,17 @@ async def ListRemoteAgents():
 
 
 async def AddRemoteAgent(path: str):
-    client = ConversationClient(server_url)
+    client = get_conversation_client(server_url)
     try:
         await client.register_agent(RegisterAgentRequest(params=path))
     except Exception as e:
         print('Failed to register the agent', e)
 
 
-async def GetEvents() -> list[Event]:
-    client = ConversationClient(server_url)
+async def GetEvents(query: EventQuery | None = None) -> list[Event]:
+    client = get_conversation_client(server_url)
     try:
-        response = await client.get_events(GetEventRequest())
+        response = await client.get_events(GetEventRequest(params=query))
         return response.result if response.result else []
     except Exception as e:
         print('Failed to get events', e)
@@ -99,7 +109,7 @@ async def GetEvents() -> list[Event]:
 
 
 async def GetProcessingMessages():
-    client = ConversationClient(server_url)
+    client = get_conversation_client(server_url)
     try:
         response = await client.get_pending_messages(PendingMessageRequest())
         return dict(response.result)
@@ -112,7 +122,7 @@ def GetMessageAliases():
 
 
 async def GetTasks():
-    client = ConversationClient(server_url)
+    client = get_conversation_client(server_url)
     try:
         response = await client.list_tasks(ListTaskRequest())
         return response.result
@@ -121,7 +131,7 @@ async def GetTasks():
 
 
 async def ListMessages(conversation_id: str) -> list[Message]:
-    client = ConversationClient(server_url)
+    client = get_conversation_client(server_url)
     try:
         response = await client.list_messages(
             ListMessageRequest(params=conversation_id)
@@ -132,33 +142,42 @@ async def ListMessages(conversation_id: str) -> list[Message]:
     return []
 
 
+async def GetAppState(conversation_id: str) -> AppStateSnapshot | None:
+    client = get_conversation_client(server_url)
+    try:
+        response = await client.get_state(
+            GetStateRequest(params=conversation_id or None)
+        )
+        return response.result
+    except Exception as e:
+        print('Failed to get app state ', e)
+    return None
+
+
 async def UpdateAppState(state: AppState, conversation_id: str):
     """Update the app state."""
     try:
+        snapshot = await GetAppState(conversation_id)
+        if snapshot is None:
+            return
         if conversation_id:
             state.current_conversation_id = conversation_id
-            messages = await ListMessages(conversation_id)
-            if not messages:
-                state.messages = []
-            else:
-                state.messages = [convert_message_to_state(x) for x in messages]
-        conversations = await ListConversations()
-        if not conversations:
-            state.conversations = []
-        else:
-            state.conversations = [
-                convert_conversation_to_state(x) for x in conversations
+            state.messages = [
+                convert_message_to_state(x) for x in snapshot.messages
             ]
+        state.conversations = [
+            convert_conversation_to_state(x) for x in snapshot.conversations
+        ]
 
         state.task_list = []
-        for task in await GetTasks():
+        for task in snapshot.tasks:
             state.task_list.append(
                 SessionTask(
                     context_id=extract_conversation_id(task),
                     task=convert_task_to_state(task),
                 )
             )
-        state.background_tasks = await GetProcessingMessages()
+        state.background_tasks = dict(snapshot.pending_messages)
         state.message_aliases = GetMessageAliases()
     except Exception as e:
         print('Failed to update state: ', e)
@@ -167,18 +186,16 @@ async def UpdateAppState(state: AppState, conversation_id: str):
 
 async def UpdateApiKey(api_key: str):
     """Update the API key"""
-    import httpx
-
     try:
         # Set the environment variable
         os.environ['GOOGLE_API_KEY'] = api_key
 
         # Call the update API endpoint
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f'{server_url}/api_key/update', json={'api_key': api_key}
-            )
-            response.raise_for_status()
+        client = get_conversation_client(server_url)
+        response = await client.http_client.post(
+            f'{server_url}/api_key/update', json={'api_key': api_key}
+        )
+        response.raise_for_status()
         return True
     except Exception as e:
         print('Failed to update API key: ', e)
@@ -1,4 +1,5 @@
 import dataclasses
+import uuid
 
 from typing import Any, Literal
 
@@ -76,6 +77,10 @@ class AppState:
     sidenav_open: bool = False
     theme_mode: Literal['system', 'light', 'dark'] = 'system'
 
+    # Identifies this browser session to the server, which keeps the ADK
+    # sessions of each user apart
+    user_id: str = dataclasses.field(default_factory=lambda: str(uuid.uuid4()))
+
     current_conversation_id: str = ''
     conversations: list[StateConversation]
     messages: list[StateMessage]
@@ -0,0 +1,173 @@
+import asyncio
+import unittest
+import uuid
+
+import httpx
+
+from a2a.types import Message, Part, Role, TextPart
+from fastapi import FastAPI
+from service.client.client import ConversationClient
+from service.server.adk_host_manager import DEFAULT_USER_ID, ADKHostManager
+from service.server.server import ConversationServer
+from service.types import CreateConversationRequest, SendMessageRequest
+
+
+class FakeRunner:
+    """Records overlapping runs instead of calling a model."""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.release = asyncio.Event()
+
+    async def run_async(self, user_id, session_id, new_message):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await self.release.wait()
+        self.running -= 1
+        return
+        yield
+
+
+def make_message(conversation_id):
+    return Message(
+        role=Role.user,
+        parts=[Part(root=TextPart(text='Hi'))],
+        messageId=str(uuid.uuid4()),
+        contextId=conversation_id,
+    )
+
+
+class ADKHostManagerTenantTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http_client = httpx.AsyncClient()
+        self.manager = ADKHostManager(
+            self.http_client,
+            api_key='test',
+            max_tenants=2,
+            max_sessions_per_tenant=2,
+        )
+
+    async def asyncTearDown(self):
+        await self.http_client.aclose()
+
+    async def test_users_get_separate_session_services(self):
+        a = await self.manager.create_conversation('alice')
+        b = await self.manager.create_conversation('bob')
+        alice = self.manager._tenants['alice']
+        bob = self.manager._tenants['bob']
+        self.assertIsNot(alice.session_service, bob.session_service)
+        self.assertIsNotNone(
+            await alice.session_service.get_session(
+                app_name='A2A', user_id='alice', session_id=a.conversation_id
+            )
+        )
+        self.assertIsNone(
+            await bob.session_service.get_session(
+                app_name='A2A', user_id='bob', session_id=a.conversation_id
+            )
+        )
+        self.assertIn(b.conversation_id, bob.sessions)
+
+    async def test_least_recently_used_tenant_is_evicted(self):
+        await self.manager.create_conversation('alice')
+        bob = await self.manager.create_conversation('bob')
+        await self.manager.create_conversation('alice')
+        await self.manager.create_conversation('carol')
+        self.assertEqual(list(self.manager._tenants), ['alice', 'carol'])
+        self.assertNotIn(bob.conversation_id, self.manager._conversation_users)
+
+    async def test_idle_sessions_are_evicted(self):
+        first = await self.manager.create_conversation('alice')
+        await self.manager.create_conversation('alice')
+        await self.manager.create_conversation('alice')
+        tenant = self.manager._tenants['alice']
+        self.assertEqual(len(tenant.sessions), 2)
+        self.assertIsNone(
+            await tenant.session_service.get_session(
+                app_name='A2A',
+                user_id='alice',
+                session_id=first.conversation_id,
+            )
+        )
+
+    async def test_conversations_are_processed_concurrently(self):
+        runner = FakeRunner()
+        self.manager._get_runner = lambda tenant: runner
+        a = await self.manager.create_conversation('alice')
+        b = await self.manager.create_conversation('bob')
+        tasks = [
+            asyncio.create_task(
+                self.manager.process_message(make_message(c.conversation_id))
+            )
+            for c in (a, a, b)
+        ]
+        await asyncio.sleep(0.05)
+        # The second message of a waits for the first one
+        self.assertEqual(runner.running, 2)
+        runner.release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(runner.max_running, 2)
+        self.assertEqual(self.manager.get_pending_messages(), [])
+
+    async def test_evicted_session_is_recreated(self):
+        runner = FakeRunner()
+        runner.release.set()
+        self.manager._get_runner = lambda tenant: runner
+        first = await self.manager.create_conversation('alice')
+        await self.manager.create_conversation('alice')
+        await self.manager.create_conversation('alice')
+        await self.manager.process_message(make_message(first.conversation_id))
+        tenant = self.manager._tenants['alice']
+        self.assertIn(first.conversation_id, tenant.sessions)
+        self.assertIsNotNone(
+            await tenant.session_service.get_session(
+                app_name='A2A',
+                user_id='alice',
+                session_id=first.conversation_id,
+            )
+        )
+
+
+class ConversationServerUserTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http_client = httpx.AsyncClient()
+        app = FastAPI()
+        self.server = ConversationServer(app, self.http_client)
+        self.runner = FakeRunner()
+        self.runner.release.set()
+        self.server.manager._get_runner = lambda tenant: self.runner
+        self.client = ConversationClient(
+            'http://ui',
+            httpx.AsyncClient(transport=httpx.ASGITransport(app)),
+        )
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        await self.http_client.aclose()
+
+    async def test_conversation_belongs_to_the_requesting_user(self):
+        response = await self.client.create_conversation(
+            CreateConversationRequest(params='alice')
+        )
+        conversation_id = response.result.conversation_id
+        self.assertEqual(
+            self.server.manager._conversation_users[conversation_id], 'alice'
+        )
+
+    async def test_message_metadata_routes_unknown_conversations(self):
+        response = await self.client.create_conversation(
+            CreateConversationRequest(params='alice')
+        )
+        message = make_message(response.result.conversation_id)
+        message.metadata = {'user_id': 'alice'}
+        # As after the server evicted the user's tenant
+        self.server.manager._conversation_users.clear()
+        await self.client.send_message(SendMessageRequest(params=message))
+        await asyncio.gather(*self.server._background_tasks)
+        self.assertIn('alice', self.server.manager._tenants)
+        self.assertNotIn(DEFAULT_USER_ID, self.server.manager._tenants)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import base64
+import unittest
+
+from a2a.types import (
+    Artifact,
+    DataPart,
+    FilePart,
+    FileWithBytes,
+    Part,
+    TaskArtifactUpdateEvent,
+    TextPart,
+)
+from service.server.artifact_assembler import ArtifactAssembler
+
+
+def text_chunk(text, append, last_chunk, artifact_id='a1'):
+    return TaskArtifactUpdateEvent(
+        taskId='t1',
+        contextId='c1',
+        append=append,
+        lastChunk=last_chunk,
+        artifact=Artifact(
+            artifactId=artifact_id,
+            name='response',
+            parts=[Part(root=TextPart(text=text))],
+        ),
+    )
+
+
+def file_chunk(data, append, last_chunk):
+    return TaskArtifactUpdateEvent(
+        taskId='t1',
+        contextId='c1',
+        append=append,
+        lastChunk=last_chunk,
+        artifact=Artifact(
+            artifactId='a1',
+            parts=[
+                Part(
+                    root=FilePart(
+                        file=FileWithBytes(
+                            bytes=base64.b64encode(data).decode('utf-8'),
+                            mimeType='application/octet-stream',
+                        )
+                    )
+                )
+            ],
+        ),
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ArtifactAssemblerTest(unittest.TestCase):
+    def test_complete_artifact_is_returned_unchanged(self):
+        assembler = ArtifactAssembler()
+        event = text_chunk('Hello', append=False, last_chunk=None)
+        self.assertIs(assembler.add(event), event.artifact)
+        self.assertEqual(assembler.pending_count, 0)
+
+    def test_text_chunks_are_coalesced(self):
+        assembler = ArtifactAssembler()
+        self.assertIsNone(assembler.add(text_chunk('Hel', False, False)))
+        self.assertIsNone(assembler.add(text_chunk('lo ', True, False)))
+        artifact = assembler.add(text_chunk('world', True, True))
+        self.assertEqual(len(artifact.parts), 1)
+        self.assertEqual(artifact.parts[0].root.text, 'Hello world')
+        self.assertEqual(artifact.name, 'response')
+        self.assertEqual(assembler.pending_count, 0)
+
+    def test_binary_chunks_are_coalesced(self):
+        assembler = ArtifactAssembler()
+        assembler.add(file_chunk(b'\x00\x01', False, False))
+        artifact = assembler.add(file_chunk(b'\x02', True, True))
+        self.assertEqual(len(artifact.parts), 1)
+        file = artifact.parts[0].root.file
+        self.assertEqual(base64.b64decode(file.bytes), b'\x00\x01\x02')
+        self.assertEqual(file.mimeType, 'application/octet-stream')
+
+    def test_sibling_files_are_kept_apart(self):
+        def png(data):
+            return Part(
+                root=FilePart(
+                    file=FileWithBytes(
+                        bytes=base64.b64encode(data).decode('utf-8'),
+                        mimeType='image/png',
+                    )
+                )
+            )
+
+        def images_chunk(images, append, last_chunk):
+            return TaskArtifactUpdateEvent(
+                taskId='t1',
+                contextId='c1',
+                append=append,
+                lastChunk=last_chunk,
+                artifact=Artifact(
+                    artifactId='a1', parts=[png(data) for data in images]
+                ),
+            )
+
+        assembler = ArtifactAssembler()
+        assembler.add(images_chunk([b'first', b'sec'], False, False))
+        artifact = assembler.add(images_chunk([b'ond', b'third'], True, True))
+        self.assertEqual(
+            [base64.b64decode(p.root.file.bytes) for p in artifact.parts],
+            [b'first', b'second', b'third'],
+        )
+
+    def test_non_text_parts_split_text_runs(self):
+        assembler = ArtifactAssembler()
+        assembler.add(text_chunk('a', False, False))
+        assembler.add(
+            TaskArtifactUpdateEvent(
+                taskId='t1',
+                contextId='c1',
+                append=True,
+                lastChunk=False,
+                artifact=Artifact(
+                    artifactId='a1',
+                    parts=[Part(root=DataPart(data={'k': 'v'}))],
+                ),
+            )
+        )
+        artifact = assembler.add(text_chunk('b', True, True))
+        self.assertEqual(
+            [p.root.kind for p in artifact.parts], ['text', 'data', 'text']
+        )
+
+    def test_append_without_first_chunk(self):
+        assembler = ArtifactAssembler()
+        artifact = assembler.add(text_chunk('orphan', True, True))
+        self.assertEqual(artifact.parts[0].root.text, 'orphan')
+
+    def test_memory_cap_discards_artifact(self):
+        assembler = ArtifactAssembler(max_artifact_bytes=4)
+        assembler.add(text_chunk('abc', False, False))
+        assembler.add(text_chunk('def', True, False))
+        self.assertIsNone(assembler.add(text_chunk('g', True, True)))
+        self.assertEqual(assembler.pending_count, 0)
+
+    def test_incomplete_artifacts_expire(self):
+        clock = FakeClock()
+        assembler = ArtifactAssembler(timeout_seconds=10, clock=clock)
+        assembler.add(text_chunk('abandoned', False, False))
+        clock.now = 5
+        self.assertEqual(assembler.collect_garbage(), [])
+        clock.now = 20
+        assembler.add(text_chunk('x', False, False, artifact_id='a2'))
+        self.assertEqual(assembler.pending_count, 1)
+        self.assertEqual(assembler.collect_garbage(), [])
+        clock.now = 40
+        self.assertEqual(assembler.collect_garbage(), ['a2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import os
+import unittest
+import uuid
+
+import httpx
+
+from a2a.types import Message, Part, Role, TextPart
+from fastapi import FastAPI
+from service.client import client as client_module
+from service.client.client import (
+    ConversationClient,
+    close_conversation_clients,
+    closes_conversation_clients,
+    get_conversation_client,
+    run_sync,
+)
+from service.server.server import ConversationServer
+from service.types import GetStateRequest
+
+
+class ConversationClientPoolTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await close_conversation_clients()
+
+    async def test_shared_client_is_reused(self):
+        first = get_conversation_client('http://localhost:12000/')
+        second = get_conversation_client('http://localhost:12000')
+        self.assertIs(first, second)
+        self.assertIsNotNone(first.http_client)
+
+    async def test_closed_client_is_replaced(self):
+        first = get_conversation_client('http://localhost:12000')
+        await first.aclose()
+        second = get_conversation_client('http://localhost:12000')
+        self.assertIsNot(first, second)
+        self.assertFalse(second.is_closed)
+
+
+class RunSyncTest(unittest.TestCase):
+    def test_clients_are_closed_with_the_loop(self):
+        async def use_client():
+            return get_conversation_client('http://localhost:12000')
+
+        client = run_sync(use_client())
+        self.assertTrue(client.is_closed)
+
+
+class ClosesConversationClientsTest(unittest.TestCase):
+    """Runs handlers the way Mesop does, on new loops that are never closed."""
+
+    def setUp(self):
+        self.loops = []
+
+    def tearDown(self):
+        for loop in self.loops:
+            loop.close()
+        asyncio.set_event_loop(None)
+
+    def new_loop(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loops.append(loop)
+        return loop
+
+    def test_coroutine_handlers_close_their_clients(self):
+        @closes_conversation_clients
+        async def handler(event):
+            get_conversation_client('http://localhost:12000')
+
+        for _ in range(5):
+            self.new_loop().run_until_complete(handler(None))
+        self.assertEqual(len(client_module._shared_clients), 0)
+
+    def test_generator_handlers_close_their_clients(self):
+        @closes_conversation_clients
+        async def handler(event):
+            yield
+            get_conversation_client('http://localhost:12000')
+            yield
+
+        for _ in range(5):
+            loop = self.new_loop()
+            updates = handler(None)
+            try:
+                while True:
+                    loop.run_until_complete(updates.__anext__())
+            except StopAsyncIteration:
+                pass
+        self.assertEqual(len(client_module._shared_clients), 0)
+
+
+class GetStateTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        os.environ['A2A_HOST'] = 'FAKE'
+        app = FastAPI()
+        self.server = ConversationServer(app, httpx.AsyncClient())
+        self.http_client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app)
+        )
+        self.client = ConversationClient('http://test', self.http_client)
+
+    async def asyncTearDown(self):
+        await self.http_client.aclose()
+        os.environ.pop('A2A_HOST', None)
+
+    async def test_state_contains_conversation_messages(self):
+        conversation = await self.server.manager.create_conversation()
+        message = Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text='Hi'))],
+            messageId=str(uuid.uuid4()),
+            contextId=conversation.conversation_id,
+        )
+        conversation.messages.append(message)
+
+        response = await self.client.get_state(
+            GetStateRequest(params=conversation.conversation_id)
+        )
+        snapshot = response.result
+        self.assertEqual(len(snapshot.conversations), 1)
+        self.assertEqual(len(snapshot.messages), 1)
+        self.assertEqual(snapshot.messages[0].messageId, message.messageId)
+        self.assertEqual(snapshot.tasks, [])
+        self.assertEqual(snapshot.pending_messages, [])
+
+    async def test_state_without_conversation(self):
+        response = await self.client.get_state(GetStateRequest())
+        self.assertEqual(response.result.messages, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import tempfile
+import unittest
+import uuid
+
+from pathlib import Path
+
+from a2a.types import Message, Part, Role, TextPart
+from service.server.event_log import EventLog
+from service.types import Event
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_event(timestamp, conversation_id='c1', event_id=None):
+    return Event(
+        id=event_id or str(uuid.uuid4()),
+        actor='user',
+        content=Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text=str(timestamp)))],
+            messageId=str(uuid.uuid4()),
+            contextId=conversation_id,
+        ),
+        timestamp=timestamp,
+    )
+
+
+class EventLogTest(unittest.TestCase):
+    def test_count_retention_evicts_oldest(self):
+        log = EventLog(max_events=3)
+        events = [make_event(t) for t in range(5)]
+        for event in events:
+            log.add(event)
+        self.assertEqual(len(log), 3)
+        self.assertEqual([e.id for e in log.events], [e.id for e in events[2:]])
+
+    def test_age_retention(self):
+        clock = FakeClock()
+        log = EventLog(max_age_seconds=10, clock=clock)
+        log.add(make_event(1))
+        clock.now = 6
+        log.add(make_event(2))
+        clock.now = 12
+        self.assertEqual([e.timestamp for e in log.events], [2])
+
+    def test_same_id_replaces_event(self):
+        log = EventLog()
+        log.add(make_event(1, event_id='e1'))
+        log.add(make_event(2, event_id='e1'))
+        self.assertEqual(len(log), 1)
+        self.assertEqual(log.events[0].timestamp, 2)
+
+    def test_query_filters_and_paginates(self):
+        log = EventLog()
+        for t in range(10):
+            log.add(make_event(t, conversation_id='c1' if t % 2 else 'c2'))
+        page = log.query(conversation_id='c1', start_time=2, end_time=9)
+        self.assertEqual([e.timestamp for e in page], [3, 5, 7])
+        page = log.query(conversation_id='c1', offset=1, limit=2)
+        self.assertEqual([e.timestamp for e in page], [3, 5])
+
+    def test_evicted_events_are_spilled(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'events.jsonl'
+            log = EventLog(max_events=1, spill_path=path)
+            first = make_event(1)
+            log.add(first)
+            log.add(make_event(2))
+            lines = path.read_text().splitlines()
+            self.assertEqual(len(lines), 1)
+            self.assertEqual(json.loads(lines[0])['id'], first.id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import asyncio
+import types
+import unittest
+
+import httpx
+
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    AgentExtension,
+    Message,
+    Part,
+    Role,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+from hosts.multiagent.host_agent import HostAgent
+from hosts.multiagent.remote_agent_connection import MAX_CONCURRENCY_PARAM
+
+
+def make_card(max_concurrency, description='Test agent', name='slow_agent'):
+    return AgentCard(
+        name=name,
+        description=description,
+        url='http://localhost:10999/',
+        version='1.0.0',
+        capabilities=AgentCapabilities(
+            extensions=[
+                AgentExtension(
+                    uri='urn:test:concurrency',
+                    params={MAX_CONCURRENCY_PARAM: max_concurrency},
+                )
+            ]
+        ),
+        defaultInputModes=['text'],
+        defaultOutputModes=['text'],
+        skills=[],
+    )
+
+
+class HostAgentConcurrencyTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http_client = httpx.AsyncClient()
+        self.host = HostAgent([], self.http_client)
+        self.host.register_agent_card(make_card(1))
+        self.connection = self.host.remote_agent_connections['slow_agent']
+        self.connection.queue_timeout = 0.05
+        self.release = asyncio.Event()
+        self.failures = []
+        self.host.task_callback = lambda event, card: self.failures.append(
+            event
+        )
+
+        async def send(request, task_callback, task_ids):
+            await self.release.wait()
+            return Message(
+                role=Role.agent,
+                parts=[Part(root=TextPart(text='done'))],
+                messageId='answer',
+            )
+
+        self.connection._send_message = send
+
+    async def asyncTearDown(self):
+        self.release.set()
+        await self.host.registry.stop()
+        await self.http_client.aclose()
+
+    def tool_context(self):
+        return types.SimpleNamespace(state={}, actions=types.SimpleNamespace())
+
+    async def test_busy_agent_is_reported_as_busy(self):
+        first = asyncio.create_task(
+            self.host.send_messages(
+                ['slow_agent'], ['first'], self.tool_context()
+            )
+        )
+        await asyncio.sleep(0)
+        results = await self.host.send_messages(
+            ['slow_agent'], ['second'], self.tool_context()
+        )
+        self.assertEqual(results[0]['status'], 'busy')
+        # The request never left the host, so no failed task is published
+        self.assertEqual(self.failures, [])
+        self.release.set()
+        await first
+
+    async def test_updated_card_keeps_the_connection(self):
+        first = asyncio.create_task(self.connection.send_message(None, None))
+        await asyncio.sleep(0)
+        self.host.register_agent_card(make_card(1, 'Updated'))
+        self.assertIs(
+            self.host.remote_agent_connections['slow_agent'], self.connection
+        )
+        self.assertEqual(self.connection.card.description, 'Updated')
+        self.assertEqual(self.connection.in_flight, 1)
+        self.assertFalse(self.connection.has_capacity)
+        self.release.set()
+        await first
+
+    async def test_raised_limit_lets_queued_requests_through(self):
+        self.connection.queue_timeout = 5
+        first = asyncio.create_task(self.connection.send_message(None, None))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(self.connection.send_message(None, None))
+        await asyncio.sleep(0)
+        self.assertEqual(self.connection.queued, 1)
+        self.host.register_agent_card(make_card(2))
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.connection.in_flight, 2)
+        self.release.set()
+        await asyncio.gather(first, second)
+
+
+class HostAgentFanOutTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http_client = httpx.AsyncClient()
+        self.host = HostAgent([], self.http_client)
+        self.host.fan_out_timeout = 0.05
+        self.failures = []
+        self.host.task_callback = lambda event, card: self.failures.append(
+            event
+        )
+
+    async def asyncTearDown(self):
+        await self.host.registry.stop()
+        await self.http_client.aclose()
+
+    def add_agent(self, name, send):
+        self.host.register_agent_card(make_card(1, name=name))
+        self.host.remote_agent_connections[name]._send_message = send
+
+    def tool_context(self):
+        return types.SimpleNamespace(state={}, actions=types.SimpleNamespace())
+
+    async def answer(self, request, task_callback, task_ids):
+        return Message(
+            role=Role.agent,
+            parts=[Part(root=TextPart(text='done'))],
+            messageId='answer',
+        )
+
+    async def test_failed_agent_does_not_fail_the_others(self):
+        async def fail(request, task_callback, task_ids):
+            raise RuntimeError('boom')
+
+        self.add_agent('good_agent', self.answer)
+        self.add_agent('bad_agent', fail)
+        results = await self.host.send_messages(
+            ['good_agent', 'bad_agent'], ['hello'], self.tool_context()
+        )
+        self.assertEqual(results[0]['agent'], 'good_agent')
+        self.assertEqual(results[0]['status'], TaskState.completed.value)
+        self.assertEqual(results[1]['agent'], 'bad_agent')
+        self.assertEqual(results[1]['status'], 'error')
+        self.assertEqual(results[1]['error'], 'boom')
+        # No remote task was created, so none is invented to report it
+        self.assertEqual(self.failures, [])
+
+    async def test_timeout_fails_the_remote_task(self):
+        async def hang(request, task_callback, task_ids):
+            task_ids.append('remote-task')
+            task_callback(
+                TaskStatusUpdateEvent(
+                    taskId='remote-task',
+                    contextId='context',
+                    final=False,
+                    status=TaskStatus(state=TaskState.working),
+                ),
+                None,
+            )
+            await asyncio.Event().wait()
+
+        self.add_agent('good_agent', self.answer)
+        self.add_agent('slow_agent', hang)
+        results = await self.host.send_messages(
+            ['good_agent', 'slow_agent'], ['hello'], self.tool_context()
+        )
+        self.assertEqual(results[0]['status'], TaskState.completed.value)
+        self.assertEqual(results[1]['status'], 'timeout')
+        working, failed = self.failures
+        self.assertEqual(working.status.state, TaskState.working)
+        self.assertEqual(failed.taskId, 'remote-task')
+        self.assertEqual(failed.status.state, TaskState.failed)
+        self.assertTrue(failed.final)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import asyncio
+import types
+import unittest
+
+import httpx
+
+from a2a.types import AgentCapabilities, AgentCard
+from hosts.multiagent.host_agent import HostAgent
+from hosts.multiagent.remote_agent_registry import (
+    AgentUnavailableError,
+    CircuitState,
+    RemoteAgentRegistry,
+)
+
+
+def make_card(url='http://localhost:10999/', description='Test agent'):
+    return AgentCard(
+        name='flaky_agent',
+        description=description,
+        url=url,
+        version='1.0.0',
+        capabilities=AgentCapabilities(),
+        defaultInputModes=['text'],
+        defaultOutputModes=['text'],
+        skills=[],
+    )
+
+
+class RemoteAgentRegistryTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests = []
+        self.card = make_card()
+        self.http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.serve_card)
+        )
+        self.registry = RemoteAgentRegistry(
+            self.http_client, failure_threshold=2, reset_timeout=0.05
+        )
+        self.registry.register(self.card)
+
+    async def asyncTearDown(self):
+        await self.http_client.aclose()
+
+    def serve_card(self, request):
+        self.requests.append(request)
+        return httpx.Response(
+            200, json=self.card.model_dump(mode='json', exclude_none=True)
+        )
+
+    async def fail(self):
+        with self.assertRaises(RuntimeError):
+            async with self.registry.track('flaky_agent'):
+                raise RuntimeError('boom')
+
+    async def succeed(self):
+        async with self.registry.track('flaky_agent'):
+            pass
+
+    @property
+    def state(self):
+        return self.registry.health('flaky_agent').state
+
+    async def test_consecutive_failures_open_the_circuit(self):
+        await self.fail()
+        self.assertEqual(self.state, CircuitState.closed)
+        await self.fail()
+        self.assertEqual(self.state, CircuitState.open)
+        self.assertFalse(self.registry.is_available('flaky_agent'))
+        with self.assertRaises(AgentUnavailableError):
+            await self.succeed()
+
+    async def test_success_resets_the_failure_count(self):
+        await self.fail()
+        await self.succeed()
+        await self.fail()
+        self.assertEqual(self.state, CircuitState.closed)
+        self.assertEqual(
+            self.registry.health('flaky_agent').consecutive_failures, 1
+        )
+
+    async def test_half_open_lets_one_trial_call_through(self):
+        await self.fail()
+        await self.fail()
+        await asyncio.sleep(0.06)
+        self.assertTrue(self.registry.is_available('flaky_agent'))
+        async with self.registry.track('flaky_agent'):
+            self.assertEqual(self.state, CircuitState.half_open)
+            self.assertFalse(self.registry.is_available('flaky_agent'))
+        self.assertEqual(self.state, CircuitState.closed)
+        self.assertTrue(self.registry.is_available('flaky_agent'))
+
+    async def test_failed_trial_call_opens_the_circuit_again(self):
+        await self.fail()
+        await self.fail()
+        await asyncio.sleep(0.06)
+        await self.fail()
+        self.assertEqual(self.state, CircuitState.open)
+        self.assertFalse(self.registry.is_available('flaky_agent'))
+
+    async def test_revalidation_fetches_the_registered_address(self):
+        self.registry.register(
+            make_card('http://0.0.0.0:10999/'), 'http://localhost:10999'
+        )
+        await self.fail()
+        await self.fail()
+        await self.registry.revalidate()
+        self.assertEqual(
+            str(self.requests[0].url),
+            'http://localhost:10999/.well-known/agent.json',
+        )
+        # The agent is reachable again, so a trial call is let through
+        self.assertEqual(self.state, CircuitState.half_open)
+
+    async def test_json_rpc_error_counts_as_failure(self):
+        def serve_error(request):
+            return httpx.Response(
+                200,
+                json={
+                    'jsonrpc': '2.0',
+                    'id': '1',
+                    'error': {'code': -32603, 'message': 'Internal error'},
+                },
+            )
+
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(serve_error)
+        )
+        host = HostAgent([], http_client)
+        host.register_agent_card(make_card())
+        try:
+            results = await host.send_messages(
+                ['flaky_agent'],
+                ['hello'],
+                types.SimpleNamespace(state={}, actions=None),
+            )
+        finally:
+            await host.registry.stop()
+            await http_client.aclose()
+        self.assertEqual(results[0]['status'], 'error')
+        self.assertIn('Internal error', results[0]['error'])
+        health = host.registry.health('flaky_agent')
+        self.assertEqual(health.consecutive_failures, 1)
+        self.assertEqual(list(health.outcomes), [False])
+
+
+if __name__ == '__main__':
+    unittest.main()
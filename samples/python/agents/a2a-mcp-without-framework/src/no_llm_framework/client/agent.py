@@ -1,7 +1,8 @@
 import asyncio
+import functools
 import json
 import re
-from collections.abc import Callable, Generator
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 from typing import Literal
 from uuid import uuid4
@@ -37,20 +38,29 @@ with Path(dir_path / 'agent_answer.jinja').open('r') as f:
     agent_answer_template = Template(f.read())
 
 
-def stream_llm(prompt: str) -> Generator[str]:
+@functools.cache
+def get_genai_client() -> genai.Client:
+    """Returns the Gemini client shared by all requests."""
+    return genai.Client(api_key=GOOGLE_API_KEY)
+
+
+async def stream_llm(prompt: str) -> AsyncIterator[str]:
     """Stream LLM response.
 
+    Uses the async API of the SDK, so the event loop keeps running while the
+    response is generated.
+
     Args:
         prompt (str): The prompt to send to the LLM.
 
     Returns:
-        Generator[str, None, None]: A generator of the LLM response.
+        AsyncIterator[str]: An async iterator of the LLM response.
     """
-    client = genai.Client(api_key=GOOGLE_API_KEY)
-    for chunk in client.models.generate_content_stream(
+    stream = await get_genai_client().aio.models.generate_content_stream(
         model='gemini-1.5-flash',
         contents=prompt,
-    ):
+    )
+    async for chunk in stream:
         yield chunk.text
 
 
@@ -63,10 +73,12 @@ class Agent:
         token_stream_callback: Callable[[str], None] | None = None,
         agent_urls: list[str] | None = None,
         agent_prompt: str | None = None,
+        llm: Callable[[str], AsyncIterator[str]] = stream_llm,
     ):
         self.mode = mode
         self.token_stream_callback = token_stream_callback
         self.agent_urls = agent_urls
+        self.llm = llm
         self.agents_registry: dict[str, AgentCard] = {}
 
     async def get_agents(self) -> tuple[dict[str, AgentCard], str]:
@@ -91,29 +103,31 @@ class Agent:
             agent_prompt = agents_template.render(agent_cards=agent_cards)
             return agents_registry, agent_prompt
 
-    def call_llm(self, prompt: str) -> str:
-        """Call the LLM with the given prompt and return the response as a string or generator.
+    async def call_llm(self, prompt: str) -> AsyncIterator[str]:
+        """Call the LLM with the given prompt and return an async iterator of the response.
 
         Args:
             prompt (str): The prompt to send to the LLM.
 
         Returns:
-            str or Generator[str]: The LLM response as a string or generator, depending on mode.
+            AsyncIterator[str]: The LLM response, token by token in stream mode or as a single chunk in complete mode.
         """  # noqa: E501
-        if self.mode == 'complete':
-            return stream_llm(prompt)
+        if self.mode == 'stream':
+            async for chunk in self.llm(prompt):
+                yield chunk
+            return
 
         result = ''
-        for chunk in stream_llm(prompt):
+        async for chunk in self.llm(prompt):
             result += chunk
-        return result
+        yield result
 
     async def decide(
         self,
         question: str,
         agents_prompt: str,
         called_agents: list[dict] | None = None,
-    ) -> Generator[str, None]:
+    ) -> AsyncIterator[str]:
         """Decide which agent(s) to use to answer the question.
 
         Args:
@@ -122,7 +136,7 @@ class Agent:
             called_agents (list[dict] | None): Previously called agents and their answers.
 
         Returns:
-            Generator[str, None]: The LLM's response as a generator of strings.
+            AsyncIterator[str]: The LLM's response as an async iterator of strings.
         """  # noqa: E501
         if called_agents:
             call_agent_prompt = agent_answer_template.render(
@@ -196,7 +210,7 @@ class Agent:
         for _ in range(3):
             agents_registry, agent_prompt = await self.get_agents()
             response = ''
-            for chunk in await self.decide(
+            async for chunk in await self.decide(
                 question, agent_prompt, agent_answers
             ):
                 response += chunk
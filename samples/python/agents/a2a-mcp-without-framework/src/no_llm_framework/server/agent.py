@@ -1,7 +1,8 @@
 import asyncio
+import functools
 import json
 import re
-from collections.abc import AsyncGenerator, Callable, Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
 from pathlib import Path
 from typing import Literal
 
@@ -24,20 +25,29 @@ with Path(dir_path / 'called_tools_history.jinja').open('r') as f:
     called_tools_history_template = Template(f.read())
 
 
-def stream_llm(prompt: str) -> Generator[str, None]:
+@functools.cache
+def get_genai_client() -> genai.Client:
+    """Returns the Gemini client shared by all requests."""
+    return genai.Client(api_key=GOOGLE_API_KEY)
+
+
+async def stream_llm(prompt: str) -> AsyncIterator[str]:
     """Stream LLM response.
 
+    Uses the async API of the SDK, so the event loop keeps serving other
+    requests while the response is generated.
+
     Args:
         prompt (str): The prompt to send to the LLM.
 
     Returns:
-        Generator[str, None, None]: A generator of the LLM response.
+        AsyncIterator[str]: An async iterator of the LLM response.
     """
-    client = genai.Client(api_key=GOOGLE_API_KEY)
-    for chunk in client.models.generate_content_stream(
+    stream = await get_genai_client().aio.models.generate_content_stream(
         model='gemini-1.5-flash',
         contents=prompt,
-    ):
+    )
+    async for chunk in stream:
         yield chunk.text
 
 
@@ -49,25 +59,27 @@ class Agent:
         mode: Literal['complete', 'stream'] = 'stream',
         token_stream_callback: Callable[[str], None] | None = None,
         mcp_url: str | None = None,
+        llm: Callable[[str], AsyncIterator[str]] = stream_llm,
     ):
         self.mode = mode
         self.token_stream_callback = token_stream_callback
         self.mcp_url = mcp_url
+        self.llm = llm
 
-    def call_llm(self, prompt: str) -> Generator[str, None]:
-        """Call the LLM with the given prompt and return a generator of responses.
+    def call_llm(self, prompt: str) -> AsyncIterator[str]:
+        """Call the LLM with the given prompt and return an async iterator of responses.
 
         Args:
             prompt (str): The prompt to send to the LLM.
 
         Returns:
-            Generator[str, None]: A generator yielding the LLM's response.
+            AsyncIterator[str]: An async iterator yielding the LLM's response.
         """  # noqa: E501
-        return stream_llm(prompt)
+        return self.llm(prompt)
 
     async def decide(
         self, question: str, called_tools: list[dict] | None = None
-    ) -> Generator[str, None]:
+    ) -> AsyncIterator[str]:
         """Decide which tool to use to answer the question.
 
         Args:
@@ -134,7 +146,7 @@ class Agent:
             }
 
             response = ''
-            for chunk in await self.decide(question, called_tools):
+            async for chunk in await self.decide(question, called_tools):
                 response += chunk
                 yield {
                     'is_task_complete': False,
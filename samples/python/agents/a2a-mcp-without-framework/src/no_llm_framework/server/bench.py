@@ -0,0 +1,110 @@
+"""Benchmark of how many questions one server process answers concurrently.
+
+The Gemini model is replaced by a fake LLM streaming a fixed number of
+tokens with a delay before each, and the agent runs without MCP tools, so
+only the agent loop is measured. The blocking fake iterates a synchronous
+generator from async code, as the agent did before streaming went async,
+and holds the event loop for the whole generation.
+
+run:
+  uv run python -m src.no_llm_framework.server.bench --concurrency 1,8,32
+"""
+
+import asyncio
+import time
+
+from collections.abc import AsyncIterator, Callable, Iterator
+
+import click
+
+from no_llm_framework.server.agent import Agent
+
+
+def fake_llm(tokens: int, delay: float) -> Callable[[str], AsyncIterator[str]]:
+    """Returns a fake LLM that waits without blocking the event loop."""
+
+    async def stream(prompt: str) -> AsyncIterator[str]:
+        for i in range(tokens):
+            await asyncio.sleep(delay)
+            yield f'token{i} '
+
+    return stream
+
+
+def blocking_fake_llm(
+    tokens: int, delay: float
+) -> Callable[[str], AsyncIterator[str]]:
+    """Returns a fake LLM that blocks the event loop like a sync SDK call."""
+
+    def generate(prompt: str) -> Iterator[str]:
+        for i in range(tokens):
+            time.sleep(delay)
+            yield f'token{i} '
+
+    async def stream(prompt: str) -> AsyncIterator[str]:
+        for chunk in generate(prompt):
+            yield chunk
+
+    return stream
+
+
+async def answer(agent: Agent, question: str, start: float) -> float:
+    """Answers one question, returning the seconds to the first token."""
+    first_token = None
+    async for event in agent.stream(question):
+        # Skip the step markers, which are yielded before calling the LLM
+        if first_token is None and not event['content'].startswith('Step '):
+            first_token = time.monotonic() - start
+    return first_token
+
+
+async def measure(
+    llm: Callable[[str], AsyncIterator[str]], concurrency: int
+) -> tuple[float, float]:
+    """Answers questions concurrently, returning total and worst first token."""
+    agent = Agent(mode='stream', llm=llm)
+    start = time.monotonic()
+    first_tokens = await asyncio.gather(
+        *(answer(agent, f'question {i}', start) for i in range(concurrency))
+    )
+    return time.monotonic() - start, max(first_tokens)
+
+
+@click.command()
+@click.option('--tokens', 'tokens', default=20, help='Tokens per answer.')
+@click.option(
+    '--delay', 'delay', default=0.01, help='Seconds before each token.'
+)
+@click.option(
+    '--concurrency',
+    'concurrency',
+    default='1,4,16',
+    help='Comma separated numbers of concurrent questions.',
+)
+def main(tokens: int, delay: float, concurrency: str):
+    """Compare the async LLM stream against a blocking one.
+
+    Args:
+        tokens (int): The number of tokens in each fake answer.
+        delay (float): The seconds the fake LLM takes per token.
+        concurrency (str): The numbers of concurrent questions to try.
+    """
+    llms = {
+        'async': fake_llm(tokens, delay),
+        'blocking': blocking_fake_llm(tokens, delay),
+    }
+    print(
+        f'{"llm":<10}{"questions":>10}{"total s":>10}'
+        f'{"q/s":>10}{"worst ttft s":>14}'
+    )
+    for n in (int(c) for c in concurrency.split(',')):
+        for name, llm in llms.items():
+            elapsed, first_token = asyncio.run(measure(llm, n))
+            print(
+                f'{name:<10}{n:>10}{elapsed:>10.2f}'
+                f'{n / elapsed:>10.1f}{first_token:>14.3f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
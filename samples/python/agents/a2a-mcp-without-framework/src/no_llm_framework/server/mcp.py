@@ -1,16 +1,155 @@
 import asyncio
 from pathlib import Path
 
+import anyio
 from jinja2 import Template
 from mcp.client.session import ClientSession
 from mcp.client.sse import sse_client
-from mcp.types import CallToolResult, TextContent
+from mcp.types import (
+    CallToolResult,
+    ServerNotification,
+    TextContent,
+    Tool,
+    ToolListChangedNotification,
+)
 
 dir_path = Path(__file__).parent
 
 with Path(dir_path / 'tool.jinja').open('r') as f:
     template = Template(f.read())
 
+# Errors meaning the connection to the MCP server is gone
+_CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    ConnectionError,
+)
+
+
+class MCPConnection:
+    """A persistent session to an MCP server, shared by concurrent requests.
+
+    The session is opened on first use and kept open by a background task,
+    since the SSE client must be entered and exited by the same task. The
+    tool list and its rendered prompt are cached until the server sends
+    tools/list_changed. If the connection drops, the next call reconnects.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self._session: ClientSession | None = None
+        self._runner: asyncio.Task | None = None
+        self._closed = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._tools: list[Tool] | None = None
+        self._tool_prompt: str | None = None
+
+    async def session(self) -> ClientSession:
+        """Returns the open session, connecting if needed."""
+        if self._connected():
+            return self._session
+        async with self._lock:
+            if self._connected():
+                return self._session
+            return await self._open()
+
+    def _connected(self) -> bool:
+        return bool(self._session and self._runner and not self._runner.done())
+
+    async def _open(self) -> ClientSession:
+        """Starts a runner task owning a new session, under the lock."""
+        ready = asyncio.get_running_loop().create_future()
+        self._closed = asyncio.Event()
+        self._runner = asyncio.create_task(self._run(ready, self._closed))
+        self._session = await ready
+        return self._session
+
+    async def _stop(self) -> None:
+        """Closes the session and waits for its runner, under the lock."""
+        self._closed.set()
+        if self._runner:
+            await asyncio.gather(self._runner, return_exceptions=True)
+            self._runner = None
+
+    async def _reconnect(self, failed: ClientSession) -> ClientSession:
+        """Replaces the failed session, unless another caller already did."""
+        async with self._lock:
+            if self._session is not failed and self._connected():
+                return self._session
+            await self._stop()
+            return await self._open()
+
+    async def _run(self, ready: asyncio.Future, closed: asyncio.Event):
+        try:
+            async with (
+                sse_client(self.url) as (read, write),
+                ClientSession(
+                    read, write, message_handler=self._on_message
+                ) as session,
+            ):
+                await session.initialize()
+                ready.set_result(session)
+                await closed.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+        finally:
+            # A newer runner may own the connection by now
+            if self._runner is asyncio.current_task():
+                self._session = None
+                self._invalidate()
+
+    async def _on_message(self, message):
+        if isinstance(message, ServerNotification) and isinstance(
+            message.root, ToolListChangedNotification
+        ):
+            self._invalidate()
+
+    def _invalidate(self):
+        self._tools = None
+        self._tool_prompt = None
+
+    async def list_tools(self) -> list[Tool]:
+        tools = self._tools
+        if tools is None:
+            session = await self.session()
+            tools = (await session.list_tools()).tools
+            self._tools = tools
+        return tools
+
+    async def tool_prompt(self) -> str:
+        """Returns the tools rendered for the prompt, cached with them."""
+        if self._tool_prompt is None:
+            tools = await self.list_tools()
+            self._tool_prompt = template.render(tools=tools)
+        return self._tool_prompt
+
+    async def call_tool(
+        self, tool_name: str, arguments: dict | None = None
+    ) -> CallToolResult:
+        session = await self.session()
+        try:
+            return await session.call_tool(tool_name, arguments=arguments)
+        except _CONNECTION_ERRORS:
+            # The server went away, retry once on a fresh connection. Calls
+            # that failed together share the one reopened by the first.
+            session = await self._reconnect(session)
+            return await session.call_tool(tool_name, arguments=arguments)
+
+    async def close(self):
+        async with self._lock:
+            await self._stop()
+
+
+_connections: dict[str, MCPConnection] = {}
+
+
+def get_mcp_connection(url: str) -> MCPConnection:
+    """Returns the shared connection to the MCP server at the given URL."""
+    if url not in _connections:
+        _connections[url] = MCPConnection(url)
+    return _connections[url]
+
 
 async def get_mcp_tool_prompt(url: str) -> str:
     """Get the MCP tool prompt for a given URL.
@@ -21,14 +160,7 @@ async def get_mcp_tool_prompt(url: str) -> str:
     Returns:
         str: The MCP tool prompt.
     """
-    async with (
-        sse_client(url) as (read, write),
-        ClientSession(read, write) as session,
-    ):
-        await session.initialize()
-
-        resources = await session.list_tools()
-        return template.render(tools=resources.tools)
+    return await get_mcp_connection(url).tool_prompt()
 
 
 async def call_mcp_tool(
@@ -44,22 +176,19 @@ async def call_mcp_tool(
     Returns:
         CallToolResult: The result of the tool call.
     """  # noqa: E501
-    async with (
-        sse_client(
-            url=url,
-        ) as (read, write),
-        ClientSession(read, write) as session,
-    ):
-        await session.initialize()
-
-        return await session.call_tool(tool_name, arguments=arguments)
+    return await get_mcp_connection(url).call_tool(tool_name, arguments)
 
 
 if __name__ == '__main__':
-    print(asyncio.run(get_mcp_tool_prompt('https://gitmcp.io/google/A2A')))
-    result = asyncio.run(
-        call_mcp_tool('https://gitmcp.io/google/A2A', 'fetch_A2A_documentation')
-    )
-    for content in result.content:
-        if isinstance(content, TextContent):
-            print(content.text)
+
+    async def main():
+        """Main function."""
+        url = 'https://gitmcp.io/google/A2A'
+        print(await get_mcp_tool_prompt(url))
+        result = await call_mcp_tool(url, 'fetch_A2A_documentation')
+        for content in result.content:
+            if isinstance(content, TextContent):
+                print(content.text)
+        await get_mcp_connection(url).close()
+
+    asyncio.run(main())
@@ -1,6 +1,8 @@
 import logging
 import os
 
+from contextlib import asynccontextmanager
+
 import click
 
 from a2a.server.apps import A2AStarletteApplication
@@ -26,8 +28,9 @@ def main(host, port):
     if not os.getenv('OPENAI_API_KEY'):
         print('OPENAI_API_KEY environment variable not set.')
 
+    agent_executor = AG2AgentExecutor()
     request_handler = DefaultRequestHandler(
-        agent_executor=AG2AgentExecutor(),
+        agent_executor=agent_executor,
         task_store=InMemoryTaskStore(),
     )
     server = A2AStarletteApplication(
@@ -35,7 +38,13 @@ def main(host, port):
     )
     import uvicorn
 
-    uvicorn.run(server.build(), host=host, port=port)
+    @asynccontextmanager
+    async def lifespan(app):
+        await agent_executor.agent.warm_up()
+        yield
+        await agent_executor.agent.aclose()
+
+    uvicorn.run(server.build(lifespan=lifespan), host=host, port=port)
 
 
 def get_agent_card(host: str, port: int):
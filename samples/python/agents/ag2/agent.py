@@ -7,10 +7,9 @@ from collections.abc import AsyncIterable
 from typing import Any, Literal
 
 from autogen import AssistantAgent, LLMConfig
-from autogen.mcp import create_toolkit
 from dotenv import load_dotenv
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+from mcp import StdioServerParameters
+from mcp_pool import MCPSessionPool  # type: ignore[import-untyped]
 from pydantic import BaseModel
 
 
@@ -75,6 +74,16 @@ class YoutubeMCPAgent:
                 ),
             )
 
+            # Warm mcp-youtube sessions reused across queries
+            self.mcp_pool = MCPSessionPool(
+                StdioServerParameters(command='mcp-youtube'),
+                size=int(os.getenv('MCP_POOL_SIZE', '4')),
+                max_uses=int(os.getenv('MCP_MAX_USES', '100')),
+                health_check_interval=float(
+                    os.getenv('MCP_HEALTH_CHECK_INTERVAL', '30')
+                ),
+            )
+
             self.initialized = True
             logger.info('MCP Agent initialized successfully')
         except ImportError as e:
@@ -128,21 +137,10 @@ class YoutubeMCPAgent:
             logger.info(f'Processing query: {query[:50]}...')
 
             try:
-                # Create stdio server parameters for mcp-youtube
-                server_params = StdioServerParameters(
-                    command='mcp-youtube',
-                )
-
-                # Connect to the MCP server using stdio client
-                async with (
-                    stdio_client(server_params) as (read, write),
-                    ClientSession(read, write) as session,
-                ):
-                    # Initialize the connection
-                    await session.initialize()
-
-                    # Create toolkit and register tools
-                    toolkit = await create_toolkit(session=session)
+                # Borrow a warm session to the mcp-youtube server
+                async with self.mcp_pool.acquire() as pooled:
+                    # Register the tools of the session's cached toolkit
+                    toolkit = pooled.toolkit
                     toolkit.register_for_llm(self.agent)
 
                     result = await self.agent.a_run(
@@ -189,6 +187,16 @@ class YoutubeMCPAgent:
                 'content': f'Error processing request: {e!s}',
             }
 
+    async def warm_up(self):
+        """Starts the sessions of the pool before the first queries."""
+        if self.initialized:
+            await self.mcp_pool.warm_up()
+
+    async def aclose(self):
+        """Stops the mcp-youtube processes of the session pool."""
+        if self.initialized:
+            await self.mcp_pool.close()
+
     def invoke(self, query: str, sessionId: str) -> dict[str, Any]:
         """Synchronous invocation of the MCP agent."""
         raise NotImplementedError(
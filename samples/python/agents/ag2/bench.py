@@ -0,0 +1,124 @@
+"""Benchmark of cold vs. warm MCP sessions for the YouTube agent.
+
+Each query calls the captions tool of dummy_mcp_server.py, without the LLM.
+Cold queries start a server process, initialize a session and build the
+toolkit every time, as the agent used to. Warm queries borrow a session
+from an MCPSessionPool, which starts at most --size processes.
+
+run:
+  uv run python bench.py --queries 20 --startup-delay 0.5
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from pathlib import Path
+
+import click
+
+from autogen.mcp import create_toolkit
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp_pool import MCPSessionPool  # type: ignore[import-untyped]
+
+
+TOOL = 'download_closed_captions'
+VIDEO_URL = 'https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+
+
+async def cold_query(server_params: StdioServerParameters) -> float:
+    """Queries a server process started for this query alone."""
+    start = time.monotonic()
+    async with (
+        stdio_client(server_params) as (read, write),
+        ClientSession(read, write) as session,
+    ):
+        await session.initialize()
+        toolkit = await create_toolkit(session=session)
+        await toolkit.get_tool(TOOL).func(video_url=VIDEO_URL)
+    return time.monotonic() - start
+
+
+async def warm_query(pool: MCPSessionPool) -> float:
+    """Queries a session borrowed from the pool."""
+    start = time.monotonic()
+    async with pool.acquire() as pooled:
+        await pooled.toolkit.get_tool(TOOL).func(video_url=VIDEO_URL)
+    return time.monotonic() - start
+
+
+async def measure(
+    server_params: StdioServerParameters,
+    queries: int,
+    concurrency: int,
+    size: int,
+) -> dict[str, tuple[list[float], float, int]]:
+    """Runs the queries cold and warm, concurrency at a time.
+
+    Returns:
+        For each mode, the query latencies, the total seconds and the
+        number of server processes started.
+    """
+    results = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(query):
+        async with semaphore:
+            return await query()
+
+    start = time.monotonic()
+    latencies = await asyncio.gather(
+        *(limited(lambda: cold_query(server_params)) for _ in range(queries))
+    )
+    results['cold'] = (latencies, time.monotonic() - start, queries)
+
+    pool = MCPSessionPool(server_params, size=size)
+    try:
+        start = time.monotonic()
+        latencies = await asyncio.gather(
+            *(limited(lambda: warm_query(pool)) for _ in range(queries))
+        )
+        results['warm'] = (latencies, time.monotonic() - start, pool.started)
+    finally:
+        await pool.close()
+    return results
+
+
+@click.command()
+@click.option('--queries', 'queries', default=20, help='Number of queries.')
+@click.option(
+    '--concurrency', 'concurrency', default=1, help='Queries run at once.'
+)
+@click.option('--size', 'size', default=4, help='Size of the warm pool.')
+@click.option(
+    '--startup-delay',
+    'startup_delay',
+    default=0.0,
+    help='Seconds the dummy server waits before serving.',
+)
+def main(queries, concurrency, size, startup_delay):
+    """Measures the latency of cold and warm MCP queries."""
+    server_params = StdioServerParameters(
+        command=sys.executable,
+        args=[
+            str(Path(__file__).with_name('dummy_mcp_server.py')),
+            '--startup-delay',
+            str(startup_delay),
+        ],
+    )
+    results = asyncio.run(measure(server_params, queries, concurrency, size))
+    print(
+        f'{"mode":>6}{"median ms":>12}{"max ms":>10}{"total s":>10}'
+        f'{"processes":>11}'
+    )
+    for mode, (latencies, total, processes) in results.items():
+        print(
+            f'{mode:>6}{statistics.median(latencies) * 1000:>12.1f}'
+            f'{max(latencies) * 1000:>10.1f}{total:>10.2f}{processes:>11}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Stand-in for mcp-youtube, serving canned captions over stdio.
+
+It waits --startup-delay seconds before serving, like a server loading its
+dependencies, and --call-delay seconds per tool call.
+
+run:
+  uv run python dummy_mcp_server.py --startup-delay 0.5
+"""
+
+import time
+
+import click
+
+from mcp.server.fastmcp import FastMCP
+
+
+@click.command()
+@click.option(
+    '--startup-delay',
+    'startup_delay',
+    default=0.0,
+    help='Seconds to wait before serving.',
+)
+@click.option(
+    '--call-delay',
+    'call_delay',
+    default=0.0,
+    help='Seconds to wait per tool call.',
+)
+def main(startup_delay, call_delay):
+    """Serves a download_closed_captions tool over stdio."""
+    time.sleep(startup_delay)
+    mcp = FastMCP('dummy-youtube', log_level='WARNING')
+
+    @mcp.tool()
+    def download_closed_captions(video_url: str) -> str:
+        """Download the closed captions of a YouTube video."""
+        time.sleep(call_delay)
+        return f'Captions of {video_url}: never gonna give you up.'
+
+    mcp.run(transport='stdio')
+
+
+if __name__ == '__main__':
+    main()
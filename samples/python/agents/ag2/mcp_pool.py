@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import time
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from autogen.mcp import create_toolkit
+from autogen.tools import Toolkit
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class PooledSession:
+    """An initialized MCP session to a server process, and its toolkit."""
+
+    session: ClientSession | None = None
+    toolkit: Toolkit | None = None
+    uses: int = 0
+    checked_at: float = 0.0
+    task: asyncio.Task | None = None
+    ready: asyncio.Future = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+    closing: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def alive(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+
+class MCPSessionPool:
+    """Pool of warm sessions to an MCP server run over stdio.
+
+    Starting the server process and the MCP handshake cost more than most
+    tool calls, so sessions are kept open between queries together with the
+    toolkit built from their tools. At most size sessions are used at once,
+    which also bounds the number of server processes; more callers wait in
+    acquire(). A session is replaced once it served max_uses queries, so a
+    server leaking memory is restarted now and then. A session idle for
+    health_check_interval seconds, or whose last user failed, is pinged
+    before it is handed out again and replaced if it does not answer within
+    health_check_timeout seconds.
+
+    stdio_client runs the process under an anyio task group, which must be
+    left by the task that entered it. Each session therefore lives in a
+    task of its own, which opens it, waits until it is closed and cleans up.
+    """
+
+    def __init__(
+        self,
+        server_params: StdioServerParameters,
+        size: int = 4,
+        max_uses: int = 100,
+        health_check_interval: float = 30.0,
+        health_check_timeout: float = 5.0,
+        start_timeout: float = 30.0,
+    ):
+        self.server_params = server_params
+        self.size = size
+        self.max_uses = max_uses
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.start_timeout = start_timeout
+        self.started = 0
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle: list[PooledSession] = []
+        self._sessions: set[PooledSession] = set()
+        self._closing: set[asyncio.Task] = set()
+        self._closed = False
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[PooledSession]:
+        """Lends a healthy session, waiting while size sessions are in use."""
+        if self._closed:
+            raise RuntimeError('MCPSessionPool is closed')
+        async with self._semaphore:
+            pooled = await self._checkout()
+            failed = True
+            try:
+                yield pooled
+                failed = False
+            finally:
+                pooled.uses += 1
+                self._release(pooled, failed)
+
+    async def warm_up(self, count: int | None = None):
+        """Starts up to count idle sessions, the pool size by default."""
+        count = min(count or self.size, self.size - len(self._sessions))
+        sessions = await asyncio.gather(
+            *(self._open() for _ in range(count)), return_exceptions=True
+        )
+        for pooled in sessions:
+            if isinstance(pooled, BaseException):
+                logger.warning(f'Failed to warm up an MCP session: {pooled}')
+            else:
+                self._idle.append(pooled)
+
+    async def close(self):
+        """Closes all sessions and stops their server processes."""
+        self._closed = True
+        self._idle.clear()
+        for pooled in list(self._sessions):
+            self._discard(pooled)
+        await asyncio.gather(*self._closing, return_exceptions=True)
+
+    async def _checkout(self) -> PooledSession:
+        # The most recently used session first, as it is the least likely
+        # to need a health check
+        while self._idle:
+            pooled = self._idle.pop()
+            if await self._healthy(pooled):
+                return pooled
+            self._discard(pooled)
+        return await self._open()
+
+    def _release(self, pooled: PooledSession, failed: bool):
+        if self._closed or not pooled.alive or pooled.uses >= self.max_uses:
+            self._discard(pooled)
+            return
+        # A failed query may have been caused by the session, so it is
+        # checked before its next use
+        pooled.checked_at = 0.0 if failed else time.monotonic()
+        self._idle.append(pooled)
+
+    async def _healthy(self, pooled: PooledSession) -> bool:
+        if not pooled.alive:
+            return False
+        if time.monotonic() - pooled.checked_at < self.health_check_interval:
+            return True
+        try:
+            await asyncio.wait_for(
+                pooled.session.send_ping(), self.health_check_timeout
+            )
+        except Exception as e:
+            logger.warning(f'MCP session failed its health check: {e!r}')
+            return False
+        pooled.checked_at = time.monotonic()
+        return True
+
+    async def _open(self) -> PooledSession:
+        pooled = PooledSession()
+        pooled.task = asyncio.create_task(self._run(pooled))
+        self._sessions.add(pooled)
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(pooled.ready), self.start_timeout
+            )
+        except BaseException:
+            self._discard(pooled)
+            raise
+        pooled.checked_at = time.monotonic()
+        self.started += 1
+        return pooled
+
+    async def _run(self, pooled: PooledSession):
+        try:
+            async with (
+                stdio_client(self.server_params) as (read, write),
+                ClientSession(read, write) as session,
+            ):
+                await session.initialize()
+                pooled.session = session
+                pooled.toolkit = await create_toolkit(session=session)
+                pooled.ready.set_result(None)
+                await pooled.closing.wait()
+        except Exception as e:
+            if not pooled.ready.done():
+                pooled.ready.set_exception(e)
+            else:
+                logger.warning(f'MCP session ended unexpectedly: {e!r}')
+        finally:
+            if not pooled.ready.done():
+                pooled.ready.cancel()
+
+    def _discard(self, pooled: PooledSession):
+        if pooled not in self._sessions:
+            return
+        self._sessions.remove(pooled)
+        pooled.closing.set()
+        # In the background, so the caller does not wait for the process to
+        # exit
+        task = asyncio.create_task(self._stop(pooled))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _stop(self, pooled: PooledSession):
+        try:
+            await asyncio.wait_for(pooled.task, self.start_timeout)
+        except (TimeoutError, asyncio.CancelledError):
+            pooled.task.cancel()
@@ -1,6 +1,8 @@
 import logging
 import os
 
+from contextlib import asynccontextmanager
+
 import click
 import uvicorn
 
@@ -111,8 +113,14 @@ def main(host: str, port: int):
 
     routes.append(Route(path='/health', methods=['GET'], endpoint=health_check))
 
+    # Delete the Foundry agent and close its client on shutdown
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        yield
+        await agent_executor.cleanup()
+
     # Create Starlette app
-    app = Starlette(routes=routes)
+    app = Starlette(routes=routes, lifespan=lifespan)
 
     # Log startup information
     logger.info(f'Starting AI Foundry Calendar Agent on {host}:{port}')
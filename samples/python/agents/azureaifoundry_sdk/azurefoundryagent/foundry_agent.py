@@ -7,50 +7,60 @@ import datetime
 import json
 import logging
 import os
-import time
 
 from typing import Any
 
-from azure.ai.agents import AgentsClient
+from azure.ai.agents.aio import AgentsClient
 from azure.ai.agents.models import (
     Agent,
     AgentThread,
     ListSortOrder,
+    RunStatus,
     ThreadMessage,
     ThreadRun,
     ToolOutput,
 )
-from azure.identity import DefaultAzureCredential
+from azure.identity.aio import DefaultAzureCredential
+from run_waiter import RunWaiter
 
 
 logger = logging.getLogger(__name__)
 
 
+class ToolCallError(Exception):
+    """Raised when the tool calls required by a run could not be handled."""
+
+
 class FoundryCalendarAgent:
     """AI Foundry Agent with calendar management capabilities.
     This class adapts the ADK calendar agent pattern for Azure AI Foundry.
     """
 
-    def __init__(self):
-        self.endpoint = os.environ['AZURE_AI_FOUNDRY_PROJECT_ENDPOINT']
-        self.credential = DefaultAzureCredential()
+    def __init__(self, client: AgentsClient | None = None):
+        self.credential: DefaultAzureCredential | None = None
+        if client is None:
+            self.credential = DefaultAzureCredential()
+            client = AgentsClient(
+                endpoint=os.environ['AZURE_AI_FOUNDRY_PROJECT_ENDPOINT'],
+                credential=self.credential,
+            )
+        # One async client shared by all conversations (a fake one in tests)
+        self.client = client
+        self.run_waiter = RunWaiter(client)
         self.agent: Agent | None = None
         self.threads: dict[str, str] = {}  # thread_id -> thread_id mapping
-
-    def _get_client(self) -> AgentsClient:
-        """Get a new AgentsClient instance for use in context managers."""
-        return AgentsClient(
-            endpoint=self.endpoint,
-            credential=self.credential,
-        )
+        # thread_id -> id of the latest message already seen
+        self.last_message_ids: dict[str, str] = {}
+        self._agent_lock = asyncio.Lock()
 
     async def create_agent(self) -> Agent:
         """Create the AI Foundry agent with calendar instructions."""
-        if self.agent:
-            return self.agent
+        # Concurrent first requests create a single agent
+        async with self._agent_lock:
+            if self.agent:
+                return self.agent
 
-        with self._get_client() as client:
-            self.agent = client.create_agent(
+            self.agent = await self.client.create_agent(
                 model=os.environ['AZURE_AI_AGENT_MODEL_DEPLOYMENT_NAME'],
                 name='foundry-calendar-agent',
                 instructions=self._get_calendar_instructions(),
@@ -140,22 +150,21 @@ When users ask about availability, scheduling, or calendar management, use your
             # Return thread info - we'll need to get it fresh each time
             pass
 
-        with self._get_client() as client:
-            thread = client.threads.create()
-            self.threads[thread.id] = thread.id
-            logger.info(f'Created thread: {thread.id}')
-            return thread
+        thread = await self.client.threads.create()
+        self.threads[thread.id] = thread.id
+        logger.info(f'Created thread: {thread.id}')
+        return thread
 
     async def send_message(
         self, thread_id: str, content: str, role: str = 'user'
     ) -> ThreadMessage:
         """Send a message to the conversation thread."""
-        with self._get_client() as client:
-            message = client.messages.create(
-                thread_id=thread_id, role=role, content=content
-            )
-            logger.info(f'Created message in thread {thread_id}: {message.id}')
-            return message
+        message = await self.client.messages.create(
+            thread_id=thread_id, role=role, content=content
+        )
+        self.last_message_ids[thread_id] = message.id
+        logger.info(f'Created message in thread {thread_id}: {message.id}')
+        return message
 
     async def run_conversation(
         self, thread_id: str, user_message: str
@@ -168,64 +177,61 @@ When users ask about availability, scheduling, or calendar management, use your
         await self.send_message(thread_id, user_message)
 
         # Create and run the agent
-        with self._get_client() as client:
-            run = client.runs.create(
-                thread_id=thread_id, agent_id=self.agent.id
-            )
-
-            # Poll until completion
-            max_iterations = 30  # Prevent infinite loops
-            iterations = 0
-
-            while (
-                run.status in ['queued', 'in_progress', 'requires_action']
-                and iterations < max_iterations
-            ):
-                iterations += 1
-                time.sleep(1)
-                run = client.runs.get(thread_id=thread_id, run_id=run.id)
-                logger.debug(
-                    f'Run status: {run.status} (iteration {iterations})'
-                )
-
-                if run.status == 'failed':
-                    logger.error(f'Run failed during polling: {run.last_error}')
-                    break
-
-                # Handle tool calls if needed
-                if run.status == 'requires_action':
-                    try:
-                        await self._handle_tool_calls(run, thread_id)
-                        # Get updated run status after tool submission
-                        run = client.runs.get(
-                            thread_id=thread_id, run_id=run.id
-                        )
-                    except Exception as e:
-                        logger.error(f'Error handling tool calls: {e}')
-                        # If tool handling fails, mark the run as failed
-                        return [f'Error handling tool calls: {e!s}']
-
-            if run.status == 'failed':
-                logger.error(f'Run failed: {run.last_error}')
-                return [f'Error: {run.last_error}']
-
-            if iterations >= max_iterations:
-                logger.error(f'Run timed out after {max_iterations} iterations')
-                return ['Error: Request timed out']
-
-            # Get response messages
-            messages = client.messages.list(
-                thread_id=thread_id, order=ListSortOrder.DESCENDING
-            )
+        run = await self.client.runs.create(
+            thread_id=thread_id, agent_id=self.agent.id
+        )
 
-            responses = []
-            for msg in messages:
-                if msg.role == 'assistant' and msg.text_messages:
-                    for text_msg in msg.text_messages:
-                        responses.append(text_msg.text.value)
-                    break  # Only get the latest assistant response
+        async def handle_tool_calls(run: ThreadRun) -> None:
+            try:
+                await self._handle_tool_calls(run, thread_id)
+            except Exception as e:
+                raise ToolCallError(str(e)) from e
 
-            return responses if responses else ['No response received']
+        # Poll until completion, without blocking other conversations
+        try:
+            run = await self.run_waiter.wait(run, handle_tool_calls)
+        except TimeoutError:
+            logger.error(f'Run timed out after {self.run_waiter.timeout}s')
+            return ['Error: Request timed out']
+        except ToolCallError as e:
+            logger.error(f'Error handling tool calls: {e}')
+            return [f'Error handling tool calls: {e!s}']
+        except Exception as e:
+            # e.g. the run status could not be fetched
+            logger.error(f'Error waiting for run {run.id}: {e}')
+            return [f'Error: {e!s}']
+
+        if run.status == RunStatus.FAILED:
+            logger.error(f'Run failed: {run.last_error}')
+            return [f'Error: {run.last_error}']
+
+        if run.status != RunStatus.COMPLETED:
+            logger.error(f'Run ended with status: {run.status}')
+            return [f'Error: Run {run.status}']
+
+        responses = await self.get_new_responses(thread_id)
+        return responses if responses else ['No response received']
+
+    async def get_new_responses(self, thread_id: str) -> list[str]:
+        """Get the assistant texts added to the thread since the last call."""
+        last_seen = self.last_message_ids.get(thread_id)
+        new_messages: list[ThreadMessage] = []
+        # Newest first, so only the pages holding new messages are fetched
+        async for msg in self.client.messages.list(
+            thread_id=thread_id, order=ListSortOrder.DESCENDING
+        ):
+            if msg.id == last_seen:
+                break
+            new_messages.append(msg)
+        if new_messages:
+            self.last_message_ids[thread_id] = new_messages[0].id
+
+        responses = []
+        for msg in reversed(new_messages):
+            if msg.role == 'assistant' and msg.text_messages:
+                for text_msg in msg.text_messages:
+                    responses.append(text_msg.text.value)
+        return responses
 
     async def _handle_tool_calls(self, run: ThreadRun, thread_id: str):
         """Handle tool calls during agent execution."""
@@ -311,53 +317,55 @@ When users ask about availability, scheduling, or calendar management, use your
             raise
 
         # Submit the tool outputs
-        with self._get_client() as client:
-            try:
-                # Create tool outputs in the expected format
-                formatted_outputs = []
-                for output in tool_outputs:
-                    formatted_outputs.append(
-                        ToolOutput(
-                            tool_call_id=output['tool_call_id'],
-                            output=output['output'],
-                        )
+        try:
+            # Create tool outputs in the expected format
+            formatted_outputs = []
+            for output in tool_outputs:
+                formatted_outputs.append(
+                    ToolOutput(
+                        tool_call_id=output['tool_call_id'],
+                        output=output['output'],
                     )
-
-                logger.debug(
-                    f'Submitting formatted tool outputs: {formatted_outputs}'
                 )
 
-                client.runs.submit_tool_outputs(
+            logger.debug(
+                f'Submitting formatted tool outputs: {formatted_outputs}'
+            )
+
+            await self.client.runs.submit_tool_outputs(
+                thread_id=thread_id,
+                run_id=run.id,
+                tool_outputs=formatted_outputs,
+            )
+            logger.info(f'Submitted {len(formatted_outputs)} tool outputs')
+        except Exception as e:
+            logger.error(f'Failed to submit tool outputs: {e}')
+            logger.error(f'Raw tool outputs structure: {tool_outputs}')
+            # Try submitting without ToolOutput wrapper as fallback
+            try:
+                logger.info('Trying fallback submission with raw dict format')
+                await self.client.runs.submit_tool_outputs(
                     thread_id=thread_id,
                     run_id=run.id,
-                    tool_outputs=formatted_outputs,
+                    tool_outputs=tool_outputs,
                 )
-                logger.info(f'Submitted {len(formatted_outputs)} tool outputs')
-            except Exception as e:
-                logger.error(f'Failed to submit tool outputs: {e}')
-                logger.error(f'Raw tool outputs structure: {tool_outputs}')
-                # Try submitting without ToolOutput wrapper as fallback
-                try:
-                    logger.info(
-                        'Trying fallback submission with raw dict format'
-                    )
-                    client.runs.submit_tool_outputs(
-                        thread_id=thread_id,
-                        run_id=run.id,
-                        tool_outputs=tool_outputs,
-                    )
-                    logger.info('Fallback submission successful')
-                except Exception as e2:
-                    logger.error(f'Fallback submission also failed: {e2}')
-                    raise e
+                logger.info('Fallback submission successful')
+            except Exception as e2:
+                logger.error(f'Fallback submission also failed: {e2}')
+                raise e
 
     async def cleanup_agent(self):
         """Clean up the agent resources."""
         if self.agent:
-            with self._get_client() as client:
-                client.delete_agent(self.agent.id)
-                logger.info(f'Deleted agent: {self.agent.id}')
-                self.agent = None
+            await self.client.delete_agent(self.agent.id)
+            logger.info(f'Deleted agent: {self.agent.id}')
+            self.agent = None
+
+    async def aclose(self):
+        """Close the client, and the credential if it was created here."""
+        await self.client.close()
+        if self.credential:
+            await self.credential.close()
 
 
 async def create_foundry_calendar_agent() -> FoundryCalendarAgent:
@@ -391,6 +399,7 @@ async def demo_agent_interaction():
 
     finally:
         await agent.cleanup_agent()
+        await agent.aclose()
 
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 Adapted from ADK agent executor pattern to work with Azure AI Foundry agents.
 """
 
+import asyncio
 import logging
 
 from a2a.server.agent_execution import AgentExecutor
@@ -33,17 +34,20 @@ class FoundryAgentExecutor(AgentExecutor):
     def __init__(self, card: AgentCard):
         self._card = card
         self._foundry_agent: FoundryCalendarAgent | None = None
+        # Concurrent first requests share a single agent
+        self._agent_lock = asyncio.Lock()
         self._active_threads: dict[
             str, str
         ] = {}  # context_id -> thread_id mapping
 
     async def _get_or_create_agent(self) -> FoundryCalendarAgent:
         """Get or create the Foundry calendar agent."""
-        if not self._foundry_agent:
-            from foundry_agent import create_foundry_calendar_agent
+        async with self._agent_lock:
+            if not self._foundry_agent:
+                from foundry_agent import create_foundry_calendar_agent
 
-            self._foundry_agent = await create_foundry_calendar_agent()
-        return self._foundry_agent
+                self._foundry_agent = await create_foundry_calendar_agent()
+            return self._foundry_agent
 
     async def _get_or_create_thread(self, context_id: str) -> str:
         """Get or create a thread for the given context."""
@@ -176,8 +180,11 @@ class FoundryAgentExecutor(AgentExecutor):
     async def cleanup(self):
         """Clean up resources."""
         if self._foundry_agent:
-            await self._foundry_agent.cleanup_agent()
-            self._foundry_agent = None
+            try:
+                await self._foundry_agent.cleanup_agent()
+            finally:
+                await self._foundry_agent.aclose()
+                self._foundry_agent = None
         self._active_threads.clear()
         logger.info('Foundry agent executor cleaned up')
 
@@ -0,0 +1,102 @@
+"""Waits for Azure AI Foundry agent runs without blocking the event loop.
+Used by the FoundryCalendarAgent, or by anything holding an async AgentsClient.
+"""
+
+import asyncio
+import logging
+import random
+
+from collections.abc import Awaitable, Callable
+
+from azure.ai.agents.aio import AgentsClient
+from azure.ai.agents.models import RunStatus, ThreadRun
+
+
+logger = logging.getLogger(__name__)
+
+# Statuses of a run that will change without any action from the client
+PENDING_STATUSES = {
+    RunStatus.QUEUED,
+    RunStatus.IN_PROGRESS,
+    RunStatus.CANCELLING,
+}
+
+
+class RunWaiter:
+    """Polls agent runs until they end, with an exponential backoff.
+
+    A run is polled after initial_delay seconds, then after delays growing
+    by factor up to max_delay, so short runs are noticed quickly and long
+    ones do not flood the service. The delay starts over after tool outputs
+    are submitted, as the run usually resumes right away. Each waiting run
+    only holds a coroutine, so one waiter serves many runs concurrently,
+    with at most max_concurrent_polls status requests in flight. A run still
+    pending after timeout seconds, or whose wait is cancelled or fails, is
+    cancelled on the service too.
+    """
+
+    def __init__(
+        self,
+        client: AgentsClient,
+        initial_delay: float = 0.25,
+        max_delay: float = 4.0,
+        factor: float = 2.0,
+        timeout: float = 120.0,
+        max_concurrent_polls: int = 16,
+    ):
+        self.client = client
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.timeout = timeout
+        self._polls = asyncio.Semaphore(max_concurrent_polls)
+
+    async def wait(
+        self,
+        run: ThreadRun,
+        on_requires_action: Callable[[ThreadRun], Awaitable[None]],
+    ) -> ThreadRun:
+        """Waits for the run to end, calling on_requires_action as needed.
+
+        Returns:
+            The run in its final status.
+
+        Raises:
+            TimeoutError: If the run did not end within the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        delay = self.initial_delay
+        try:
+            while True:
+                if run.status == RunStatus.REQUIRES_ACTION:
+                    await on_requires_action(run)
+                    delay = self.initial_delay
+                elif run.status not in PENDING_STATUSES:
+                    return run
+                if loop.time() + delay > deadline:
+                    raise TimeoutError(
+                        f'Run {run.id} did not end in {self.timeout}s'
+                    )
+                # Jitter keeps runs started together from polling together
+                await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+                delay = min(delay * self.factor, self.max_delay)
+                async with self._polls:
+                    run = await self.client.runs.get(
+                        thread_id=run.thread_id, run_id=run.id
+                    )
+                logger.debug(f'Run {run.id} status: {run.status}')
+        except BaseException:
+            # Timed out, cancelled or failed: the run is not needed anymore
+            await asyncio.shield(self._cancel(run))
+            raise
+
+    async def _cancel(self, run: ThreadRun):
+        try:
+            await self.client.runs.cancel(
+                thread_id=run.thread_id, run_id=run.id
+            )
+            logger.info(f'Cancelled run {run.id}')
+        except Exception as e:
+            # e.g. the run ended in the meantime
+            logger.warning(f'Could not cancel run {run.id}: {e}')
@@ -0,0 +1,269 @@
+"""Tests of RunWaiter and FoundryCalendarAgent against a fake AgentsClient.
+
+run:
+  uv run python -m unittest test_run_waiter
+"""
+
+import asyncio
+import itertools
+import os
+import types
+import unittest
+
+from unittest import mock
+
+from azure.ai.agents.models import RunStatus
+from foundry_agent import FoundryCalendarAgent
+from run_waiter import RunWaiter
+
+
+_sleep = asyncio.sleep
+_ids = itertools.count()
+
+
+def make_run():
+    return types.SimpleNamespace(
+        id=f'run-{next(_ids)}',
+        thread_id='thread',
+        status=RunStatus.QUEUED,
+        required_action=None,
+        last_error=None,
+    )
+
+
+def tool_call_action():
+    return types.SimpleNamespace(
+        submit_tool_outputs=types.SimpleNamespace(
+            tool_calls=[
+                types.SimpleNamespace(
+                    id='call',
+                    function=types.SimpleNamespace(
+                        name='check_availability', arguments='{}'
+                    ),
+                )
+            ]
+        )
+    )
+
+
+class FakeRuns:
+    """Answers status polls with the scripted statuses, then the last one."""
+
+    def __init__(self, client, statuses):
+        self.client = client
+        self.statuses = list(statuses)
+        self.polls = 0
+        self.cancelled = []
+        self.submitted = []
+        self.error: Exception | None = None
+
+    async def create(self, thread_id, agent_id):
+        return make_run()
+
+    async def get(self, thread_id, run_id):
+        self.polls += 1
+        if self.error:
+            raise self.error
+        status = self.statuses[0]
+        if len(self.statuses) > 1:
+            self.statuses.pop(0)
+        if status == RunStatus.COMPLETED:
+            self.client.add_message(thread_id, 'assistant', f'answer {run_id}')
+        required_action = (
+            tool_call_action() if status == RunStatus.REQUIRES_ACTION else None
+        )
+        return types.SimpleNamespace(
+            id=run_id,
+            thread_id=thread_id,
+            status=status,
+            required_action=required_action,
+            last_error=None,
+        )
+
+    async def submit_tool_outputs(self, thread_id, run_id, tool_outputs):
+        self.submitted.append(tool_outputs)
+
+    async def cancel(self, thread_id, run_id):
+        self.cancelled.append(run_id)
+
+
+class FakeMessages:
+    def __init__(self, client):
+        self.client = client
+        self.listed = 0
+
+    async def create(self, thread_id, role, content):
+        return self.client.add_message(thread_id, role, content)
+
+    async def list(self, thread_id, order):
+        # Newest first, like ListSortOrder.DESCENDING
+        for message in reversed(self.client.threads_messages[thread_id]):
+            self.listed += 1
+            yield message
+
+
+class FakeAgentsClient:
+    def __init__(self, statuses=(RunStatus.COMPLETED,)):
+        self.threads_messages: dict[str, list] = {'thread': []}
+        self.runs = FakeRuns(self, statuses)
+        self.messages = FakeMessages(self)
+        self.agents_created = 0
+
+    def add_message(self, thread_id, role, content):
+        message = types.SimpleNamespace(
+            id=f'message-{next(_ids)}',
+            role=role,
+            text_messages=[
+                types.SimpleNamespace(text=types.SimpleNamespace(value=content))
+            ],
+        )
+        self.threads_messages[thread_id].append(message)
+        return message
+
+    async def create_agent(self, **kwargs):
+        self.agents_created += 1
+        return types.SimpleNamespace(id='agent')
+
+
+class RunWaiterTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.delays = []
+
+        async def sleep(delay):
+            self.delays.append(delay)
+            await _sleep(0)
+
+        # No jitter, and no real waiting between polls
+        for patcher in (
+            mock.patch('run_waiter.random.uniform', return_value=1.0),
+            mock.patch('run_waiter.asyncio.sleep', sleep),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def no_action(self, run):
+        self.fail('No action was required')
+
+    async def test_delay_grows_up_to_max_delay(self):
+        client = FakeAgentsClient(
+            [RunStatus.IN_PROGRESS] * 5 + [RunStatus.COMPLETED]
+        )
+        waiter = RunWaiter(client, initial_delay=0.25, max_delay=1.5)
+        run = await waiter.wait(make_run(), self.no_action)
+        self.assertEqual(run.status, RunStatus.COMPLETED)
+        self.assertEqual(self.delays, [0.25, 0.5, 1.0, 1.5, 1.5, 1.5])
+        self.assertEqual(client.runs.cancelled, [])
+
+    async def test_delay_starts_over_after_required_action(self):
+        client = FakeAgentsClient(
+            [
+                RunStatus.IN_PROGRESS,
+                RunStatus.IN_PROGRESS,
+                RunStatus.REQUIRES_ACTION,
+                RunStatus.IN_PROGRESS,
+                RunStatus.COMPLETED,
+            ]
+        )
+        actions = []
+
+        async def on_requires_action(run):
+            actions.append(run.status)
+
+        waiter = RunWaiter(client, initial_delay=0.25)
+        run = await waiter.wait(make_run(), on_requires_action)
+        self.assertEqual(run.status, RunStatus.COMPLETED)
+        self.assertEqual(actions, [RunStatus.REQUIRES_ACTION])
+        self.assertEqual(self.delays, [0.25, 0.5, 1.0, 0.25, 0.5])
+
+    async def test_failed_poll_cancels_the_run(self):
+        client = FakeAgentsClient([RunStatus.IN_PROGRESS])
+        client.runs.error = RuntimeError('service unavailable')
+        run = make_run()
+        with self.assertRaises(RuntimeError):
+            await RunWaiter(client).wait(run, self.no_action)
+        self.assertEqual(client.runs.cancelled, [run.id])
+
+
+class RunWaiterTimeoutTest(unittest.IsolatedAsyncioTestCase):
+    async def no_action(self, run):
+        pass
+
+    async def test_timeout_cancels_the_run(self):
+        client = FakeAgentsClient([RunStatus.IN_PROGRESS])
+        waiter = RunWaiter(
+            client, initial_delay=0.01, max_delay=0.02, timeout=0.1
+        )
+        run = make_run()
+        with self.assertRaises(TimeoutError):
+            await waiter.wait(run, self.no_action)
+        self.assertEqual(client.runs.cancelled, [run.id])
+        self.assertGreater(client.runs.polls, 1)
+
+    async def test_cancelled_wait_cancels_the_run(self):
+        client = FakeAgentsClient([RunStatus.IN_PROGRESS])
+        waiter = RunWaiter(client, initial_delay=0.01, max_delay=0.01)
+        run = make_run()
+        task = asyncio.create_task(waiter.wait(run, self.no_action))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(client.runs.cancelled, [run.id])
+
+
+class FoundryCalendarAgentTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(
+            os.environ, {'AZURE_AI_AGENT_MODEL_DEPLOYMENT_NAME': 'model'}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_agent(self, statuses):
+        client = FakeAgentsClient(statuses)
+        agent = FoundryCalendarAgent(client=client)
+        agent.run_waiter = RunWaiter(client, initial_delay=0.001)
+        return client, agent
+
+    async def test_tool_calls_are_answered(self):
+        client, agent = self.make_agent(
+            [RunStatus.REQUIRES_ACTION, RunStatus.COMPLETED]
+        )
+        responses = await agent.run_conversation('thread', 'Am I free?')
+        self.assertEqual(len(responses), 1)
+        self.assertTrue(responses[0].startswith('answer'))
+        self.assertEqual(len(client.runs.submitted), 1)
+        self.assertEqual(client.agents_created, 1)
+
+    async def test_only_new_messages_are_read(self):
+        client, agent = self.make_agent([RunStatus.COMPLETED])
+        for i in range(10):
+            client.add_message('thread', 'assistant', f'old {i}')
+        await agent.run_conversation('thread', 'first')
+        client.messages.listed = 0
+        responses = await agent.run_conversation('thread', 'second')
+        self.assertEqual(len(responses), 1)
+        # The answer, and the user message the read stops at
+        self.assertEqual(client.messages.listed, 2)
+
+    async def test_failed_tool_calls_are_reported(self):
+        client, agent = self.make_agent(
+            [RunStatus.REQUIRES_ACTION, RunStatus.COMPLETED]
+        )
+
+        async def fail(thread_id, run_id, tool_outputs):
+            raise RuntimeError('rejected')
+
+        client.runs.submit_tool_outputs = fail
+        responses = await agent.run_conversation('thread', 'Am I free?')
+        self.assertEqual(responses, ['Error handling tool calls: rejected'])
+
+    async def test_failed_poll_is_not_reported_as_tool_call_error(self):
+        client, agent = self.make_agent([RunStatus.IN_PROGRESS])
+        client.runs.error = RuntimeError('service unavailable')
+        responses = await agent.run_conversation('thread', 'Am I free?')
+        self.assertEqual(responses, ['Error: service unavailable'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -53,7 +53,9 @@ class CurrencyAgent:
         self.credential = DefaultAzureCredential()
         self.agent: Agent | None = None
         self.threads: dict[str, str] = {}  # thread_id -> thread_id mapping
+        # Comma separated URLs of one or more MCP servers
         self.mcp_server_url = os.environ.get('MCP_ENDPOINT')
+        self.mcp_sessions = int(os.environ.get('MCP_SESSIONS_PER_SERVER', '4'))
         self.mcp_tool_manager: MCPToolManager | None = (
             None  # Placeholder for MCPToolManager or similar
         )
@@ -72,7 +74,9 @@ class CurrencyAgent:
 
         logger = logging.getLogger(__name__)
 
-        self.mcp_tool_manager = MCPToolManager(self.mcp_server_url)
+        self.mcp_tool_manager = MCPToolManager(
+            self.mcp_server_url, sessions_per_server=self.mcp_sessions
+        )
 
         # Initialize the MCP tool manager (without async context manager)
         await self.mcp_tool_manager.initialize()
@@ -344,7 +348,9 @@ class CurrencyAgent:
             # Ensure MCP Tool Manager is initialized and connected
             if not self.mcp_tool_manager:
                 logger.warning('MCP Tool Manager not initialized, creating now')
-                self.mcp_tool_manager = MCPToolManager(self.mcp_server_url)
+                self.mcp_tool_manager = MCPToolManager(
+                    self.mcp_server_url, sessions_per_server=self.mcp_sessions
+                )
                 await self.mcp_tool_manager.initialize()
             elif (
                 not self.mcp_tool_manager._connection
@@ -0,0 +1,148 @@
+"""Benchmark of the MCP connection manager against local FastMCP servers.
+
+It starts --servers copies of local_mcp_server.py, then runs --calls
+concurrent get_exchange_rate calls through:
+
+- a single ServerConnection to the first server, as the agent used to, and
+- an MCPConnectionManager over all servers with --sessions sessions each,
+  which routes every call to the least loaded session.
+
+run:
+  uv run python bench.py --servers 2 --sessions 4 --calls 400 --delay 0.2
+"""
+
+import asyncio
+import logging
+import socket
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+
+import click
+
+from utils.connection_manager import MCPConnectionManager
+from utils.server_connection import MCPConfig, ServerConnection
+
+
+ARGUMENTS = {'currency_from': 'USD', 'currency_to': 'EUR'}
+
+
+def start_servers(
+    count: int, first_port: int, delay: float
+) -> list[subprocess.Popen]:
+    """Starts the local MCP servers and waits until they listen."""
+    script = Path(__file__).with_name('local_mcp_server.py')
+    servers = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                str(script),
+                '--port',
+                str(first_port + i),
+                '--delay',
+                str(delay),
+            ]
+        )
+        for i in range(count)
+    ]
+    for i in range(count):
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                socket.create_connection(('localhost', first_port + i)).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+    return servers
+
+
+async def run_calls(connection, calls: int) -> float:
+    """Runs the calls concurrently, returning the total seconds."""
+    start = time.monotonic()
+    results = await asyncio.gather(
+        *(
+            connection.execute_tool('get_exchange_rate', ARGUMENTS)
+            for _ in range(calls)
+        )
+    )
+    elapsed = time.monotonic() - start
+    if not all(
+        result.get('text', '').startswith('1 USD') for result in results
+    ):
+        raise RuntimeError(f'Unexpected results: {results[:3]}')
+    return elapsed
+
+
+async def measure(
+    urls: list[str], sessions: int, calls: int
+) -> dict[str, tuple[float, list[int]]]:
+    """Runs the calls with each setup.
+
+    Returns:
+        For each setup, the total seconds and the calls per session.
+    """
+    results = {}
+    single = ServerConnection(MCPConfig(server_url=urls[0]))
+    await single.connect()
+    try:
+        await run_calls(single, 1)  # Warms up the tools cache
+        single.stats.total_requests = 0
+        results['single session'] = (
+            await run_calls(single, calls),
+            [single.stats.total_requests],
+        )
+    finally:
+        await single.disconnect()
+
+    manager = MCPConnectionManager(
+        [MCPConfig(server_url=url) for url in urls], sessions
+    )
+    await manager.connect()
+    try:
+        elapsed = await run_calls(manager, calls)
+        per_session = [
+            stats.total_requests
+            for server_stats in manager.get_server_stats().values()
+            for stats in server_stats
+        ]
+        results[f'{len(urls)} servers x {sessions} sessions'] = (
+            elapsed,
+            per_session,
+        )
+    finally:
+        await manager.disconnect()
+    return results
+
+
+@click.command()
+@click.option('--servers', 'servers', default=2, help='Local MCP servers.')
+@click.option('--sessions', 'sessions', default=4, help='Sessions per server.')
+@click.option('--calls', 'calls', default=400, help='Concurrent tool calls.')
+@click.option(
+    '--delay', 'delay', default=0.2, help='Seconds per exchange-rate call.'
+)
+@click.option('--port', 'port', default=8765, help='Port of the first server.')
+def main(servers, sessions, calls, delay, port):
+    """Measures concurrent tool calls through the connection manager."""
+    logging.getLogger().setLevel(logging.WARNING)
+    processes = start_servers(servers, port, delay)
+    try:
+        urls = [f'http://localhost:{port + i}/sse' for i in range(servers)]
+        results = asyncio.run(measure(urls, sessions, calls))
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+    print(f'{"setup":>24}{"total s":>10}{"calls/s":>10}  calls per session')
+    for name, (elapsed, per_session) in results.items():
+        print(
+            f'{name:>24}{elapsed:>10.2f}{calls / elapsed:>10.0f}  {per_session}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""A local FastMCP stand-in for the Azure Functions MCP server.
+
+It serves the same hello_mcp and get_exchange_rate tools over SSE, with fixed
+rates and an optional delay per exchange-rate call, for benchmarks and for
+running the agent offline.
+
+run:
+  uv run python local_mcp_server.py --port 8765 --delay 0.1
+  MCP_ENDPOINT=http://localhost:8765/sse uv run .
+"""
+
+import asyncio
+
+import click
+
+from mcp.server.fastmcp import FastMCP
+
+
+# Units of each currency per euro
+RATES = {'EUR': 1.0, 'USD': 1.08, 'GBP': 0.85, 'JPY': 162.5, 'INR': 90.2}
+
+
+@click.command()
+@click.option('--host', 'host', default='localhost')
+@click.option('--port', 'port', default=8765)
+@click.option(
+    '--delay',
+    'delay',
+    default=0.0,
+    help='Seconds to wait per exchange-rate call.',
+)
+def main(host, port, delay):
+    """Serves the currency MCP tools over SSE."""
+    mcp = FastMCP('local-currency', host=host, port=port, log_level='WARNING')
+
+    @mcp.tool()
+    def hello_mcp() -> str:
+        """Hello world."""
+        return 'Hello I am MCPTool!'
+
+    @mcp.tool()
+    async def get_exchange_rate(currency_from: str, currency_to: str) -> str:
+        """A simple currency function that returns exchange rates."""
+        await asyncio.sleep(delay)
+        if currency_from not in RATES or currency_to not in RATES:
+            return (
+                f'Could not retrieve rate for {currency_from} to {currency_to}'
+            )
+        rate = round(RATES[currency_to] / RATES[currency_from], 5)
+        return f'1 {currency_from} = {rate} {currency_to}'
+
+    mcp.run(transport='sse')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Tests of MCPConnectionManager against local_mcp_server.py.
+
+run:
+  uv run python -m unittest test_connection_manager
+"""
+
+import asyncio
+import socket
+import unittest
+
+from bench import start_servers
+from utils.connection_manager import MCPConnectionManager
+from utils.server_connection import MCPConfig
+
+
+ARGUMENTS = {'currency_from': 'USD', 'currency_to': 'EUR'}
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+class MCPConnectionManagerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.port = free_port()
+        self.server = (
+            await asyncio.to_thread(start_servers, 1, self.port, 0.0)
+        )[0]
+        self.manager = MCPConnectionManager(
+            [
+                MCPConfig(
+                    server_url=f'http://localhost:{self.port}/sse',
+                    health_check_interval=0.2,
+                    retry_delay=0.1,
+                    max_retries=0,
+                )
+            ],
+            sessions_per_server=2,
+        )
+        await self.manager.connect()
+
+    async def asyncTearDown(self):
+        await asyncio.wait_for(self.manager.disconnect(), 10)
+        self.stop_server()
+
+    def stop_server(self):
+        self.server.terminate()
+        self.server.wait()
+
+    async def wait_until(self, condition, timeout=10.0):
+        async with asyncio.timeout(timeout):
+            while not condition():
+                await asyncio.sleep(0.05)
+
+    async def test_dropped_sessions_are_closed_by_disconnect(self):
+        self.stop_server()
+        await self.wait_until(lambda: not self.manager.is_connected)
+        await asyncio.wait_for(self.manager.disconnect(), 10)
+        self.assertEqual(self.manager._owners, [])
+
+    async def test_dropped_sessions_are_reopened(self):
+        self.stop_server()
+        await self.wait_until(lambda: not self.manager.is_connected)
+        self.server = (
+            await asyncio.to_thread(start_servers, 1, self.port, 0.0)
+        )[0]
+        connections = self.manager._connections[self.manager.server_urls[0]]
+        await self.wait_until(
+            lambda: all(connection.is_connected for connection in connections)
+        )
+        result = await self.manager.execute_tool('get_exchange_rate', ARGUMENTS)
+        self.assertTrue(result['text'].startswith('1 USD'))
+
+
+if __name__ == '__main__':
+    unittest.main()
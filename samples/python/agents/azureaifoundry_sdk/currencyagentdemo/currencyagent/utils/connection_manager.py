@@ -0,0 +1,350 @@
+import asyncio
+import logging
+
+from dataclasses import fields, replace
+from typing import Any
+
+from .server_connection import (
+    ConnectionStats,
+    MCPConfig,
+    MCPConnectionError,
+    MCPToolNotFoundError,
+    ServerConnection,
+    ToolInfo,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def connection_load(connection: ServerConnection) -> tuple[int, float, int]:
+    """Sort key ranking the least loaded connection first.
+
+    Connections with the fewest requests in flight come first, then the
+    ones failing least often, then the least used ones, so idle sessions
+    take turns.
+    """
+    stats = connection.stats
+    return (
+        stats.in_flight_requests,
+        stats.failure_rate,
+        stats.total_requests,
+    )
+
+
+class MCPConnectionManager:
+    """Manages connections to several MCP servers, with several sessions each.
+
+    Tools are routed by name: the index built by refresh_tools() maps each
+    tool to the servers offering it, and a server offering the same tools
+    as another one acts as a replica. Each tool call goes to the least
+    loaded connected session among them, ranked by connection_load(). With
+    sessions_per_server sessions per server, the calls of one server are
+    spread over several sessions instead of queueing on a single one.
+
+    Each session is opened and closed by a task of its own, as the MCP
+    client transports must be left by the task that entered them. For the
+    same reason the sessions do not reconnect by themselves: when a health
+    check fails, the owning task closes the session and opens it again.
+    """
+
+    def __init__(
+        self, configs: list[MCPConfig], sessions_per_server: int = 4
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            configs: One MCPConfig per server
+            sessions_per_server: Number of sessions to open to each server
+        """
+        if not configs:
+            raise ValueError('At least one server config is required')
+        if sessions_per_server < 1:
+            raise ValueError('sessions_per_server must be positive')
+        self.configs = configs
+        self.sessions_per_server = sessions_per_server
+        self._connections: dict[str, list[ServerConnection]] = {}
+        self._routes: dict[str, list[str]] = {}  # tool name -> server URLs
+        self._tools: dict[str, ToolInfo] = {}
+        self._owners: list[asyncio.Task] = []
+        self._shutdown_event = asyncio.Event()
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if at least one session is connected."""
+        return any(
+            connection.is_connected
+            for connections in self._connections.values()
+            for connection in connections
+        )
+
+    @property
+    def server_urls(self) -> list[str]:
+        """Get the URLs of the managed servers."""
+        return [config.server_url for config in self.configs]
+
+    async def connect(self) -> bool:
+        """Open all sessions concurrently and index the tools of the servers.
+
+        Servers that cannot be reached are logged and left out.
+
+        Returns:
+            True once connected to at least one server
+
+        Raises:
+            MCPConnectionError: If no server could be reached
+        """
+        if self.is_connected:
+            return True
+        self._shutdown_event.clear()
+        opened = []
+        for config in self.configs:
+            # Reconnecting from the health check task would leave the
+            # transport from another task than the one that entered it
+            session_config = replace(config, enable_auto_reconnect=False)
+            for _ in range(self.sessions_per_server):
+                connection = ServerConnection(session_config)
+                ready = asyncio.get_running_loop().create_future()
+                self._owners.append(
+                    asyncio.create_task(self._own(connection, ready))
+                )
+                opened.append((connection, ready))
+        results = await asyncio.gather(
+            *(ready for _, ready in opened), return_exceptions=True
+        )
+
+        self._connections = {}
+        for (connection, _), result in zip(opened, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f'Could not open a session to {connection.server_url}: '
+                    f'{result}'
+                )
+                continue
+            self._connections.setdefault(connection.server_url, []).append(
+                connection
+            )
+        if not self._connections:
+            raise MCPConnectionError('Could not connect to any MCP server')
+
+        await self.refresh_tools()
+        return True
+
+    async def _own(
+        self, connection: ServerConnection, ready: asyncio.Future
+    ) -> None:
+        """Keep a session open until the manager disconnects.
+
+        A session found broken by its health check is closed and opened
+        again, waiting longer after each failed attempt.
+        """
+        delay = connection.config.retry_delay
+        while True:
+            try:
+                await connection.connect()
+            except Exception as e:
+                if not ready.done():
+                    ready.set_exception(e)
+                    return
+                logger.warning(
+                    f'Could not reopen a session to {connection.server_url}:'
+                    f' {e}'
+                )
+                if await self._wait_for_shutdown(delay):
+                    return
+                delay = min(delay * 2, connection.config.max_retry_delay)
+                continue
+            if not ready.done():
+                ready.set_result(None)
+            delay = connection.config.retry_delay
+            try:
+                await self._wait_for_shutdown_or(connection.connection_lost)
+            finally:
+                await connection.disconnect()
+            if self._shutdown_event.is_set():
+                return
+            logger.warning(f'Reopening the session to {connection.server_url}')
+
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
+        """Wait up to timeout seconds, returning True on shutdown."""
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def _wait_for_shutdown_or(self, event: asyncio.Event) -> None:
+        """Wait until the manager disconnects or the event is set."""
+        waiters = [
+            asyncio.create_task(self._shutdown_event.wait()),
+            asyncio.create_task(event.wait()),
+        ]
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def refresh_tools(self) -> dict[str, list[str]]:
+        """Rebuild the index routing each tool to the servers offering it.
+
+        Returns:
+            The server URLs of each tool
+        """
+        routes: dict[str, list[str]] = {}
+        tools: dict[str, ToolInfo] = {}
+        for server_url, connections in self._connections.items():
+            connection = next((c for c in connections if c.is_connected), None)
+            if connection is None:
+                continue
+            for tool in await connection.list_tools(force_refresh=True):
+                routes.setdefault(tool.name, []).append(server_url)
+                tools.setdefault(tool.name, tool)
+        self._routes = routes
+        self._tools = tools
+        logger.info(
+            f'Indexed {len(tools)} tools from {len(self._connections)} servers'
+        )
+        return {name: list(urls) for name, urls in routes.items()}
+
+    async def list_tools(self, force_refresh: bool = False) -> list[ToolInfo]:
+        """List the tools of all servers, each name once.
+
+        Args:
+            force_refresh: Whether to rebuild the tool index
+
+        Returns:
+            List of ToolInfo objects
+        """
+        if force_refresh or not self._tools:
+            await self.refresh_tools()
+        return list(self._tools.values())
+
+    def select_connection(self, tool_name: str) -> ServerConnection:
+        """Pick the least loaded connected session offering the tool.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            The selected ServerConnection
+
+        Raises:
+            MCPToolNotFoundError: If no server offers the tool
+            MCPConnectionError: If no session offering the tool is connected
+        """
+        server_urls = self._routes.get(tool_name)
+        if not server_urls:
+            raise MCPToolNotFoundError(
+                f"Tool '{tool_name}' not found on any MCP server"
+            )
+        candidates = [
+            connection
+            for server_url in server_urls
+            for connection in self._connections[server_url]
+            if connection.is_connected
+        ]
+        if not candidates:
+            raise MCPConnectionError(
+                f"No connected MCP server offers the tool '{tool_name}'"
+            )
+        return min(candidates, key=connection_load)
+
+    async def execute_tool(
+        self, tool_name: str, arguments: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Execute a tool on the least loaded session offering it.
+
+        Args:
+            tool_name: Name of the tool to execute
+            arguments: Arguments to pass to the tool
+            **kwargs: retries, retry_delay or timeout overrides, see
+                ServerConnection.execute_tool
+
+        Returns:
+            Tool execution result
+        """
+        connection = self.select_connection(tool_name)
+        return await connection.execute_tool(tool_name, arguments, **kwargs)
+
+    def get_stats(self) -> ConnectionStats:
+        """Get the statistics of all sessions added together.
+
+        Returns:
+            ConnectionStats object with the totals
+        """
+        total = ConnectionStats()
+        for connections in self._connections.values():
+            for connection in connections:
+                stats = connection.get_stats()
+                for field in fields(ConnectionStats):
+                    value = getattr(stats, field.name)
+                    if isinstance(value, int):
+                        setattr(
+                            total,
+                            field.name,
+                            getattr(total, field.name) + value,
+                        )
+                if stats.connected_at and (
+                    total.connected_at is None
+                    or stats.connected_at < total.connected_at
+                ):
+                    total.connected_at = stats.connected_at
+                if stats.last_error_time and (
+                    total.last_error_time is None
+                    or stats.last_error_time > total.last_error_time
+                ):
+                    total.last_error = stats.last_error
+                    total.last_error_time = stats.last_error_time
+        return total
+
+    def get_server_stats(self) -> dict[str, list[ConnectionStats]]:
+        """Get the statistics of each session, by server URL."""
+        return {
+            server_url: [connection.get_stats() for connection in connections]
+            for server_url, connections in self._connections.items()
+        }
+
+    def get_tools_usage(self) -> dict[str, dict[str, Any]]:
+        """Get tools usage statistics, added up over all sessions.
+
+        Returns:
+            Dictionary with tool usage information
+        """
+        usage: dict[str, dict[str, Any]] = {}
+        for connections in self._connections.values():
+            for connection in connections:
+                for name, info in connection.get_tools_usage().items():
+                    total = usage.setdefault(
+                        name,
+                        {
+                            'usage_count': 0,
+                            'last_used': None,
+                            'description': info['description'],
+                        },
+                    )
+                    total['usage_count'] += info['usage_count']
+                    if info['last_used'] and (
+                        total['last_used'] is None
+                        or info['last_used'] > total['last_used']
+                    ):
+                        total['last_used'] = info['last_used']
+        return usage
+
+    async def disconnect(self) -> None:
+        """Close all sessions."""
+        self._shutdown_event.set()
+        await asyncio.gather(*self._owners, return_exceptions=True)
+        self._owners.clear()
+        self._connections.clear()
+        self._routes.clear()
+        logger.info('Disconnected from all MCP servers')
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
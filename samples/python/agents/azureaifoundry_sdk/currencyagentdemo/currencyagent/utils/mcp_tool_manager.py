@@ -1,22 +1,47 @@
 # Create global connection manager
 from typing import Any
 
-from .server_connection import ConnectionStats, MCPConfig, ServerConnection
+from .connection_manager import MCPConnectionManager
+from .server_connection import ConnectionStats, MCPConfig
 
 
 class MCPToolManager:
-    """Manager for MCP tools with connection pooling and caching."""
-
-    def __init__(self, server_url: str, config: MCPConfig | None = None):
-        self.config = config or MCPConfig(server_url=server_url)
-        self._connection: ServerConnection | None = None
+    """Manager for MCP tools with connection pooling and caching.
+
+    server_url may list several comma separated servers, whose tools are
+    merged and routed by name.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        config: MCPConfig | None = None,
+        sessions_per_server: int = 4,
+    ):
+        self.configs = (
+            [config]
+            if config
+            else [
+                MCPConfig(server_url=url.strip())
+                for url in server_url.split(',')
+                if url.strip()
+            ]
+        )
+        self.sessions_per_server = sessions_per_server
+        self._connection: MCPConnectionManager | None = None
         self._tools_cache: dict[str, dict[str, Any]] = {}
         self._functions_dict: dict[str, callable] = {}
 
     async def initialize(self) -> None:
         """Initialize the connection and load tools."""
+        if self._connection is not None and not self._connection.is_connected:
+            # All sessions were lost, start over
+            await self._connection.disconnect()
+            self._connection = None
         if self._connection is None:
-            self._connection = ServerConnection(self.config)
+            self._connection = MCPConnectionManager(
+                self.configs, self.sessions_per_server
+            )
             await self._connection.connect()
 
             # Load and cache tools
@@ -90,6 +90,7 @@ class ConnectionStats:
     successful_requests: int = 0
     failed_requests: int = 0
     reconnection_count: int = 0
+    in_flight_requests: int = 0
     last_error: str | None = None
     last_error_time: datetime | None = None
 
@@ -100,6 +101,13 @@ class ConnectionStats:
             return 0.0
         return (self.successful_requests / self.total_requests) * 100
 
+    @property
+    def failure_rate(self) -> float:
+        """Calculate failure rate as a fraction of the requests."""
+        if self.total_requests == 0:
+            return 0.0
+        return self.failed_requests / self.total_requests
+
     @property
     def uptime(self) -> timedelta | None:
         """Calculate connection uptime."""
@@ -131,6 +139,9 @@ class ServerConnection:
         self._health_check_task: asyncio.Task | None = None
         self._reconnect_task: asyncio.Task | None = None
         self._shutdown_event = asyncio.Event()
+        # Set when a health check fails and auto-reconnect is disabled, so
+        # the owner of the connection can reopen it
+        self.connection_lost = asyncio.Event()
 
     @property
     def state(self) -> ConnectionState:
@@ -170,6 +181,8 @@ class ServerConnection:
                 return True
 
             self._connection_state = ConnectionState.CONNECTING
+            self._shutdown_event.clear()
+            self.connection_lost.clear()
 
             try:
                 # Create connection with timeout
@@ -313,6 +326,10 @@ class ServerConnection:
     ) -> dict[str, Any]:
         """Execute a tool on the MCP server with enhanced retry logic and concurrency control.
 
+        Requests waiting for the semaphore or running are counted in
+        stats.in_flight_requests, which load balancers can use to pick the
+        least busy connection.
+
         Args:
             tool_name: Name of the tool to execute
             arguments: Arguments to pass to the tool
@@ -328,6 +345,23 @@ class ServerConnection:
             MCPToolNotFoundError: If the tool doesn't exist
             MCPExecutionError: On tool execution failure after all retries
         """
+        self.stats.in_flight_requests += 1
+        try:
+            return await self._execute_tool(
+                tool_name, arguments, retries, retry_delay, timeout
+            )
+        finally:
+            self.stats.in_flight_requests -= 1
+
+    async def _execute_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        retries: int | None = None,
+        retry_delay: float | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Execute a tool with retries, see execute_tool."""
         logger.info(f"Executing tool '{tool_name}' with arguments: {arguments}")
 
         if not self.is_connected:
@@ -458,13 +492,17 @@ class ServerConnection:
                     break
 
                 if not await self.health_check():
-                    logger.warning(
-                        'Health check failed, attempting reconnection...'
-                    )
                     if self.config.enable_auto_reconnect:
+                        logger.warning(
+                            'Health check failed, attempting reconnection...'
+                        )
                         self._reconnect_task = asyncio.create_task(
                             self._auto_reconnect()
                         )
+                    else:
+                        self._connection_state = ConnectionState.ERROR
+                        self.connection_lost.set()
+                        break
 
             except asyncio.CancelledError:
                 break
@@ -1,5 +1,6 @@
 # mypy: ignore-errors
 import asyncio
+import base64
 import logging
 
 from collections.abc import AsyncGenerator, AsyncIterable
@@ -330,9 +331,12 @@ def convert_a2a_part_to_genai(part: Part) -> types.Part:
                 )
             )
         if isinstance(part.file, FileWithBytes):
+            # The A2A payload is base64 text, decode it once into the raw
+            # bytes the Blob expects
             return types.Part(
                 inline_data=types.Blob(
-                    data=part.file.bytes, mime_type=part.file.mime_type
+                    data=base64.b64decode(part.file.bytes),
+                    mime_type=part.file.mime_type,
                 )
             )
         raise ValueError(f'Unsupported file type: {type(part.file)}')
@@ -363,7 +367,7 @@ def convert_genai_part_to_a2a(part: types.Part) -> Part:
         return Part(
             root=FilePart(
                 file=FileWithBytes(
-                    bytes=part.inline_data.data,
+                    bytes=base64.b64encode(part.inline_data.data).decode(),
                     mime_type=part.inline_data.mime_type,
                 )
             )
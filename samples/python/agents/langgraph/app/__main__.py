@@ -2,6 +2,8 @@ import logging
 import os
 import sys
 
+from contextlib import asynccontextmanager
+
 import click
 import httpx
 import uvicorn
@@ -16,7 +18,7 @@ from a2a.types import (
 )
 from dotenv import load_dotenv
 
-from app.agent import CurrencyAgent
+from app.agent import CurrencyAgent, exchange_rates
 from app.agent_executor import CurrencyAgentExecutor
 
 
@@ -72,8 +74,9 @@ def main(host, port):
 
         # --8<-- [start:DefaultRequestHandler]
         httpx_client = httpx.AsyncClient()
+        agent_executor = CurrencyAgentExecutor()
         request_handler = DefaultRequestHandler(
-            agent_executor=CurrencyAgentExecutor(),
+            agent_executor=agent_executor,
             task_store=InMemoryTaskStore(),
             push_notifier=InMemoryPushNotifier(httpx_client),
         )
@@ -81,7 +84,15 @@ def main(host, port):
             agent_card=agent_card, http_handler=request_handler
         )
 
-        uvicorn.run(server.build(), host=host, port=port)
+        @asynccontextmanager
+        async def lifespan(app):
+            yield
+            # Closes the checkpoint database so the process can exit
+            await agent_executor.agent.aclose()
+            await exchange_rates.aclose()
+            await httpx_client.aclose()
+
+        uvicorn.run(server.build(lifespan=lifespan), host=host, port=port)
         # --8<-- [end:DefaultRequestHandler]
 
     except MissingAPIKeyError as e:
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 from collections.abc import AsyncIterable
@@ -5,20 +6,27 @@ from typing import Any, Literal
 
 import httpx
 
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, ToolMessage
 from langchain_core.tools import tool
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import create_react_agent
 from pydantic import BaseModel
 
+from app.exchange_rates import ExchangeRates
+from app.memory import create_checkpointer, create_history_compactor
 
-memory = MemorySaver()
+
+exchange_rates = ExchangeRates(
+    os.getenv('FRANKFURTER_URL', 'https://api.frankfurter.app')
+)
 
 
 @tool
-def get_exchange_rate(
+async def get_exchange_rate(
     currency_from: str = 'USD',
     currency_to: str = 'EUR',
     currency_date: str = 'latest',
@@ -36,20 +44,13 @@ def get_exchange_rate(
         the request fails.
     """
     try:
-        response = httpx.get(
-            f'https://api.frankfurter.app/{currency_date}',
-            params={'from': currency_from, 'to': currency_to},
+        return await exchange_rates.get_rate(
+            currency_from, currency_to, currency_date
         )
-        response.raise_for_status()
-
-        data = response.json()
-        if 'rates' not in data:
-            return {'error': 'Invalid API response format.'}
-        return data
     except httpx.HTTPError as e:
         return {'error': f'API request failed: {e}'}
-    except ValueError:
-        return {'error': 'Invalid JSON response from API.'}
+    except ValueError as e:
+        return {'error': str(e)}
 
 
 class ResponseFormat(BaseModel):
@@ -76,9 +77,16 @@ class CurrencyAgent:
         'Set response status to completed if the request is complete.'
     )
 
-    def __init__(self):
+    def __init__(
+        self,
+        model: BaseChatModel | None = None,
+        checkpointer: BaseCheckpointSaver | None = None,
+    ):
         model_source = os.getenv('model_source', 'google')
-        if model_source == 'google':
+        if model:
+            # e.g. a fake chat model in benchmarks
+            self.model = model
+        elif model_source == 'google':
             self.model = ChatGoogleGenerativeAI(model='gemini-2.0-flash')
         else:
             self.model = ChatOpenAI(
@@ -88,20 +96,47 @@ class CurrencyAgent:
                 temperature=0,
             )
         self.tools = [get_exchange_rate]
-
-        self.graph = create_react_agent(
-            self.model,
-            tools=self.tools,
-            checkpointer=memory,
-            prompt=self.SYSTEM_INSTRUCTION,
-            response_format=(self.FORMAT_INSTRUCTION, ResponseFormat),
-        )
+        self.checkpointer = checkpointer
+        # Longer histories are summarized, keeping the recent messages
+        self.max_history_messages = int(os.getenv('MAX_HISTORY_MESSAGES', '40'))
+        self.keep_recent_messages = int(os.getenv('KEEP_RECENT_MESSAGES', '10'))
+        self._graph: CompiledStateGraph | None = None
+        self._graph_lock = asyncio.Lock()
+
+    async def get_graph(self) -> CompiledStateGraph:
+        """Builds the graph on first use.
+
+        The SQLite checkpointer must be created on the event loop that
+        serves requests, hence not in __init__.
+        """
+        async with self._graph_lock:
+            if self._graph is None:
+                if self.checkpointer is None:
+                    self.checkpointer = create_checkpointer()
+                self._graph = create_react_agent(
+                    self.model,
+                    tools=self.tools,
+                    checkpointer=self.checkpointer,
+                    prompt=self.SYSTEM_INSTRUCTION,
+                    response_format=(self.FORMAT_INSTRUCTION, ResponseFormat),
+                    pre_model_hook=create_history_compactor(
+                        self.model,
+                        self.max_history_messages,
+                        self.keep_recent_messages,
+                    ),
+                )
+        return self._graph
+
+    async def aclose(self):
+        if hasattr(self.checkpointer, 'aclose'):
+            await self.checkpointer.aclose()
 
     async def stream(self, query, context_id) -> AsyncIterable[dict[str, Any]]:
         inputs = {'messages': [('user', query)]}
         config = {'configurable': {'thread_id': context_id}}
 
-        for item in self.graph.stream(inputs, config, stream_mode='values'):
+        graph = await self.get_graph()
+        async for item in graph.astream(inputs, config, stream_mode='values'):
             message = item['messages'][-1]
             if (
                 isinstance(message, AIMessage)
@@ -120,10 +155,11 @@ class CurrencyAgent:
                     'content': 'Processing the exchange rates..',
                 }
 
-        yield self.get_agent_response(config)
+        yield await self.get_agent_response(config)
 
-    def get_agent_response(self, config):
-        current_state = self.graph.get_state(config)
+    async def get_agent_response(self, config):
+        graph = await self.get_graph()
+        current_state = await graph.aget_state(config)
         structured_response = current_state.values.get('structured_response')
         if structured_response and isinstance(
             structured_response, ResponseFormat
@@ -0,0 +1,141 @@
+"""Benchmark of CurrencyAgent answering many contexts at once.
+
+Each context asks for an exchange rate. The chat model is a fake that waits
+before every answer, then either calls get_exchange_rate or answers from the
+tool result. The tool is served by the stub Frankfurter API in process. Since
+the graph runs on the event loop without blocking, the contexts overlap and
+the total time stays close to the time of a single one.
+
+run:
+  uv run python -m app.bench --contexts 1,8,32 --delay 0.2
+"""
+
+import asyncio
+import time
+import uuid
+
+from typing import Any
+
+import click
+import httpx
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+from langgraph.checkpoint.memory import MemorySaver
+
+from app import agent as agent_module
+from app.agent import CurrencyAgent
+from app.exchange_rates import ExchangeRates
+from app.stub_frankfurter import create_app
+
+
+class FakeChatModel(BaseChatModel):
+    """Calls the exchange-rate tool once, then answers with its result."""
+
+    delay: float = 0.2
+
+    @property
+    def _llm_type(self) -> str:
+        return 'fake-currency'
+
+    def _answer(self, messages: list[BaseMessage]) -> AIMessage:
+        last = messages[-1]
+        if isinstance(last, ToolMessage):
+            return AIMessage(content=f'The rate is {last.content}')
+        return AIMessage(
+            content='',
+            tool_calls=[
+                {
+                    'name': 'get_exchange_rate',
+                    'args': {'currency_from': 'USD', 'currency_to': 'EUR'},
+                    'id': uuid.uuid4().hex,
+                }
+            ],
+        )
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.delay)
+        return ChatResult(
+            generations=[ChatGeneration(message=self._answer(messages))]
+        )
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.delay)
+        return ChatResult(
+            generations=[ChatGeneration(message=self._answer(messages))]
+        )
+
+    def bind_tools(self, tools, **kwargs) -> Runnable:
+        return self
+
+    def with_structured_output(self, schema, **kwargs) -> Runnable:
+        def respond(messages: list[BaseMessage]) -> Any:
+            return schema(status='completed', message=messages[-1].content)
+
+        async def arespond(messages: list[BaseMessage]) -> Any:
+            await asyncio.sleep(self.delay)
+            return respond(messages)
+
+        return RunnableLambda(respond, afunc=arespond)
+
+
+async def ask(agent: CurrencyAgent, start: float) -> tuple[float, float]:
+    """Asks in a new context, returning when it first progressed and ended."""
+    first_update = None
+    async for item in agent.stream(
+        'How much is 1 USD in EUR?', uuid.uuid4().hex
+    ):
+        if first_update is None:
+            first_update = time.monotonic() - start
+    if not item['is_task_complete']:
+        raise RuntimeError(f'Unexpected answer: {item["content"]}')
+    return first_update, time.monotonic() - start
+
+
+async def measure(contexts: int, delay: float) -> tuple[float, float]:
+    """Runs the contexts concurrently.
+
+    Returns:
+        The total seconds, and the seconds until the last context first
+        progressed.
+    """
+    # A client per run, since each run has its own event loop
+    agent_module.exchange_rates = ExchangeRates(
+        'http://stub-frankfurter',
+        transport=httpx.ASGITransport(create_app(delay)),
+    )
+    agent = CurrencyAgent(
+        model=FakeChatModel(delay=delay), checkpointer=MemorySaver()
+    )
+    start = time.monotonic()
+    try:
+        results = await asyncio.gather(
+            *(ask(agent, start) for _ in range(contexts))
+        )
+    finally:
+        await agent_module.exchange_rates.aclose()
+    return time.monotonic() - start, max(first for first, _ in results)
+
+
+@click.command()
+@click.option(
+    '--contexts',
+    'contexts',
+    default='1,8,32',
+    help='Comma separated numbers of concurrent contexts.',
+)
+@click.option(
+    '--delay', 'delay', default=0.2, help='Seconds per chat model call.'
+)
+def main(contexts, delay):
+    """Measures how CurrencyAgent scales with concurrent contexts."""
+    print(f'{"contexts":>10}{"total s":>10}{"last first update s":>22}')
+    for n in (int(c) for c in contexts.split(',')):
+        elapsed, last_first_update = asyncio.run(measure(n, delay))
+        print(f'{n:>10}{elapsed:>10.2f}{last_first_update:>22.2f}')
+
+
+if __name__ == '__main__':
+    main()
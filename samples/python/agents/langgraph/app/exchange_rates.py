@@ -0,0 +1,140 @@
+import asyncio
+import datetime
+import time
+
+from dataclasses import dataclass
+
+import httpx
+
+
+# Frankfurter quotes every rate against the euro
+BASE_CURRENCY = 'EUR'
+
+
+@dataclass
+class RateTable:
+    """The rates of one day against the base currency."""
+
+    date: str
+    rates: dict[str, float]
+    # Monotonic time after which the table is stale, None if it never is
+    expires_at: float | None = None
+
+
+class ExchangeRates:
+    """Exchange rates from the Frankfurter API, cached per date.
+
+    One request fetches all the rates of a date against the base currency,
+    and the rate between any two currencies is derived from that table, so
+    a lookup keyed by (date, from, to) only hits the API when the table of
+    its date is missing. Tables of past dates are kept for good since those
+    rates never change; 'latest' and dates from today on are refetched after
+    latest_ttl seconds. Concurrent lookups of a missing date share a single
+    request, and all requests go through one pooled HTTP client.
+    """
+
+    def __init__(
+        self,
+        base_url: str = 'https://api.frankfurter.app',
+        latest_ttl: float = 3600.0,
+        timeout: float = 10.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.base_url = base_url
+        self.latest_ttl = latest_ttl
+        self.timeout = timeout
+        # e.g. an ASGI transport to a stub API in benchmarks
+        self.transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._tables: dict[str, RateTable] = {}
+        self._pending: dict[str, asyncio.Task[RateTable]] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Created on first use so it binds to the loop serving requests
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                transport=self.transport,
+            )
+        return self._client
+
+    async def get_rate(
+        self,
+        currency_from: str,
+        currency_to: str,
+        currency_date: str = 'latest',
+    ) -> dict:
+        """Returns the rate in the format of the Frankfurter API.
+
+        Raises:
+            httpx.HTTPError: If the rates could not be fetched.
+            ValueError: If the API response is invalid or a currency is
+                not supported.
+        """
+        currency_from = currency_from.upper()
+        currency_to = currency_to.upper()
+        table = await self._table(currency_date)
+        for currency in (currency_from, currency_to):
+            if currency not in table.rates:
+                raise ValueError(f'Unsupported currency: {currency}')
+        rate = table.rates[currency_to] / table.rates[currency_from]
+        return {
+            'amount': 1.0,
+            'base': currency_from,
+            'date': table.date,
+            'rates': {currency_to: rate},
+        }
+
+    async def _table(self, currency_date: str) -> RateTable:
+        table = self._tables.get(currency_date)
+        if table and (
+            table.expires_at is None or table.expires_at > time.monotonic()
+        ):
+            return table
+        if currency_date not in self._pending:
+            task = asyncio.create_task(self._fetch(currency_date))
+            task.add_done_callback(
+                lambda task: self._fetch_done(currency_date, task)
+            )
+            self._pending[currency_date] = task
+        # Shielded so a cancelled caller does not fail the others
+        return await asyncio.shield(self._pending[currency_date])
+
+    def _fetch_done(self, currency_date: str, task: asyncio.Task) -> None:
+        self._pending.pop(currency_date, None)
+        if not task.cancelled():
+            # Retrieved here as well, since every caller may have been
+            # cancelled before the fetch failed
+            task.exception()
+
+    async def _fetch(self, currency_date: str) -> RateTable:
+        response = await self.client.get(
+            f'/{currency_date}', params={'from': BASE_CURRENCY}
+        )
+        response.raise_for_status()
+        data = response.json()
+        if 'rates' not in data or 'date' not in data:
+            raise ValueError('Invalid API response format.')
+        table = RateTable(
+            date=data['date'], rates={**data['rates'], BASE_CURRENCY: 1.0}
+        )
+        if not self._is_final(currency_date):
+            table.expires_at = time.monotonic() + self.latest_ttl
+        self._tables[currency_date] = table
+        return table
+
+    @staticmethod
+    def _is_final(currency_date: str) -> bool:
+        """Whether the rates of the date are published and cannot change."""
+        try:
+            date = datetime.date.fromisoformat(currency_date)
+        except ValueError:
+            return False
+        return date < datetime.datetime.now(datetime.UTC).date()
+
+    async def aclose(self):
+        if self._client:
+            await self._client.aclose()
+            self._client = None
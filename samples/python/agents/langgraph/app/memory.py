@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import os
+import time
+
+from collections.abc import Awaitable, Callable, Sequence
+
+import aiosqlite
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    AnyMessage,
+    HumanMessage,
+    RemoveMessage,
+)
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
+
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_INSTRUCTION = (
+    'Summarize the conversation above in a few sentences. Keep the '
+    'currencies, amounts, dates and exchange rates that were discussed, and '
+    'any request that is still open.'
+)
+
+
+class BoundedSqliteSaver(AsyncSqliteSaver):
+    """SQLite checkpointer that keeps its database bounded.
+
+    Only the keep_checkpoints latest checkpoints of a thread are kept, as the
+    agent never goes back in history. Every write also stamps the thread in a
+    thread_activity table. At most once every sweep_interval seconds, threads
+    idle for longer than max_idle seconds are deleted with all their
+    checkpoints. max_idle None keeps threads forever.
+    """
+
+    def __init__(
+        self,
+        conn: aiosqlite.Connection,
+        *,
+        keep_checkpoints: int = 2,
+        max_idle: float | None = None,
+        sweep_interval: float = 300.0,
+        **kwargs,
+    ):
+        super().__init__(conn, **kwargs)
+        self.keep_checkpoints = keep_checkpoints
+        self.max_idle = max_idle
+        self.sweep_interval = sweep_interval
+        self._last_sweep = time.monotonic()
+        self._sweep: asyncio.Task | None = None
+
+    async def setup(self) -> None:
+        if self.is_setup:
+            return
+        await super().setup()
+        async with self.lock:
+            await self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS thread_activity ('
+                'thread_id TEXT PRIMARY KEY, last_seen REAL NOT NULL)'
+            )
+            await self.conn.commit()
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        next_config = await super().aput(
+            config, checkpoint, metadata, new_versions
+        )
+        thread_id = str(config['configurable']['thread_id'])
+        checkpoint_ns = config['configurable'].get('checkpoint_ns', '')
+        async with self.lock:
+            # Wall clock time, so idleness survives restarts
+            await self.conn.execute(
+                'INSERT INTO thread_activity (thread_id, last_seen)'
+                ' VALUES (?, ?) ON CONFLICT(thread_id)'
+                ' DO UPDATE SET last_seen = excluded.last_seen',
+                (thread_id, time.time()),
+            )
+            for table in ('checkpoints', 'writes'):
+                await self.conn.execute(
+                    f'DELETE FROM {table} WHERE thread_id = ?'
+                    ' AND checkpoint_ns = ? AND checkpoint_id NOT IN ('
+                    ' SELECT checkpoint_id FROM checkpoints'
+                    ' WHERE thread_id = ? AND checkpoint_ns = ?'
+                    ' ORDER BY checkpoint_id DESC LIMIT ?)',
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        thread_id,
+                        checkpoint_ns,
+                        self.keep_checkpoints,
+                    ),
+                )
+            await self.conn.commit()
+        self._maybe_sweep()
+        return next_config
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await super().adelete_thread(thread_id)
+        async with self.lock:
+            await self.conn.execute(
+                'DELETE FROM thread_activity WHERE thread_id = ?',
+                (str(thread_id),),
+            )
+            await self.conn.commit()
+
+    async def evict_idle(self) -> list[str]:
+        """Deletes the threads idle for longer than max_idle."""
+        if self.max_idle is None:
+            return []
+        await self.setup()
+        async with (
+            self.lock,
+            self.conn.execute(
+                'SELECT thread_id FROM thread_activity WHERE last_seen < ?',
+                (time.time() - self.max_idle,),
+            ) as cursor,
+        ):
+            thread_ids = [row[0] for row in await cursor.fetchall()]
+        for thread_id in thread_ids:
+            await self.adelete_thread(thread_id)
+        if thread_ids:
+            logger.info(f'Evicted {len(thread_ids)} idle threads')
+        return thread_ids
+
+    def _maybe_sweep(self) -> None:
+        if self.max_idle is None or (self._sweep and not self._sweep.done()):
+            return
+        if time.monotonic() - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = time.monotonic()
+        # In the background, so the request that triggers it is not delayed
+        self._sweep = asyncio.create_task(self.evict_idle())
+
+    async def aclose(self):
+        if self._sweep:
+            await asyncio.gather(self._sweep, return_exceptions=True)
+        await self.conn.close()
+
+
+def create_checkpointer() -> BaseCheckpointSaver:
+    """Creates the checkpointer configured by the environment.
+
+    CHECKPOINTER is 'sqlite' (default) to keep threads in the CHECKPOINT_DB
+    file, or 'memory' to keep them in memory until the server stops. Threads
+    idle for THREAD_IDLE_TTL seconds (default a day, 0 for never) are
+    deleted from SQLite. Must be called on the event loop that serves the
+    graph.
+    """
+    if os.getenv('CHECKPOINTER', 'sqlite') == 'memory':
+        return MemorySaver()
+    max_idle = float(os.getenv('THREAD_IDLE_TTL', '86400'))
+    return BoundedSqliteSaver(
+        aiosqlite.connect(os.getenv('CHECKPOINT_DB', 'checkpoints.sqlite')),
+        max_idle=max_idle or None,
+    )
+
+
+def _turn_start(messages: Sequence[AnyMessage], index: int) -> int:
+    """Moves index back to the start of a user turn.
+
+    Cutting there never separates a tool call from its result.
+    """
+    while index > 0 and not isinstance(messages[index], HumanMessage):
+        index -= 1
+    return index
+
+
+def create_history_compactor(
+    model: BaseChatModel, max_messages: int, keep_messages: int
+) -> Callable[[dict], Awaitable[dict]]:
+    """Creates a pre-model hook keeping the message history bounded.
+
+    Once a thread holds more than max_messages messages, all but the last
+    turns, about keep_messages messages, are replaced in the state by a
+    summary written by the model.
+    """
+
+    async def compact(state: dict) -> dict:
+        messages = state['messages']
+        if len(messages) <= max_messages:
+            return {'llm_input_messages': messages}
+        cut = _turn_start(messages, len(messages) - keep_messages)
+        if cut == 0:
+            return {'llm_input_messages': messages}
+        summary = await model.ainvoke(
+            [*messages[:cut], HumanMessage(content=SUMMARY_INSTRUCTION)]
+        )
+        compacted = [
+            HumanMessage(
+                content='Summary of the earlier conversation: '
+                + str(summary.content)
+            ),
+            *messages[cut:],
+        ]
+        return {
+            'messages': [RemoveMessage(id=REMOVE_ALL_MESSAGES), *compacted],
+            # Replaces the LLM input left in the state by the last call
+            'llm_input_messages': compacted,
+        }
+
+    return compact
@@ -0,0 +1,90 @@
+"""A local stand-in for the Frankfurter API, for tests and benchmarks.
+
+It answers GET /latest and GET /YYYY-MM-DD like Frankfurter does, with
+fixed rates for a handful of currencies, after an optional delay. GET /stats
+returns how many rate requests were served, to check what the agent caches.
+
+run:
+  uv run python -m app.stub_frankfurter --port 10098 --delay 0.1
+  FRANKFURTER_URL=http://localhost:10098 uv run app
+"""
+
+import asyncio
+import datetime
+
+import click
+import uvicorn
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+# Units of each currency per euro
+RATES = {
+    'EUR': 1.0,
+    'USD': 1.08,
+    'GBP': 0.85,
+    'JPY': 162.5,
+    'CHF': 0.95,
+    'INR': 90.2,
+    'CAD': 1.47,
+    'AUD': 1.63,
+}
+
+
+def create_app(delay: float = 0.0) -> Starlette:
+    stats = {'requests': 0}
+
+    async def rates(request: Request):
+        stats['requests'] += 1
+        await asyncio.sleep(delay)
+        currency_date = request.path_params['currency_date']
+        if currency_date == 'latest':
+            date = datetime.date.today()
+        else:
+            try:
+                date = datetime.date.fromisoformat(currency_date)
+            except ValueError:
+                return JSONResponse({'message': 'not found'}, status_code=404)
+        base = request.query_params.get('from', 'EUR').upper()
+        if base not in RATES:
+            return JSONResponse({'message': 'not found'}, status_code=404)
+        symbols = request.query_params.get('to')
+        targets = symbols.upper().split(',') if symbols else list(RATES)
+        return JSONResponse(
+            {
+                'amount': 1.0,
+                'base': base,
+                'date': date.isoformat(),
+                'rates': {
+                    currency: round(RATES[currency] / RATES[base], 5)
+                    for currency in targets
+                    if currency in RATES and currency != base
+                },
+            }
+        )
+
+    async def get_stats(request: Request):
+        return JSONResponse(stats)
+
+    return Starlette(
+        routes=[
+            Route('/stats', get_stats),
+            Route('/{currency_date}', rates),
+        ]
+    )
+
+
+@click.command()
+@click.option('--host', 'host', default='localhost')
+@click.option('--port', 'port', default=10098)
+@click.option('--delay', 'delay', default=0.0, help='Seconds per request.')
+def main(host, port, delay):
+    """Starts the stub Frankfurter API."""
+    uvicorn.run(create_app(delay), host=host, port=port, log_level='warning')
+
+
+if __name__ == '__main__':
+    main()
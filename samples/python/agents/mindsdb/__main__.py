@@ -1,6 +1,8 @@
 import os
 import sys
 
+from contextlib import asynccontextmanager
+
 import click
 
 from a2a.server.apps import A2AStarletteApplication
@@ -23,8 +25,9 @@ def main(host, port):
         print('MINDS_API_KEY environment variable not set.')
         sys.exit(1)
 
+    agent_executor = MindsDBAgentExecutor()
     request_handler = DefaultRequestHandler(
-        agent_executor=MindsDBAgentExecutor(),
+        agent_executor=agent_executor,
         task_store=InMemoryTaskStore(),
     )
 
@@ -33,7 +36,12 @@ def main(host, port):
     )
     import uvicorn
 
-    uvicorn.run(server.build(), host=host, port=port)
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await agent_executor.agent.aclose()
+
+    uvicorn.run(server.build(lifespan=lifespan), host=host, port=port)
 
 
 def get_agent_card(host: str, port: int):
@@ -7,6 +7,7 @@ from typing import Any
 import aiohttp
 
 from dotenv import load_dotenv
+from sse import iter_sse
 
 
 # from flat_ai import FlatAI
@@ -34,10 +35,36 @@ class MindsDBAgent:
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}',
         }
+        # Upper bound on concurrent requests to the MindsDB API
+        self.max_connections = int(os.getenv('MINDS_MAX_CONNECTIONS', '100'))
+        # Reasoning updates are sent once this many characters are pending
+        self.max_update_chars = 512
+        self._session: aiohttp.ClientSession | None = None
 
     def invoke(self, query, session_id) -> str:
         return {'content': 'Use stream method to get the results!'}
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # Shared by all queries, created on the loop serving them
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=30, sock_read=300
+                ),
+            )
+        return self._session
+
+    async def aclose(self):
+        if self._session:
+            await self._session.close()
+            self._session = None
+
     async def stream(self, query, session_id) -> AsyncIterable[dict[str, Any]]:
         payload = {
             'model': self.model,
@@ -47,58 +74,73 @@ class MindsDBAgent:
             ],
             'stream': True,
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.API_URL, headers=self.headers, json=payload
-            ) as response:
-                async for line in response.content:
-                    if line:
-                        # Skip empty lines
-                        line = line.decode('utf-8').strip()
-                        if not line or not line.startswith('data: '):
-                            continue
-
-                        # Parse the JSON data
-                        json_str = line[6:]  # Remove "data: " prefix
-                        try:
-                            data = json.loads(json_str)
-                        except json.JSONDecodeError:
-                            continue
-                        if 'choices' in data:
-                            choice = data['choices'][0]
-                            delta = choice.get('delta', {})
-                            content = delta.get('content')
-                            role = delta.get('role', '')
-                            parts = [{'type': 'text', 'text': content}]
-                            if choice.get('finish_reason') == 'stop':
-                                yield {'is_task_complete': True, 'parts': parts}
-                                continue
-
-                            subtype = 'analysis'
-                            tool_calls = delta.get('tool_calls', [])
-
-                            if role == 'assistant':
-                                subtype = 'acknowledge'
-
-                            if tool_calls:
-                                tool_call = tool_calls[0]
-                                function = tool_call.get('function', {})
-                                function_name = str(function.get('name'))
-                                arguments = function.get('arguments', {})
-
-                                if function_name == 'sql_db_query':
-                                    subtype = 'execute_query'
-
-                                    parts.append(
-                                        {'type': 'text', 'text': str(arguments)}
-                                    )
-
-                            yield {
-                                'is_task_complete': False,
-                                'parts': parts,
-                                'metadata': {
-                                    'type': 'reasoning',
-                                    'subtype': subtype,
-                                },
-                            }
-                            continue
+        # Consecutive reasoning deltas of one subtype, sent as one update
+        pending: list[str] = []
+        pending_subtype = None
+        pending_size = 0
+
+        def flush():
+            nonlocal pending, pending_subtype, pending_size
+            item = {
+                'is_task_complete': False,
+                'parts': [{'type': 'text', 'text': ''.join(pending)}],
+                'metadata': {'type': 'reasoning', 'subtype': pending_subtype},
+            }
+            pending, pending_subtype, pending_size = [], None, 0
+            return item
+
+        async with self.session.post(self.API_URL, json=payload) as response:
+            async for event in iter_sse(response.content.iter_any()):
+                try:
+                    data = json.loads(event.data)
+                except json.JSONDecodeError:
+                    # e.g. the [DONE] sentinel
+                    continue
+                if 'choices' not in data:
+                    continue
+                choice = data['choices'][0]
+                delta = choice.get('delta', {})
+                content = delta.get('content')
+                role = delta.get('role', '')
+                parts = [{'type': 'text', 'text': content}]
+                if choice.get('finish_reason') == 'stop':
+                    if pending:
+                        yield flush()
+                    yield {'is_task_complete': True, 'parts': parts}
+                    continue
+
+                subtype = 'analysis'
+                tool_calls = delta.get('tool_calls', [])
+
+                if role == 'assistant':
+                    subtype = 'acknowledge'
+
+                if tool_calls:
+                    tool_call = tool_calls[0]
+                    function = tool_call.get('function', {})
+                    function_name = str(function.get('name'))
+                    arguments = function.get('arguments', {})
+
+                    if function_name == 'sql_db_query':
+                        subtype = 'execute_query'
+
+                        parts.append({'type': 'text', 'text': str(arguments)})
+
+                if pending and (subtype != pending_subtype or len(parts) > 1):
+                    yield flush()
+                if len(parts) > 1:
+                    # Queries are sent on their own
+                    yield {
+                        'is_task_complete': False,
+                        'parts': parts,
+                        'metadata': {'type': 'reasoning', 'subtype': subtype},
+                    }
+                    continue
+                if content:
+                    pending.append(content)
+                    pending_size += len(content)
+                    pending_subtype = subtype
+                if pending_size >= self.max_update_chars:
+                    yield flush()
+        if pending:
+            yield flush()
@@ -0,0 +1,85 @@
+import codecs
+import re
+
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+
+
+# The only line breaks of a text/event-stream. str.splitlines() would also
+# split on characters such as U+2028, which may appear inside JSON data.
+_LINE_BREAK = re.compile(r'\r\n|\r|\n')
+
+
+@dataclass
+class SSEEvent:
+    """A server-sent event."""
+
+    data: str
+    event: str = 'message'
+    id: str | None = None
+
+
+class SSEParser:
+    """Incremental parser for a text/event-stream.
+
+    feed() takes the body in chunks of any size, so an event, a line or even
+    a UTF-8 character may be split across chunks, and returns the events
+    completed by each chunk. Data lines of one event are joined with newlines
+    as the specification requires, and comments are ignored.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._line = ''
+        self._data: list[str] = []
+        self._event = ''
+        self._id: str | None = None
+
+    def feed(self, chunk: bytes) -> list[SSEEvent]:
+        text = self._line + self._decoder.decode(chunk)
+        # A trailing \r is held back, as a \n may follow in the next chunk
+        held = '\r' if text.endswith('\r') else ''
+        *lines, rest = _LINE_BREAK.split(text[: len(text) - len(held)])
+        # The last line is incomplete until a line break follows it
+        self._line = rest + held
+        events = []
+        for line in lines:
+            event = self._process(line)
+            if event:
+                events.append(event)
+        return events
+
+    def _process(self, line: str) -> SSEEvent | None:
+        if not line:
+            return self._dispatch()
+        if line.startswith(':'):
+            return None
+        name, _, value = line.partition(':')
+        value = value.removeprefix(' ')
+        if name == 'data':
+            self._data.append(value)
+        elif name == 'event':
+            self._event = value
+        elif name == 'id':
+            self._id = value
+        return None
+
+    def _dispatch(self) -> SSEEvent | None:
+        data, event = self._data, self._event
+        self._data, self._event = [], ''
+        if not data:
+            return None
+        return SSEEvent(
+            data='\n'.join(data), event=event or 'message', id=self._id
+        )
+
+
+async def iter_sse(chunks: AsyncIterable[bytes]) -> AsyncIterator[SSEEvent]:
+    """Yields the events of a text/event-stream read in chunks."""
+    parser = SSEParser()
+    async for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event
+    # A last event not followed by a blank line is still complete
+    for event in parser.feed(b'\n\n'):
+        yield event
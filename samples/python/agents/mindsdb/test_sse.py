@@ -0,0 +1,58 @@
+import asyncio
+import json
+import unittest
+
+from sse import SSEEvent, SSEParser, iter_sse
+
+
+class SSEParserTest(unittest.TestCase):
+    def feed_all(self, chunks):
+        parser = SSEParser()
+        events = []
+        for chunk in chunks:
+            events.extend(parser.feed(chunk))
+        return events
+
+    def test_events_split_across_chunks(self):
+        body = 'data: {"a": 1}\r\n\r\nevent: done\ndata: x\n\n'.encode()
+        expected = [
+            SSEEvent(data='{"a": 1}'),
+            SSEEvent(data='x', event='done'),
+        ]
+        # Every split point, including between \r and \n
+        for i in range(len(body) + 1):
+            self.assertEqual(
+                self.feed_all([body[:i], body[i:]]), expected, msg=i
+            )
+
+    def test_multibyte_character_split_across_chunks(self):
+        body = 'data: é\n\n'.encode()
+        split = body.index(b'\xa9')
+        events = self.feed_all([body[:split], body[split:]])
+        self.assertEqual(events, [SSEEvent(data='é')])
+
+    def test_unicode_line_separators_are_data(self):
+        delta = {'text': 'line\u2028next\x0bmore\x85end'}
+        body = f'data: {json.dumps(delta, ensure_ascii=False)}\n\n'.encode()
+        events = self.feed_all([body])
+        self.assertEqual(len(events), 1)
+        self.assertEqual(json.loads(events[0].data), delta)
+
+    def test_multiline_data_and_comments(self):
+        events = self.feed_all([b': ping\ndata: a\ndata: b\rid: 7\r\r\n'])
+        self.assertEqual(events, [SSEEvent(data='a\nb', id='7')])
+
+    def test_last_event_without_blank_line(self):
+        async def chunks():
+            yield b'data: a\n\ndata: b'
+
+        async def collect():
+            return [event async for event in iter_sse(chunks())]
+
+        self.assertEqual(
+            asyncio.run(collect()), [SSEEvent(data='a'), SSEEvent(data='b')]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
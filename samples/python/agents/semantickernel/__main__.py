@@ -1,5 +1,7 @@
 import logging
 
+from contextlib import asynccontextmanager
+
 import click
 import httpx
 
@@ -23,8 +25,9 @@ load_dotenv()
 def main(host, port):
     """Starts the Semantic Kernel Agent server using A2A."""
     httpx_client = httpx.AsyncClient()
+    agent_executor = SemanticKernelTravelAgentExecutor()
     request_handler = DefaultRequestHandler(
-        agent_executor=SemanticKernelTravelAgentExecutor(),
+        agent_executor=agent_executor,
         task_store=InMemoryTaskStore(),
         push_notifier=InMemoryPushNotifier(httpx_client),
     )
@@ -34,7 +37,13 @@ def main(host, port):
     )
     import uvicorn
 
-    uvicorn.run(server.build(), host=host, port=port)
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await agent_executor.agent.aclose()
+        await httpx_client.aclose()
+
+    uvicorn.run(server.build(lifespan=lifespan), host=host, port=port)
 
 
 def get_agent_card(host: str, port: int):
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import os
+import time
 
 from collections.abc import AsyncIterable
 from enum import Enum
@@ -10,7 +11,7 @@ import httpx
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
-from semantic_kernel.agents import ChatCompletionAgent, ChatHistoryAgentThread
+from semantic_kernel.agents import ChatCompletionAgent
 from semantic_kernel.connectors.ai.open_ai import (
     AzureChatCompletion,
     OpenAIChatCompletion,
@@ -23,6 +24,7 @@ from semantic_kernel.contents import (
     StreamingTextContent,
 )
 from semantic_kernel.functions import KernelArguments, kernel_function
+from thread_store import ThreadStore
 
 
 if TYPE_CHECKING:
@@ -99,13 +101,44 @@ def _get_openai_chat_completion_service() -> OpenAIChatCompletion:
 class CurrencyPlugin:
     """A simple currency plugin that leverages Frankfurter for exchange rates.
 
-    The Plugin is used by the `currency_exchange_agent`.
+    The Plugin is used by the `currency_exchange_agent`. Rates are fetched
+    through one pooled async HTTP client and cached for cache_ttl seconds.
+    Concurrent lookups of the same rate share a single request.
     """
 
+    def __init__(
+        self,
+        base_url: str = 'https://api.frankfurter.app',
+        cache_ttl: float = 3600.0,
+        timeout: float = 10.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.base_url = base_url
+        self.cache_ttl = cache_ttl
+        self.timeout = timeout
+        # e.g. an ASGI transport to the stub Frankfurter API in benchmarks
+        self.transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._cache: dict[tuple[str, str, str], tuple[float, float]] = {}
+        self._pending: dict[
+            tuple[str, str, str], asyncio.Task[float | None]
+        ] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Created on first use so it binds to the loop serving requests
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                transport=self.transport,
+            )
+        return self._client
+
     @kernel_function(
         description='Retrieves exchange rate between currency_from and currency_to using Frankfurter API'
     )
-    def get_exchange_rate(
+    async def get_exchange_rate(
         self,
         currency_from: Annotated[
             str, 'Currency code to convert from, e.g. USD'
@@ -116,20 +149,49 @@ class CurrencyPlugin:
         date: Annotated[str, "Date or 'latest'"] = 'latest',
     ) -> str:
         try:
-            response = httpx.get(
-                f'https://api.frankfurter.app/{date}',
-                params={'from': currency_from, 'to': currency_to},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            if 'rates' not in data or currency_to not in data['rates']:
+            rate = await self._get_rate(currency_from, currency_to, date)
+            if rate is None:
                 return f'Could not retrieve rate for {currency_from} to {currency_to}'
-            rate = data['rates'][currency_to]
             return f'1 {currency_from} = {rate} {currency_to}'
         except Exception as e:
             return f'Currency API call failed: {e!s}'
 
+    async def _get_rate(
+        self, currency_from: str, currency_to: str, date: str
+    ) -> float | None:
+        key = (date, currency_from.upper(), currency_to.upper())
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        if key not in self._pending:
+            task = asyncio.create_task(self._fetch_rate(*key))
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+            self._pending[key] = task
+        # Shielded so a cancelled caller does not fail the others
+        return await asyncio.shield(self._pending[key])
+
+    async def _fetch_rate(
+        self, date: str, currency_from: str, currency_to: str
+    ) -> float | None:
+        response = await self.client.get(
+            f'/{date}', params={'from': currency_from, 'to': currency_to}
+        )
+        response.raise_for_status()
+        data = response.json()
+        if 'rates' not in data or currency_to not in data['rates']:
+            return None
+        rate = data['rates'][currency_to]
+        self._cache[date, currency_from, currency_to] = (
+            time.monotonic() + self.cache_ttl,
+            rate,
+        )
+        return rate
+
+    async def aclose(self):
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
 
 # endregion
 
@@ -152,7 +214,7 @@ class SemanticKernelTravelAgent:
     """Wraps Semantic Kernel-based agents to handle Travel related tasks."""
 
     agent: ChatCompletionAgent
-    thread: ChatHistoryAgentThread = None
+    threads: ThreadStore
     SUPPORTED_CONTENT_TYPES = ['text', 'text/plain']
 
     def __init__(self):
@@ -160,6 +222,10 @@ class SemanticKernelTravelAgent:
         # It uses Azure OpenAI by default. Please change to ChatServices.OPENAI in case you want to use OpenAI service.
         chat_service = get_chat_completion_service(ChatServices.AZURE_OPENAI)
 
+        self.currency_plugin = CurrencyPlugin(
+            os.getenv('FRANKFURTER_URL', 'https://api.frankfurter.app')
+        )
+
         currency_exchange_agent = ChatCompletionAgent(
             service=chat_service,
             name='CurrencyExchangeAgent',
@@ -169,7 +235,7 @@ class SemanticKernelTravelAgent:
                 'explaining fees or charges related to currency exchange, and giving advice on the best practices for exchanging currency. '
                 'Your goal is to assist travelers promptly and accurately with all currency-related questions.'
             ),
-            plugins=[CurrencyPlugin()],
+            plugins=[self.currency_plugin],
         )
 
         # Define an ActivityPlannerAgent to handle activity-related tasks
@@ -208,6 +274,16 @@ class SemanticKernelTravelAgent:
             ),
         )
 
+        # A chat history thread per session, so sessions run concurrently
+        self.threads = ThreadStore(
+            max_threads=int(os.getenv('MAX_THREADS', '1000')),
+            max_idle=float(os.getenv('THREAD_IDLE_TTL', '3600')) or None,
+        )
+
+    async def aclose(self):
+        """Closes the HTTP client of the currency plugin."""
+        await self.currency_plugin.aclose()
+
     async def invoke(self, user_input: str, session_id: str) -> dict[str, Any]:
         """Handle synchronous tasks (like message/send).
 
@@ -219,13 +295,12 @@ class SemanticKernelTravelAgent:
             dict: A dictionary containing the content, task completion status,
             and user input requirement.
         """
-        await self._ensure_thread_exists(session_id)
-
-        # Use SK's get_response for a single shot
-        response = await self.agent.get_response(
-            messages=user_input,
-            thread=self.thread,
-        )
+        async with self.threads.checkout(session_id) as thread:
+            # Use SK's get_response for a single shot
+            response = await self.agent.get_response(
+                messages=user_input,
+                thread=thread,
+            )
         return self._get_agent_response(response.content)
 
     async def stream(
@@ -243,8 +318,6 @@ class SemanticKernelTravelAgent:
             dict: A dictionary containing the content, task completion status,
             and user input requirement.
         """
-        await self._ensure_thread_exists(session_id)
-
         plugin_notice_seen = False
         plugin_event = asyncio.Event()
 
@@ -272,28 +345,31 @@ class SemanticKernelTravelAgent:
                 else:
                     print(f'SK Message:> {item}')
 
-        async for chunk in self.agent.invoke_stream(
-            messages=user_input,
-            thread=self.thread,
-            on_intermediate_message=_handle_intermediate_message,
-        ):
-            if plugin_event.is_set():
-                yield {
-                    'is_task_complete': False,
-                    'require_user_input': False,
-                    'content': 'Processing function calls...',
-                }
-                plugin_event.clear()
-
-            if any(isinstance(i, StreamingTextContent) for i in chunk.items):
-                if not text_notice_seen:
+        async with self.threads.checkout(session_id) as thread:
+            async for chunk in self.agent.invoke_stream(
+                messages=user_input,
+                thread=thread,
+                on_intermediate_message=_handle_intermediate_message,
+            ):
+                if plugin_event.is_set():
                     yield {
                         'is_task_complete': False,
                         'require_user_input': False,
-                        'content': 'Building the output...',
+                        'content': 'Processing function calls...',
                     }
-                    text_notice_seen = True
-                chunks.append(chunk.message)
+                    plugin_event.clear()
+
+                if any(
+                    isinstance(i, StreamingTextContent) for i in chunk.items
+                ):
+                    if not text_notice_seen:
+                        yield {
+                            'is_task_complete': False,
+                            'require_user_input': False,
+                            'content': 'Building the output...',
+                        }
+                        text_notice_seen = True
+                    chunks.append(chunk.message)
 
         if chunks:
             yield self._get_agent_response(sum(chunks[1:], chunks[0]))
@@ -341,15 +417,5 @@ class SemanticKernelTravelAgent:
 
         return default_response
 
-    async def _ensure_thread_exists(self, session_id: str) -> None:
-        """Ensure the thread exists for the given session ID.
-
-        Args:
-            session_id (str): Unique identifier for the session.
-        """
-        if self.thread is None or self.thread.id != session_id:
-            await self.thread.delete() if self.thread else None
-            self.thread = ChatHistoryAgentThread(thread_id=session_id)
-
 
 # endregion
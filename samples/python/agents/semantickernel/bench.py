@@ -0,0 +1,105 @@
+"""Benchmark of the currency plugin against the stub Frankfurter API.
+
+Many lookups run at once, as when many sessions ask for rates together.
+The blocking variant calls httpx.get like the plugin used to, which stalls
+the event loop for each request. The async plugin runs them concurrently,
+sends a single request for identical lookups and answers repeated ones from
+its cache.
+
+run:
+  uv run python bench.py --lookups 50 --pairs 5 --delay 0.05
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+
+import click
+import httpx
+import uvicorn
+
+from agent import CurrencyPlugin
+from stub_frankfurter import RATES, create_app
+
+
+def blocking_rate(base_url: str, currency_from: str, currency_to: str) -> str:
+    """The former, blocking implementation of get_exchange_rate."""
+    response = httpx.get(
+        f'{base_url}/latest',
+        params={'from': currency_from, 'to': currency_to},
+        timeout=10.0,
+    )
+    response.raise_for_status()
+    rate = response.json()['rates'][currency_to]
+    return f'1 {currency_from} = {rate} {currency_to}'
+
+
+async def run(
+    base_url: str, pairs: list[tuple[str, str]], lookups: int
+) -> dict[str, tuple[float, int]]:
+    """Runs the lookups with each variant.
+
+    Returns:
+        For each variant, the total seconds and the requests sent.
+    """
+    queries = list(itertools.islice(itertools.cycle(pairs), lookups))
+    results = {}
+    async with httpx.AsyncClient(base_url=base_url) as stats_client:
+
+        async def requests() -> int:
+            response = await stats_client.get('/stats')
+            return response.json()['requests']
+
+        async def blocking(pair: tuple[str, str]) -> str:
+            return blocking_rate(base_url, *pair)
+
+        plugin = CurrencyPlugin(base_url)
+        variants = {
+            'blocking': blocking,
+            'async cold': lambda pair: plugin.get_exchange_rate(*pair),
+            'async warm': lambda pair: plugin.get_exchange_rate(*pair),
+        }
+        for name, lookup in variants.items():
+            before = await requests()
+            start = time.monotonic()
+            answers = await asyncio.gather(*(lookup(q) for q in queries))
+            elapsed = time.monotonic() - start
+            if not all(answer.startswith('1 ') for answer in answers):
+                raise RuntimeError(f'Unexpected answers: {set(answers)}')
+            results[name] = (elapsed, await requests() - before)
+        await plugin.aclose()
+    return results
+
+
+@click.command()
+@click.option('--lookups', 'lookups', default=50, help='Concurrent lookups.')
+@click.option('--pairs', 'pairs', default=5, help='Distinct currency pairs.')
+@click.option(
+    '--delay', 'delay', default=0.05, help='Seconds per stub API request.'
+)
+@click.option('--port', 'port', default=10099)
+def main(lookups, pairs, delay, port):
+    """Measures concurrent exchange-rate lookups."""
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(delay), port=port, log_level='warning')
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        currency_pairs = list(itertools.permutations(RATES, 2))[:pairs]
+        results = asyncio.run(
+            run(f'http://localhost:{port}', currency_pairs, lookups)
+        )
+    finally:
+        server.should_exit = True
+        thread.join()
+    print(f'{"variant":>12}{"total s":>10}{"requests":>10}')
+    for name, (elapsed, requests) in results.items():
+        print(f'{name:>12}{elapsed:>10.2f}{requests:>10}')
+
+
+if __name__ == '__main__':
+    main()
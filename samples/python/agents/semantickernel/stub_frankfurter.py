@@ -0,0 +1,81 @@
+"""A local stand-in for the Frankfurter API, for offline benchmarks.
+
+It answers GET /latest and GET /YYYY-MM-DD with fixed rates for a few
+currencies, after an optional delay, and GET /stats with the number of rate
+requests served.
+
+run:
+  uv run python stub_frankfurter.py --port 10099 --delay 0.1
+  FRANKFURTER_URL=http://localhost:10099 uv run .
+"""
+
+import asyncio
+import datetime
+
+import click
+import uvicorn
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+# Units of each currency per euro
+RATES = {
+    'EUR': 1.0,
+    'USD': 1.08,
+    'GBP': 0.85,
+    'JPY': 162.5,
+    'KRW': 1480.0,
+    'INR': 90.2,
+}
+
+
+def create_app(delay: float = 0.0) -> Starlette:
+    """Creates the stub API, waiting delay seconds per rate request."""
+    stats = {'requests': 0}
+
+    async def rates(request: Request) -> JSONResponse:
+        stats['requests'] += 1
+        await asyncio.sleep(delay)
+        date = request.path_params['date']
+        if date == 'latest':
+            date = datetime.date.today().isoformat()
+        base = request.query_params.get('from', 'EUR').upper()
+        symbols = request.query_params.get('to')
+        targets = symbols.upper().split(',') if symbols else list(RATES)
+        if base not in RATES:
+            return JSONResponse({'message': 'not found'}, status_code=404)
+        return JSONResponse(
+            {
+                'amount': 1.0,
+                'base': base,
+                'date': date,
+                'rates': {
+                    currency: round(RATES[currency] / RATES[base], 5)
+                    for currency in targets
+                    if currency in RATES and currency != base
+                },
+            }
+        )
+
+    async def get_stats(request: Request) -> JSONResponse:
+        return JSONResponse(stats)
+
+    return Starlette(
+        routes=[Route('/stats', get_stats), Route('/{date}', rates)]
+    )
+
+
+@click.command()
+@click.option('--host', 'host', default='localhost')
+@click.option('--port', 'port', default=10099)
+@click.option('--delay', 'delay', default=0.0, help='Seconds per request.')
+def main(host, port, delay):
+    """Starts the stub Frankfurter API."""
+    uvicorn.run(create_app(delay), host=host, port=port, log_level='warning')
+
+
+if __name__ == '__main__':
+    main()
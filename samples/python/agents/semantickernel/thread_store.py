@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import time
+
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from semantic_kernel.agents import ChatHistoryAgentThread
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    thread: ChatHistoryAgentThread
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class ThreadStore:
+    """Keeps a chat history thread per session.
+
+    Sessions are independent, so turns of different sessions run
+    concurrently, while the turns of one session run one after the other
+    since they append to the same history. Sessions idle for longer than
+    max_idle seconds are evicted, and so are the least recently used ones
+    once more than max_threads are kept. A session in use is never evicted.
+    """
+
+    def __init__(self, max_threads: int = 1000, max_idle: float | None = 3600):
+        self.max_threads = max_threads
+        self.max_idle = max_idle
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._entries
+
+    @asynccontextmanager
+    async def checkout(
+        self, session_id: str
+    ) -> AsyncIterator[ChatHistoryAgentThread]:
+        """Lends the thread of a session, creating it on first use."""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            entry = _Entry(ChatHistoryAgentThread(thread_id=session_id))
+            self._entries[session_id] = entry
+        self._entries.move_to_end(session_id)
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield entry.thread
+        finally:
+            entry.users -= 1
+            entry.last_used = time.monotonic()
+            await self._evict()
+
+    async def clear(self):
+        """Deletes all threads not in use."""
+        for session_id, entry in list(self._entries.items()):
+            if not entry.users:
+                await self._delete(session_id, entry)
+
+    async def _evict(self):
+        now = time.monotonic()
+        overflow = len(self._entries) - self.max_threads
+        # From the least recently used, until the sessions are neither idle
+        # nor too many
+        victims = []
+        for session_id, entry in self._entries.items():
+            if entry.users:
+                continue
+            idle = self.max_idle is not None and (
+                now - entry.last_used > self.max_idle
+            )
+            if not idle and overflow <= 0:
+                break
+            victims.append((session_id, entry))
+            overflow -= 1
+        for session_id, entry in victims:
+            await self._delete(session_id, entry)
+
+    async def _delete(self, session_id: str, entry: _Entry):
+        # The session may have been checked out while a previous thread was
+        # deleted
+        if entry.users or self._entries.get(session_id) is not entry:
+            return
+        del self._entries[session_id]
+        await entry.thread.delete()
+        logger.debug(f'Evicted the thread of session {session_id}')
@@ -3,13 +3,12 @@ from typing import override
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.types import (
-    TaskArtifactUpdateEvent,
     TaskState,
     TaskStatus,
     TaskStatusUpdateEvent,
 )
-from a2a.utils import new_text_artifact
 from agent import TravelPlannerAgent
+from artifact_streamer import ArtifactStreamer
 
 
 class TravelPlannerAgentExecutor(AgentExecutor):
@@ -28,18 +27,16 @@ class TravelPlannerAgentExecutor(AgentExecutor):
         if not context.message:
             raise Exception('No message provided')
 
-        async for event in self.agent.stream(query):
-            message = TaskArtifactUpdateEvent(
-                contextId=context.context_id, # type: ignore
-                taskId=context.task_id, # type: ignore
-                artifact=new_text_artifact(
-                    name='current_result',
-                    text=event['content'],
-                ),
-            )
-            await event_queue.enqueue_event(message)
-            if event['done']:
-                break
+        # Tokens are sent in batches, appended to a single artifact
+        async with ArtifactStreamer(
+            event_queue,
+            context.task_id,  # type: ignore
+            context.context_id,  # type: ignore
+        ) as artifact:
+            async for event in self.agent.stream(query):
+                await artifact.write(event['content'])
+                if event['done']:
+                    break
 
         status = TaskStatusUpdateEvent(
             contextId=context.context_id, # type: ignore
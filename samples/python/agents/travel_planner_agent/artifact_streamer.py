@@ -0,0 +1,104 @@
+import asyncio
+
+from uuid import uuid4
+
+from a2a.server.events import EventQueue
+from a2a.types import Artifact, Part, TaskArtifactUpdateEvent, TextPart
+
+
+class ArtifactStreamer:
+    """Streams text into a single artifact, coalescing small chunks.
+
+    LLMs stream a few characters at a time, and sending each chunk as its own
+    event costs a serialization and an SSE event per token. Text written
+    here is buffered and flushed once max_chars characters are pending or
+    max_delay seconds after the oldest pending chunk, whichever comes first.
+    The first flush creates the artifact, later flushes append to it, and
+    close() flushes the rest with lastChunk set. It only depends on the
+    event queue, so any streaming AgentExecutor can use it:
+
+        async with ArtifactStreamer(event_queue, task_id, context_id) as out:
+            async for token in llm_stream:
+                await out.write(token)
+    """
+
+    def __init__(
+        self,
+        event_queue: EventQueue,
+        task_id: str,
+        context_id: str,
+        name: str = 'current_result',
+        max_chars: int = 256,
+        max_delay: float = 0.05,
+    ):
+        self.event_queue = event_queue
+        self.task_id = task_id
+        self.context_id = context_id
+        self.name = name
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self.artifact_id = str(uuid4())
+        self.events = 0
+        self._buffer: list[str] = []
+        self._pending = 0
+        self._started = False
+        self._closed = False
+        self._timer: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    async def write(self, text: str):
+        if self._closed:
+            raise RuntimeError('ArtifactStreamer is closed')
+        if not text:
+            return
+        self._buffer.append(text)
+        self._pending += len(text)
+        if self._pending >= self.max_chars:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self, last_chunk: bool = False):
+        """Sends the pending text, if any or if it is the last chunk."""
+        if self._timer and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        async with self._lock:
+            if not self._buffer and not last_chunk:
+                return
+            text = ''.join(self._buffer)
+            self._buffer.clear()
+            self._pending = 0
+            await self.event_queue.enqueue_event(
+                TaskArtifactUpdateEvent(
+                    taskId=self.task_id,
+                    contextId=self.context_id,
+                    artifact=Artifact(
+                        artifactId=self.artifact_id,
+                        name=self.name,
+                        parts=[Part(root=TextPart(text=text))],
+                    ),
+                    append=self._started,
+                    lastChunk=last_chunk,
+                )
+            )
+            self._started = True
+            self.events += 1
+
+    async def close(self):
+        """Flushes the remaining text as the last chunk of the artifact."""
+        if self._closed:
+            return
+        self._closed = True
+        await self.flush(last_chunk=True)
+
+    async def _flush_later(self):
+        # Cancelled by flush() if the buffer fills up first
+        await asyncio.sleep(self.max_delay)
+        await self.flush()
+
+    async def __aenter__(self) -> 'ArtifactStreamer':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
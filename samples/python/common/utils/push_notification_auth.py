@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import json
 import logging
@@ -111,12 +112,31 @@ class PushNotificationReceiverAuth(PushNotificationAuth):
     def __init__(self):
         self.public_keys_jwks = []
         self.jwks_client = None
+        self.jwks_url = None
 
     async def load_jwks(self, jwks_url: str):
-        self.jwks_client = PyJWKClient(jwks_url)
+        """Fetches the sender's public keys, raising if they are unavailable.
+
+        Keys are cached by kid, so verifying a notification only goes back to
+        the JWKS endpoint when the sender starts signing with a new key.
+        """
+        self.jwks_url = jwks_url
+        self.jwks_client = PyJWKClient(jwks_url, cache_keys=True)
+        await asyncio.to_thread(self.jwks_client.get_jwk_set)
 
     async def verify_push_notification(self, request: Request) -> bool:
-        auth_header = request.headers.get('Authorization')
+        return await asyncio.to_thread(
+            self.verify,
+            request.headers.get('Authorization'),
+            await request.json(),
+        )
+
+    def verify(self, auth_header: str | None, data: dict[str, Any]) -> bool:
+        """Verifies the token signing an already parsed notification body.
+
+        This may fetch keys and does the RSA check, so call it off the event
+        loop.
+        """
         if not auth_header or not auth_header.startswith(AUTH_HEADER_PREFIX):
             print('Invalid authorization header')
             return False
@@ -131,9 +151,7 @@ class PushNotificationReceiverAuth(PushNotificationAuth):
             algorithms=['RS256'],
         )
 
-        actual_body_sha256 = self._calculate_request_body_sha256(
-            await request.json()
-        )
+        actual_body_sha256 = self._calculate_request_body_sha256(data)
         if actual_body_sha256 != decode_token['request_body_sha256']:
             # Payload signature does not match the digest in signed token.
             raise ValueError('Invalid request body')
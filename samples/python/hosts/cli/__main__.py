@@ -1,7 +1,8 @@
 import asyncio
-import base64
-import os
+import json
 import urllib
+
+from pathlib import Path
 from uuid import uuid4
 
 import asyncclick as click
@@ -9,24 +10,22 @@ import httpx
 
 from a2a.client import A2ACardResolver, A2AClient
 from a2a.types import (
-    FilePart,
-    FileWithBytes,
     GetTaskRequest,
     JSONRPCErrorResponse,
     Message,
-    MessageSendConfiguration,
-    MessageSendParams,
     Part,
-    SendMessageRequest,
-    SendStreamingMessageRequest,
-    Task,
-    TaskArtifactUpdateEvent,
     TaskQueryParams,
-    TaskState,
-    TaskStatusUpdateEvent,
     TextPart,
 )
 from common.utils.push_notification_auth import PushNotificationReceiverAuth
+from hosts.cli.bench import (
+    BENCH_MODES,
+    PushNotificationWaiter,
+    read_prompts,
+    run_bench,
+)
+from hosts.cli.file_upload import DEFAULT_INLINE_LIMIT, create_file_part
+from hosts.cli.task_runner import TaskRun, TaskRunner
 
 
 @click.command()
@@ -36,7 +35,40 @@ from common.utils.push_notification_auth import PushNotificationReceiverAuth
 @click.option('--history', default=False)
 @click.option('--use_push_notifications', default=False)
 @click.option('--push_notification_receiver', default='http://localhost:5000')
+@click.option(
+    '--push_notification_workers',
+    default=1,
+    help='Processes receiving push notifications.',
+)
 @click.option('--header', multiple=True)
+@click.option(
+    '--file_upload_url',
+    help='Endpoint large attachments are streamed to and sent by reference.',
+)
+@click.option(
+    '--inline_file_limit',
+    default=DEFAULT_INLINE_LIMIT,
+    help='Largest attachment in bytes sent inline in the message.',
+)
+@click.option(
+    '--bench',
+    type=click.Path(exists=True, dir_okay=False),
+    help='Replay the prompts in this file, one per line, and report timings.',
+)
+@click.option(
+    '--bench_mode',
+    type=click.Choice(['auto', *BENCH_MODES]),
+    default='auto',
+    help='auto streams if the agent supports it.',
+)
+@click.option('--bench_concurrency', default=4, help='Tasks in flight.')
+@click.option('--bench_repeat', default=1, help='Times to replay the file.')
+@click.option(
+    '--bench_timeout',
+    default=300.0,
+    help='Seconds to wait for a pushed final state.',
+)
+@click.option('--bench_output', help='Write the JSON report to this file.')
 async def cli(
     agent,
     bearer_token,
@@ -44,7 +76,16 @@ async def cli(
     history,
     use_push_notifications: bool,
     push_notification_receiver: str,
+    push_notification_workers: int,
     header,
+    file_upload_url: str | None,
+    inline_file_limit: int,
+    bench: str | None,
+    bench_mode: str,
+    bench_concurrency: int,
+    bench_repeat: int,
+    bench_timeout: float,
+    bench_output: str | None,
 ):
     headers = {h.split('=')[0]: h.split('=')[1] for h in header}
     if bearer_token:
@@ -63,176 +104,229 @@ async def cli(
         notification_receiver_host = notif_receiver_parsed.hostname
         notification_receiver_port = notif_receiver_parsed.port
 
+        if bench_mode == 'auto':
+            bench_mode = (
+                'streaming' if card.capabilities.streaming else 'non-streaming'
+            )
+        if bench and bench_mode == 'push':
+            use_push_notifications = True
+        push_waiter = None
+        consumer = None
         if use_push_notifications:
             from hosts.cli.push_notification_listener import (
                 PushNotificationListener,
             )
 
             notification_receiver_auth = PushNotificationReceiverAuth()
-            await notification_receiver_auth.load_jwks(
-                f'{agent}/.well-known/jwks.json'
-            )
-
+            try:
+                await notification_receiver_auth.load_jwks(
+                    f'{agent}/.well-known/jwks.json'
+                )
+            except Exception as e:
+                if not bench:
+                    raise
+                # Agents built on the a2a-sdk do not sign their notifications
+                print(f'Push notifications will not be verified: {e}')
+                notification_receiver_auth = None
             push_notification_listener = PushNotificationListener(
                 host=notification_receiver_host,
                 port=notification_receiver_port,
                 notification_receiver_auth=notification_receiver_auth,
+                workers=push_notification_workers,
             )
+            if bench:
+                push_waiter = PushNotificationWaiter(bench_timeout)
+                consumer = asyncio.create_task(
+                    push_waiter.consume(push_notification_listener.subscribe())
+                )
             push_notification_listener.start()
 
         client = A2AClient(httpx_client, agent_card=card)
+        push_notification_url = None
+        if use_push_notifications:
+            push_notification_url = f'http://{notification_receiver_host}:{notification_receiver_port}/notify'
 
-        continue_loop = True
-        streaming = card.capabilities.streaming
-        context_id = session if session > 0 else uuid4().hex
+        if bench:
+            report = await run_bench(
+                client,
+                read_prompts(bench),
+                bench_mode,
+                bench_concurrency,
+                bench_repeat,
+                push_notification_url,
+                push_waiter,
+            )
+            if consumer:
+                consumer.cancel()
+            report_json = json.dumps(report, indent=2)
+            if bench_output:
+                Path(bench_output).write_text(report_json, encoding='utf-8')
+            print(report_json)
+            return
+
+        runner = TaskRunner(
+            client, card.capabilities.streaming, push_notification_url
+        )
+        context_id = str(session) if session > 0 else uuid4().hex
+        # Background tasks by label, and those waiting for a reply
+        running: dict[str, asyncio.Task] = {}
+        waiting: dict[str, TaskRun] = {}
+        count = 0
+
+        print(
+            'End a message with & to run its task in the background, :tasks'
+            ' lists background tasks and :reply <label> <text> answers one'
+            ' waiting for input.'
+        )
+        while True:
+            prompt = await ask(
+                '\nWhat do you want to send to the agent? (:q or quit to exit)'
+            )
+            if prompt == ':q' or prompt == 'quit':
+                break
+            if prompt == ':tasks':
+                for label in running:
+                    print(f'[{label}] running')
+                for label, run in waiting.items():
+                    print(f'[{label}] waiting for input, task {run.task_id}')
+                continue
+            task_id = None
+            if prompt.startswith(':reply '):
+                _, label, prompt = [*prompt.split(' ', 2), ''][:3]
+                if label not in waiting:
+                    print(f'No task {label} is waiting for input')
+                    continue
+                task_id = waiting.pop(label).task_id
+                background = True
+            else:
+                count += 1
+                label = f'task-{count}'
+                background = prompt.endswith('&')
+                prompt = prompt.removesuffix('&').strip()
 
-        while continue_loop:
-            print('=========  starting a new task ======== ')
-            continue_loop, _, taskId = await completeTask(
+            message = await create_message(
                 client,
-                streaming,
-                use_push_notifications,
-                notification_receiver_host,
-                notification_receiver_port,
-                None,
+                prompt,
+                task_id,
                 context_id,
+                file_upload_url,
+                inline_file_limit,
             )
+            conversation = complete_task(
+                runner,
+                message,
+                label,
+                history,
+                interactive=not background,
+                file_upload_url=file_upload_url,
+                inline_file_limit=inline_file_limit,
+            )
+            if not background:
+                print(f'=========  starting {label} ======== ')
+                await conversation
+                continue
 
-            if history and continue_loop:
-                print('========= history ======== ')
-                task_response = await client.get_task(
-                    {'id': taskId, 'historyLength': 10}
-                )
-                print(
-                    task_response.model_dump_json(
-                        include={'result': {'history': True}}
-                    )
-                )
+            async def run_in_background(label, conversation):
+                try:
+                    run = await conversation
+                    if run.needs_input:
+                        waiting[label] = run
+                        print(
+                            f'[{label}] needs input, answer with'
+                            f' :reply {label} <text>'
+                        )
+                finally:
+                    running.pop(label, None)
 
+            print(f'=========  starting {label} in the background ======== ')
+            running[label] = asyncio.create_task(
+                run_in_background(label, conversation)
+            )
 
-async def completeTask(
-    client: A2AClient,
-    streaming,
-    use_push_notifications: bool,
-    notification_receiver_host: str,
-    notification_receiver_port: int,
-    taskId,
-    contextId,
-):
-    prompt = click.prompt(
-        '\nWhat do you want to send to the agent? (:q or quit to exit)'
-    )
-    if prompt == ':q' or prompt == 'quit':
-        return False, None, None
+        for background_task in running.values():
+            background_task.cancel()
+        await asyncio.gather(*running.values(), return_exceptions=True)
+
+
+async def ask(text: str, **kwargs) -> str:
+    """Prompts without blocking the background tasks."""
+    return await asyncio.to_thread(click.prompt, text, **kwargs)
 
+
+async def create_message(
+    client: A2AClient,
+    prompt: str,
+    task_id: str | None,
+    context_id: str,
+    file_upload_url: str | None = None,
+    inline_file_limit: int = DEFAULT_INLINE_LIMIT,
+) -> Message:
+    """Builds the next message, asking for an optional attachment."""
     message = Message(
         role='user',
         parts=[TextPart(text=prompt)],
         messageId=str(uuid4()),
-        taskId=taskId,
-        contextId=contextId,
+        taskId=task_id,
+        contextId=context_id,
     )
 
-    file_path = click.prompt(
+    file_path = await ask(
         'Select a file path to attach? (press enter to skip)',
         default='',
         show_default=False,
     )
     if file_path and file_path.strip() != '':
-        with open(file_path, 'rb') as f:
-            file_content = base64.b64encode(f.read()).decode('utf-8')
-            file_name = os.path.basename(file_path)
-
-        message.parts.append(
-            Part(
-                root=FilePart(
-                    file=FileWithBytes(name=file_name, bytes=file_content)
-                )
-            )
+        file_part = await create_file_part(
+            client.httpx_client,
+            file_path.strip(),
+            file_upload_url,
+            inline_file_limit,
         )
+        message.parts.append(Part(root=file_part))
+    return message
 
-    payload = MessageSendParams(
-        id=str(uuid4()),
-        message=message,
-        configuration=MessageSendConfiguration(
-            acceptedOutputModes=['text'],
-        ),
-    )
-
-    if use_push_notifications:
-        payload['pushNotification'] = {
-            'url': f'http://{notification_receiver_host}:{notification_receiver_port}/notify',
-            'authentication': {
-                'schemes': ['bearer'],
-            },
-        }
 
-    taskResult = None
-    message = None
-    task_completed = False
-    if streaming:
-        response_stream = client.send_message_streaming(
-            SendStreamingMessageRequest(
-                id=str(uuid4()),
-                params=payload,
-            )
+async def complete_task(
+    runner: TaskRunner,
+    message: Message,
+    label: str,
+    history: bool,
+    interactive: bool = True,
+    file_upload_url: str | None = None,
+    inline_file_limit: int = DEFAULT_INLINE_LIMIT,
+) -> TaskRun:
+    """Runs a task, answering its requests for input while interactive."""
+    while True:
+        run = await runner.run(message, label)
+        print_run(run)
+        if history and run.task_id:
+            await print_history(runner.client, run.task_id)
+        if not (interactive and run.needs_input):
+            return run
+        prompt = await ask(f'[{label}] The agent needs more input')
+        message = await create_message(
+            runner.client,
+            prompt,
+            run.task_id,
+            run.context_id,
+            file_upload_url,
+            inline_file_limit,
         )
-        async for result in response_stream:
-            if isinstance(result.root, JSONRPCErrorResponse):
-                print(f'Error: {result.root.error}, contextId: {contextId}, taskId: {taskId}')
-                return False, contextId, taskId
-            event = result.root.result
-            contextId = event.contextId
-            if isinstance(event, Task):
-                taskId = event.id
-            elif isinstance(event, TaskStatusUpdateEvent) or isinstance(
-                event, TaskArtifactUpdateEvent
-            ):
-                taskId = event.taskId
-                if isinstance(event, TaskStatusUpdateEvent) and event.status.state == 'completed':
-                    task_completed = True
-            elif isinstance(event, Message):
-                message = event
-            print(f'stream event => {event.model_dump_json(exclude_none=True)}')
-        # Upon completion of the stream. Retrieve the full task if one was made.
-        if taskId and not task_completed:
-            taskResultResponse = await client.get_task(
-                GetTaskRequest(
-                    id=str(uuid4()),
-                    params=TaskQueryParams(id=taskId),
-                )
-            )
-            if isinstance(taskResultResponse.root, JSONRPCErrorResponse):
-                print(f'Error: {taskResultResponse.root.error}, contextId: {contextId}, taskId: {taskId}')
-                return False, contextId, taskId
-            taskResult = taskResultResponse.root.result
-    else:
-        try:
-            # For non-streaming, assume the response is a task or message.
-            event = await client.send_message(
-                SendMessageRequest(
-                    id=str(uuid4()),
-                    params=payload,
-                )
-            )
-            event = event.root.result
-        except Exception as e:
-            print('Failed to complete the call', e)
-        if not contextId:
-            contextId = event.contextId
-        if isinstance(event, Task):
-            if not taskId:
-                taskId = event.id
-            taskResult = event
-        elif isinstance(event, Message):
-            message = event
 
-    if message:
-        print(f'\n{message.model_dump_json(exclude_none=True)}')
-        return True, contextId, taskId
-    if taskResult:
+
+def print_run(run: TaskRun):
+    """Prints the outcome and timings of a task run."""
+    prefix = f'[{run.label}] '
+    if run.error:
+        print(
+            f'{prefix}Error: {run.error}, contextId: {run.context_id},'
+            f' taskId: {run.task_id}'
+        )
+    elif run.message:
+        print(f'\n{prefix}{run.message.model_dump_json(exclude_none=True)}')
+    elif run.task:
         # Don't print the contents of a file.
-        task_content = taskResult.model_dump_json(
+        task_content = run.task.model_dump_json(
             exclude={
                 'history': {
                     '__all__': {
@@ -244,23 +338,31 @@ async def completeTask(
             },
             exclude_none=True,
         )
-        print(f'\n{task_content}')
-        ## if the result is that more input is required, loop again.
-        state = TaskState(taskResult.status.state)
-        if state.name == TaskState.input_required.name:
-            return await completeTask(
-                client,
-                streaming,
-                use_push_notifications,
-                notification_receiver_host,
-                notification_receiver_port,
-                taskId,
-                contextId,
-            ), contextId, taskId
-        ## task is complete
-        return True, contextId, taskId
-    ## Failure case, shouldn't reach
-    return True, contextId, taskId
+        print(f'\n{prefix}{task_content}')
+    print(
+        f'{prefix}{run.events} events in {run.duration:.2f}s'
+        + (
+            f', first after {run.time_to_first_event * 1000:.0f}ms'
+            if run.time_to_first_event is not None
+            else ''
+        )
+        + (f', {run.reconnects} reconnects' if run.reconnects else '')
+    )
+
+
+async def print_history(client: A2AClient, task_id: str):
+    """Prints the last messages of the task."""
+    print('========= history ======== ')
+    task_response = await client.get_task(
+        GetTaskRequest(
+            id=str(uuid4()),
+            params=TaskQueryParams(id=task_id, historyLength=10),
+        )
+    )
+    if isinstance(task_response.root, JSONRPCErrorResponse):
+        print(f'Error: {task_response.root.error}')
+        return
+    print(task_response.root.result.model_dump_json(include={'history': True}))
 
 
 if __name__ == '__main__':
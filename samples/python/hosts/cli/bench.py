@@ -0,0 +1,164 @@
+import asyncio
+import collections
+import statistics
+import time
+
+from pathlib import Path
+from uuid import uuid4
+
+from a2a.client import A2AClient
+from a2a.types import Message, Task, TaskState, TextPart
+
+from hosts.cli.task_runner import TERMINAL_STATES, TaskRun, TaskRunner
+
+
+BENCH_MODES = ('streaming', 'non-streaming', 'push')
+# Final states in which the agent did not do what was asked
+FAILED_STATES = (TaskState.canceled, TaskState.failed, TaskState.rejected)
+
+
+class PushNotificationWaiter:
+    """Hands the final task pushed by the agent to the run waiting for it.
+
+    consume() reads the notifications subscribed from the listener. A
+    notification may arrive before the response that told us the task id,
+    hence the future is created by whichever side comes first.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._finals: dict[str, asyncio.Future[Task]] = {}
+
+    async def consume(self, notifications: asyncio.Queue):
+        while True:
+            data = await notifications.get()
+            try:
+                task = Task.model_validate(data)
+            except ValueError as e:
+                print(f'Ignoring push notification that is not a task: {e}')
+                continue
+            if task.status.state not in TERMINAL_STATES:
+                continue
+            final = self._final(task.id)
+            if not final.done():
+                final.set_result(task)
+
+    def _final(self, task_id: str) -> asyncio.Future[Task]:
+        if task_id not in self._finals:
+            self._finals[task_id] = asyncio.get_running_loop().create_future()
+        return self._finals[task_id]
+
+    async def wait(self, task_id: str) -> Task:
+        try:
+            return await asyncio.wait_for(self._final(task_id), self.timeout)
+        finally:
+            self._finals.pop(task_id, None)
+
+
+def read_prompts(path: str | Path) -> list[str]:
+    """Reads one prompt per line, skipping blank lines."""
+    lines = Path(path).read_text(encoding='utf-8').splitlines()
+    return [line.strip() for line in lines if line.strip()]
+
+
+def _percentiles(values: list[float]) -> dict[str, float] | None:
+    if not values:
+        return None
+    values_ms = [v * 1000 for v in values]
+    if len(values_ms) > 1:
+        q = statistics.quantiles(values_ms, n=100, method='inclusive')
+        p50, p95, p99 = q[49], q[94], q[98]
+    else:
+        p50 = p95 = p99 = values_ms[0]
+    return {
+        'mean': round(statistics.fmean(values_ms), 2),
+        'p50': round(p50, 2),
+        'p95': round(p95, 2),
+        'p99': round(p99, 2),
+        'max': round(max(values_ms), 2),
+    }
+
+
+def summarize(runs: list[TaskRun], elapsed: float) -> dict:
+    """Aggregates the runs of a benchmark into a JSON friendly report."""
+    errors = collections.Counter()
+    states = collections.Counter()
+    for run in runs:
+        if run.state:
+            states[run.state.value] += 1
+        if run.error_type:
+            errors[run.error_type] += 1
+        elif run.state in FAILED_STATES:
+            errors[f'task {run.state.value}'] += 1
+    succeeded = len(runs) - sum(errors.values())
+    return {
+        'requests': len(runs),
+        'succeeded': succeeded,
+        'failed': len(runs) - succeeded,
+        'duration_s': round(elapsed, 3),
+        'throughput_rps': round(len(runs) / elapsed, 2) if elapsed else None,
+        'time_to_first_event_ms': _percentiles(
+            [r.time_to_first_event for r in runs if r.first_event_at]
+        ),
+        'time_to_final_ms': _percentiles(
+            [r.duration for r in runs if not r.error_type]
+        ),
+        'events_per_request': round(
+            statistics.fmean([r.events for r in runs]), 2
+        )
+        if runs
+        else None,
+        'reconnects': sum(r.reconnects for r in runs),
+        'states': dict(states),
+        'errors': dict(errors),
+    }
+
+
+async def run_bench(
+    client: A2AClient,
+    prompts: list[str],
+    mode: str,
+    concurrency: int,
+    repeat: int = 1,
+    push_notification_url: str | None = None,
+    push_waiter: PushNotificationWaiter | None = None,
+) -> dict:
+    """Replays the prompts against the agent and reports the timings.
+
+    Every prompt starts a new task in its own context. At most concurrency
+    tasks are in flight at a time, and the prompt list is replayed repeat
+    times.
+    """
+    runner = TaskRunner(
+        client,
+        streaming=mode == 'streaming',
+        push_notification_url=push_notification_url,
+        wait_for_push=push_waiter.wait if push_waiter else None,
+        verbose=False,
+    )
+    queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+    for i, prompt in enumerate(prompts * repeat):
+        queue.put_nowait((i, prompt))
+    runs: list[TaskRun] = []
+
+    async def worker():
+        while not queue.empty():
+            i, prompt = queue.get_nowait()
+            message = Message(
+                role='user',
+                parts=[TextPart(text=prompt)],
+                messageId=str(uuid4()),
+                contextId=uuid4().hex,
+            )
+            runs.append(await runner.run(message, f'bench-{i}'))
+
+    start = time.monotonic()
+    await asyncio.gather(
+        *(worker() for _ in range(min(concurrency, queue.qsize())))
+    )
+    return {
+        'agent': client.url,
+        'mode': mode,
+        'concurrency': concurrency,
+        **summarize(runs, time.monotonic() - start),
+    }
@@ -0,0 +1,88 @@
+import asyncio
+import base64
+import mimetypes
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+from uuid import uuid4
+
+import httpx
+
+from a2a.types import FilePart, FileWithBytes, FileWithUri
+
+
+# Files up to this size are sent inline, base64 encoded in the request body.
+DEFAULT_INLINE_LIMIT = 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+
+async def read_chunks(
+    path: Path, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Reads a file chunk by chunk without blocking the event loop."""
+    with path.open('rb') as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+
+
+async def upload_file(
+    http_client: httpx.AsyncClient, upload_url: str, path: Path
+) -> str:
+    """Streams a file to the upload endpoint and returns its URI.
+
+    The file is sent with a PUT to <upload_url>/<id>/<file name>. The endpoint
+    may answer with a JSON body holding a 'uri' or a Location header pointing
+    at the stored file, otherwise the URL it was uploaded to is used.
+    """
+    url = f'{upload_url.rstrip("/")}/{uuid4().hex}/{path.name}'
+    size = (await asyncio.to_thread(path.stat)).st_size
+    response = await http_client.put(
+        url,
+        content=read_chunks(path),
+        headers={
+            'Content-Length': str(size),
+            'Content-Type': mimetypes.guess_type(path)[0]
+            or 'application/octet-stream',
+        },
+        # Large uploads can take longer than the client wide timeout.
+        timeout=httpx.Timeout(30, write=None),
+    )
+    response.raise_for_status()
+    if response.headers.get('content-type', '').startswith('application/json'):
+        uri = response.json().get('uri')
+        if uri:
+            return uri
+    return response.headers.get('location', url)
+
+
+async def create_file_part(
+    http_client: httpx.AsyncClient,
+    path: str | Path,
+    upload_url: str | None = None,
+    inline_limit: int = DEFAULT_INLINE_LIMIT,
+) -> FilePart:
+    """Creates the part attaching a file to a message.
+
+    Small files are embedded in the message. When an upload endpoint is
+    configured, files larger than inline_limit are streamed to upload_url and
+    referenced by URI, so neither side has to hold a base64 copy of them in
+    memory. Without one, every file is embedded.
+    """
+    path = Path(path)
+    file_name = path.name
+    mime_type = mimetypes.guess_type(path)[0]
+    if upload_url:
+        size = (await asyncio.to_thread(path.stat)).st_size
+        if size > inline_limit:
+            uri = await upload_file(http_client, upload_url, path)
+            print(f'Uploaded {file_name} to {uri}')
+            return FilePart(
+                file=FileWithUri(name=file_name, uri=uri, mimeType=mime_type)
+            )
+    file_bytes = await asyncio.to_thread(path.read_bytes)
+    file_content = base64.b64encode(file_bytes).decode('utf-8')
+    return FilePart(
+        file=FileWithBytes(
+            name=file_name, bytes=file_content, mimeType=mime_type
+        )
+    )
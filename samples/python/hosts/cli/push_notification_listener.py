@@ -1,23 +1,120 @@
 import asyncio
+import json
+import multiprocessing
+import socket
 import threading
 import traceback
 
+from collections.abc import Callable
+
+import uvicorn
+
 from common.utils.push_notification_auth import PushNotificationReceiverAuth
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.routing import Route
+
+
+def create_app(
+    notification_receiver_auth: PushNotificationReceiverAuth | None,
+    forward: Callable[[dict], None],
+) -> Starlette:
+    """Builds the app receiving push notifications.
+
+    The body of a notification is read and parsed once, and its signature is
+    checked on a worker thread so the event loop keeps accepting requests.
+    Verified notifications are passed to forward. Without a receiver auth,
+    notifications are accepted unverified.
+    """
+
+    async def handle_notification(request: Request):
+        try:
+            data = json.loads(await request.body())
+        except ValueError:
+            return Response(status_code=400)
+        if notification_receiver_auth:
+            try:
+                verified = await asyncio.to_thread(
+                    notification_receiver_auth.verify,
+                    request.headers.get('Authorization'),
+                    data,
+                )
+            except Exception as e:
+                print(f'error verifying push notification: {e}')
+                print(traceback.format_exc())
+                verified = False
+            if not verified:
+                print('push notification verification failed')
+                return Response(status_code=401)
+        forward(data)
+        return Response(status_code=200)
+
+    async def handle_validation_check(request: Request):
+        validation_token = request.query_params.get('validationToken')
+        print(
+            f'\npush notification verification received => \n{validation_token}\n'
+        )
+
+        if not validation_token:
+            return Response(status_code=400)
+
+        return Response(content=validation_token, status_code=200)
+
+    return Starlette(
+        routes=[
+            Route('/notify', handle_notification, methods=['POST']),
+            Route('/notify', handle_validation_check, methods=['GET']),
+        ]
+    )
+
+
+def _run_worker(
+    sock: socket.socket,
+    jwks_url: str | None,
+    notifications: multiprocessing.Queue,
+):
+    """Serves notifications in a worker process, sending them to the parent."""
+    notification_receiver_auth = None
+    if jwks_url:
+        notification_receiver_auth = PushNotificationReceiverAuth()
+        asyncio.run(notification_receiver_auth.load_jwks(jwks_url))
+    app = create_app(notification_receiver_auth, notifications.put)
+    server = uvicorn.Server(uvicorn.Config(app, log_level='critical'))
+    server.run(sockets=[sock])
 
 
 class PushNotificationListener:
+    """Receives push notifications in the background.
+
+    With a single worker the server runs on its own thread, since the current
+    thread is blocked waiting on user prompts. With more workers it runs in
+    that many processes sharing the port, and verified notifications are
+    sent back to this process. Either way every notification is passed to
+    on_notification, if set, and put on the queue of every subscriber.
+    """
+
     def __init__(
         self,
         host,
         port,
-        notification_receiver_auth: PushNotificationReceiverAuth,
+        notification_receiver_auth: PushNotificationReceiverAuth | None,
+        on_notification: Callable[[dict], None] | None = None,
+        workers: int = 1,
     ):
         self.host = host
         self.port = port
+        # Notifications are accepted unverified without a receiver auth
         self.notification_receiver_auth = notification_receiver_auth
+        # Called from a listener thread with every accepted notification
+        self.on_notification = on_notification
+        self.workers = workers
+        self._subscribers: list[
+            tuple[asyncio.Queue, asyncio.AbstractEventLoop]
+        ] = []
+        self._lock = threading.Lock()
+        self._processes: list[multiprocessing.Process] = []
+        self._notifications: multiprocessing.Queue | None = None
         self.loop = asyncio.new_event_loop()
         self.thread = threading.Thread(
             target=lambda loop: loop.run_forever(), args=(self.loop,)
@@ -25,58 +122,91 @@ class PushNotificationListener:
         self.thread.daemon = True
         self.thread.start()
 
+    def subscribe(self, maxsize: int = 0) -> asyncio.Queue:
+        """Returns a queue receiving notifications on the running loop."""
+        subscriber = asyncio.Queue(maxsize)
+        with self._lock:
+            self._subscribers.append((subscriber, asyncio.get_running_loop()))
+        return subscriber
+
+    def unsubscribe(self, subscriber: asyncio.Queue):
+        with self._lock:
+            self._subscribers = [
+                s for s in self._subscribers if s[0] is not subscriber
+            ]
+
     def start(self):
         try:
-            # Need to start server in separate thread as current thread
-            # will be blocked when it is waiting on user prompt.
-            asyncio.run_coroutine_threadsafe(
-                self.start_server(),
-                self.loop,
-            )
+            if self.workers > 1:
+                self._start_workers()
+            else:
+                asyncio.run_coroutine_threadsafe(
+                    self.start_server(),
+                    self.loop,
+                )
             print('======= push notification listener started =======')
         except Exception as e:
             print(e)
 
     async def start_server(self):
-        import uvicorn
-
-        self.app = Starlette()
-        self.app.add_route(
-            '/notify', self.handle_notification, methods=['POST']
-        )
-        self.app.add_route(
-            '/notify', self.handle_validation_check, methods=['GET']
-        )
-
+        self.app = create_app(self.notification_receiver_auth, self._publish)
         config = uvicorn.Config(
             self.app, host=self.host, port=self.port, log_level='critical'
         )
         self.server = uvicorn.Server(config)
         await self.server.serve()
 
-    async def handle_validation_check(self, request: Request):
-        validation_token = request.query_params.get('validationToken')
-        print(
-            f'\npush notification verification received => \n{validation_token}\n'
+    def stop(self):
+        for process in self._processes:
+            process.terminate()
+        if self._notifications:
+            self._notifications.put(None)
+
+    def _start_workers(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.set_inheritable(True)
+        context = multiprocessing.get_context('spawn')
+        self._notifications = context.Queue()
+        jwks_url = (
+            self.notification_receiver_auth.jwks_url
+            if self.notification_receiver_auth
+            else None
         )
+        for _ in range(self.workers):
+            process = context.Process(
+                target=_run_worker,
+                args=(sock, jwks_url, self._notifications),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+        threading.Thread(target=self._drain_workers, daemon=True).start()
 
-        if not validation_token:
-            return Response(status_code=400)
+    def _drain_workers(self):
+        while True:
+            try:
+                data = self._notifications.get()
+            except (EOFError, OSError):
+                return
+            if data is None:
+                return
+            self._publish(data)
 
-        return Response(content=validation_token, status_code=200)
+    def _publish(self, data: dict):
+        if self.on_notification:
+            self.on_notification(data)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        if not (subscribers or self.on_notification):
+            print(f'\npush notification received => \n{data}\n')
+        for subscriber, loop in subscribers:
+            loop.call_soon_threadsafe(self._put, subscriber, data)
 
-    async def handle_notification(self, request: Request):
-        data = await request.json()
+    @staticmethod
+    def _put(subscriber: asyncio.Queue, data: dict):
         try:
-            if not await self.notification_receiver_auth.verify_push_notification(
-                request
-            ):
-                print('push notification verification failed')
-                return None
-        except Exception as e:
-            print(f'error verifying push notification: {e}')
-            print(traceback.format_exc())
-            return None
-
-        print(f'\npush notification received => \n{data}\n')
-        return Response(status_code=200)
+            subscriber.put_nowait(data)
+        except asyncio.QueueFull:
+            print('push notification dropped, subscriber queue is full')
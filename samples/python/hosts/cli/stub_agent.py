@@ -0,0 +1,166 @@
+"""A minimal A2A agent to benchmark clients against.
+
+It echoes every prompt back as a task: a working status, the prompt split
+into a number of artifacts with a fixed delay before each, and a completed
+status. Prompts containing 'fail' end in a failed task. There is no
+model behind it, so runs are reproducible and measure the client and the A2A
+server stack only.
+
+It also accepts the large attachments the CLI uploads with --file_upload_url:
+a PUT to /files/<id>/<name> stores the file and a GET serves it back.
+
+run:
+  uv run python -m hosts.cli.stub_agent --port 10099 --delay 0.05
+"""
+
+import asyncio
+import tempfile
+
+from pathlib import Path
+
+import asyncclick as click
+import httpx
+import uvicorn
+
+from starlette.requests import Request
+from starlette.responses import FileResponse, JSONResponse, Response
+from starlette.routing import Route
+
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import (
+    InMemoryPushNotifier,
+    InMemoryTaskStore,
+    TaskUpdater,
+)
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    AgentSkill,
+    Part,
+    TaskState,
+    TextPart,
+)
+from a2a.utils import new_agent_text_message, new_task
+
+
+class StubAgentExecutor(AgentExecutor):
+    """Echoes the prompt back in chunks."""
+
+    def __init__(self, delay: float, chunks: int):
+        self.delay = delay
+        self.chunks = chunks
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue):
+        task = context.current_task
+        if not task:
+            task = new_task(context.message)
+            await event_queue.enqueue_event(task)
+        updater = TaskUpdater(event_queue, task.id, task.contextId)
+        await updater.update_status(TaskState.working)
+        prompt = context.get_user_input()
+        size = max(1, -(-len(prompt) // self.chunks))
+        for i in range(self.chunks):
+            await asyncio.sleep(self.delay)
+            await updater.add_artifact(
+                [Part(root=TextPart(text=prompt[i * size : (i + 1) * size]))],
+                name=f'echo-{i}',
+            )
+        if 'fail' in prompt:
+            await updater.failed(
+                new_agent_text_message('Failed on purpose', task.contextId)
+            )
+        else:
+            await updater.complete()
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue):
+        raise NotImplementedError('cancel not supported')
+
+
+def file_routes(directory: Path) -> list[Route]:
+    """Routes storing uploaded files in directory and serving them back."""
+
+    def file_path(request: Request) -> Path | None:
+        upload_id = request.path_params['upload_id']
+        name = request.path_params['name']
+        if not upload_id.isalnum() or name in ('.', '..'):
+            return None
+        return directory / upload_id / name
+
+    async def put_file(request: Request) -> Response:
+        path = file_path(request)
+        if path is None:
+            return Response(status_code=400)
+        path.parent.mkdir(exist_ok=True)
+        # Written chunk by chunk, so large files are never held in memory
+        with path.open('wb') as f:
+            async for chunk in request.stream():
+                await asyncio.to_thread(f.write, chunk)
+        uri = str(request.url)
+        return JSONResponse(
+            {'uri': uri}, status_code=201, headers={'Location': uri}
+        )
+
+    async def get_file(request: Request) -> Response:
+        path = file_path(request)
+        if path is None or not path.is_file():
+            return Response(status_code=404)
+        return FileResponse(path)
+
+    return [
+        Route('/files/{upload_id}/{name}', put_file, methods=['PUT']),
+        Route('/files/{upload_id}/{name}', get_file, methods=['GET']),
+    ]
+
+
+@click.command()
+@click.option('--host', default='localhost')
+@click.option('--port', default=10099)
+@click.option('--delay', default=0.05, help='Seconds before each chunk.')
+@click.option('--chunks', default=3, help='Artifacts per task.')
+@click.option('--streaming/--no-streaming', default=True)
+async def main(host, port, delay, chunks, streaming):
+    card = AgentCard(
+        name='Stub Agent',
+        description='Echoes prompts back, for benchmarking A2A clients.',
+        url=f'http://{host}:{port}/',
+        version='1.0.0',
+        defaultInputModes=['text'],
+        defaultOutputModes=['text'],
+        capabilities=AgentCapabilities(
+            streaming=streaming, pushNotifications=True
+        ),
+        skills=[
+            AgentSkill(
+                id='echo',
+                name='Echo',
+                description='Echoes the prompt back.',
+                tags=['echo'],
+            )
+        ],
+    )
+    async with (
+        httpx.AsyncClient() as httpx_client,
+        tempfile.TemporaryDirectory() as files_dir,
+    ):
+        handler = DefaultRequestHandler(
+            agent_executor=StubAgentExecutor(delay, chunks),
+            task_store=InMemoryTaskStore(),
+            push_notifier=InMemoryPushNotifier(httpx_client),
+        )
+        app = A2AStarletteApplication(agent_card=card, http_handler=handler)
+        server = uvicorn.Server(
+            uvicorn.Config(
+                app.build(routes=file_routes(Path(files_dir))),
+                host=host,
+                port=port,
+                log_level='warning',
+            )
+        )
+        await server.serve()
+
+
+if __name__ == '__main__':
+    main()
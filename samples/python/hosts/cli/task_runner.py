@@ -0,0 +1,319 @@
+import asyncio
+import dataclasses
+import json
+import random
+import time
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from uuid import uuid4
+
+import httpx
+
+from a2a.client import A2AClient, A2AClientError, A2AClientHTTPError
+from a2a.types import (
+    GetTaskRequest,
+    JSONRPCErrorResponse,
+    Message,
+    MessageSendConfiguration,
+    MessageSendParams,
+    PushNotificationAuthenticationInfo,
+    PushNotificationConfig,
+    SendMessageRequest,
+    SendStreamingMessageRequest,
+    SendStreamingMessageResponse,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskIdParams,
+    TaskQueryParams,
+    TaskResubscriptionRequest,
+    TaskState,
+    TaskStatusUpdateEvent,
+)
+from httpx_sse import SSEError, aconnect_sse
+
+
+TERMINAL_STATES = (
+    TaskState.completed,
+    TaskState.canceled,
+    TaskState.failed,
+    TaskState.rejected,
+)
+# States in which the agent is waiting for the client
+INTERRUPTED_STATES = (TaskState.input_required, TaskState.auth_required)
+
+
+@dataclasses.dataclass
+class TaskRun:
+    """Outcome and timings of one message exchange with the agent."""
+
+    label: str
+    context_id: str | None
+    task_id: str | None = None
+    task: Task | None = None
+    message: Message | None = None
+    state: TaskState | None = None
+    error: str | None = None
+    # Short category of the error, e.g. 'http 503' or 'jsonrpc -32001'
+    error_type: str | None = None
+    events: int = 0
+    reconnects: int = 0
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+    first_event_at: float | None = None
+    last_event_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def needs_input(self) -> bool:
+        return self.state in INTERRUPTED_STATES
+
+    @property
+    def time_to_first_event(self) -> float | None:
+        if self.first_event_at is None:
+            return None
+        return self.first_event_at - self.started_at
+
+    @property
+    def duration(self) -> float | None:
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+class TaskRunner:
+    """Drives message exchanges with an agent until they need attention.
+
+    run() sends one message and follows the resulting task until it reaches a
+    terminal state, needs more input, or the agent answers with a message.
+    A dropped stream is resumed with tasks/resubscribe after an exponential
+    backoff; once max_reconnects attempts in a row failed, or for agents
+    that do not stream, the task is polled with tasks/get instead. With push
+    notifications, wait_for_push replaces polling: it is given the task id and
+    resolves to the task once the agent pushed its final state. Runs are
+    independent, so several can be awaited concurrently on one runner.
+    """
+
+    def __init__(
+        self,
+        client: A2AClient,
+        streaming: bool,
+        push_notification_url: str | None = None,
+        max_reconnects: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        idle_timeout: float | None = 300.0,
+        wait_for_push: Callable[[str], Awaitable[Task]] | None = None,
+        verbose: bool = True,
+    ):
+        self.client = client
+        self.streaming = streaming
+        self.push_notification_url = push_notification_url
+        self.max_reconnects = max_reconnects
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        # A stream silent for this long is treated as dropped
+        self.idle_timeout = idle_timeout
+        self.wait_for_push = wait_for_push
+        self.verbose = verbose
+
+    async def run(self, message: Message, label: str = '') -> TaskRun:
+        run = TaskRun(
+            label=label, context_id=message.contextId, task_id=message.taskId
+        )
+        params = self._send_params(message)
+        try:
+            if self.streaming:
+                await self._stream(run, params)
+            else:
+                await self._send(run, params)
+        except A2AClientHTTPError as e:
+            run.error, run.error_type = str(e), f'http {e.status_code}'
+        except (A2AClientError, httpx.HTTPError, TimeoutError) as e:
+            run.error, run.error_type = str(e), type(e).__name__
+        run.finished_at = time.monotonic()
+        return run
+
+    def _send_params(self, message: Message) -> MessageSendParams:
+        configuration = MessageSendConfiguration(acceptedOutputModes=['text'])
+        if self.push_notification_url:
+            # The result is delivered to the listener
+            configuration.blocking = False
+            configuration.pushNotificationConfig = PushNotificationConfig(
+                url=self.push_notification_url,
+                authentication=PushNotificationAuthenticationInfo(
+                    schemes=['bearer']
+                ),
+            )
+        return MessageSendParams(message=message, configuration=configuration)
+
+    async def _stream(self, run: TaskRun, params: MessageSendParams):
+        failures = 0
+        stream = self.client.send_message_streaming(
+            SendStreamingMessageRequest(id=str(uuid4()), params=params),
+            http_kwargs={'timeout': self._stream_timeout()},
+        )
+        while True:
+            error = None
+            try:
+                async for response in stream:
+                    if isinstance(response.root, JSONRPCErrorResponse):
+                        if run.reconnects:
+                            # Resubscribing is unsupported or the task
+                            # finished while we were away
+                            await self._poll(run)
+                        else:
+                            self._on_error(run, response.root)
+                        return
+                    failures = 0
+                    if self._on_event(run, response.root.result):
+                        return
+            except A2AClientHTTPError as e:
+                # Only network errors are worth retrying
+                if e.status_code != 503 or not run.task_id:
+                    raise
+                error = e
+            if not run.task_id:
+                # The agent closed the stream without creating a task
+                return
+            failures += 1
+            if failures > self.max_reconnects:
+                self._log(run, 'giving up on the stream, polling the task')
+                await self._poll(run)
+                return
+            delay = self._delay(failures)
+            self._log(
+                run,
+                f'stream interrupted ({error or "closed early"}),'
+                f' resubscribing in {delay:.1f}s',
+            )
+            await asyncio.sleep(delay)
+            run.reconnects += 1
+            stream = self._resubscribe(run.task_id)
+
+    async def _send(self, run: TaskRun, params: MessageSendParams):
+        response = await self.client.send_message(
+            SendMessageRequest(id=str(uuid4()), params=params)
+        )
+        if isinstance(response.root, JSONRPCErrorResponse):
+            self._on_error(run, response.root)
+            return
+        if self._on_event(run, response.root.result):
+            return
+        # Still running, e.g. when the result is pushed to the listener
+        if self.wait_for_push and run.task_id:
+            self._on_event(run, await self.wait_for_push(run.task_id))
+        else:
+            await self._poll(run)
+
+    async def _poll(self, run: TaskRun):
+        attempt = 0
+        while True:
+            try:
+                if await self._get_task(run):
+                    return
+                attempt = 0
+            except (A2AClientError, httpx.HTTPError) as e:
+                attempt += 1
+                if attempt > self.max_reconnects:
+                    raise
+                self._log(run, f'failed to get the task: {e}')
+            await asyncio.sleep(self._delay(attempt + 1))
+
+    async def _get_task(self, run: TaskRun) -> bool:
+        """Refreshes the task, returning whether the exchange is over."""
+        response = await self.client.get_task(
+            GetTaskRequest(
+                id=str(uuid4()), params=TaskQueryParams(id=run.task_id)
+            )
+        )
+        if isinstance(response.root, JSONRPCErrorResponse):
+            self._on_error(run, response.root)
+            return True
+        return self._on_event(run, response.root.result)
+
+    async def _resubscribe(
+        self, task_id: str
+    ) -> AsyncIterator[SendStreamingMessageResponse]:
+        # A2AClient has no resubscribe call, so mirror send_message_streaming
+        request = TaskResubscriptionRequest(
+            id=str(uuid4()), params=TaskIdParams(id=task_id)
+        )
+        async with aconnect_sse(
+            self.client.httpx_client,
+            'POST',
+            self.client.url,
+            json=request.model_dump(mode='json', exclude_none=True),
+            timeout=self._stream_timeout(),
+        ) as event_source:
+            try:
+                async for sse in event_source.aiter_sse():
+                    yield SendStreamingMessageResponse(**json.loads(sse.data))
+            except SSEError as e:
+                raise A2AClientHTTPError(
+                    400, f'Invalid SSE response or protocol error: {e}'
+                ) from e
+            except httpx.RequestError as e:
+                raise A2AClientHTTPError(
+                    503, f'Network communication error: {e}'
+                ) from e
+
+    def _on_event(
+        self,
+        run: TaskRun,
+        event: Task | Message | TaskStatusUpdateEvent | TaskArtifactUpdateEvent,
+    ) -> bool:
+        """Records an event, returning whether the exchange is over."""
+        now = time.monotonic()
+        latency = now - (run.last_event_at or run.started_at)
+        if run.first_event_at is None:
+            run.first_event_at = now
+        run.last_event_at = now
+        run.events += 1
+        run.context_id = event.contextId
+        if self.verbose:
+            print(
+                f'{self._prefix(run)}+{latency * 1000:.0f}ms'
+                f' {event.kind} => {event.model_dump_json(exclude_none=True)}'
+            )
+        if isinstance(event, Message):
+            run.message = event
+            return True
+        if isinstance(event, Task):
+            run.task = event
+            run.task_id = event.id
+            run.state = event.status.state
+        else:
+            run.task_id = event.taskId
+            if isinstance(event, TaskStatusUpdateEvent):
+                run.state = event.status.state
+                if run.task:
+                    run.task.status = event.status
+            elif run.task:
+                run.task.artifacts = [
+                    *(run.task.artifacts or []),
+                    event.artifact,
+                ]
+        return (
+            run.state in TERMINAL_STATES
+            or run.state in INTERRUPTED_STATES
+            or bool(getattr(event, 'final', False))
+        )
+
+    def _on_error(self, run: TaskRun, response: JSONRPCErrorResponse):
+        run.error = str(response.error)
+        run.error_type = f'jsonrpc {response.error.code}'
+        self._log(run, f'error => {run.error}')
+
+    def _stream_timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(30.0, read=self.idle_timeout)
+
+    def _delay(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        # Jitter keeps concurrent runs from reconnecting in lockstep
+        return delay * random.uniform(0.5, 1.0)
+
+    def _prefix(self, run: TaskRun) -> str:
+        return f'[{run.label}] ' if run.label else ''
+
+    def _log(self, run: TaskRun, text: str):
+        if self.verbose:
+            print(f'{self._prefix(run)}{text}')
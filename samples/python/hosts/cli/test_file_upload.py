@@ -0,0 +1,121 @@
+"""Tests of the CLI attachment upload against the stub agent's file routes.
+
+run:
+  uv run python -m unittest hosts.cli.test_file_upload
+"""
+
+import tempfile
+import unittest
+
+from pathlib import Path
+
+import httpx
+
+from a2a.types import FileWithBytes, FileWithUri
+from starlette.applications import Starlette
+
+from hosts.cli import file_upload
+from hosts.cli.stub_agent import file_routes
+
+
+class FileUploadTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.files = Path(self.directory.name) / 'files'
+        self.files.mkdir()
+        self.path = Path(self.directory.name) / 'report.txt'
+        self.content = b'0123456789' * 1000
+        self.path.write_bytes(self.content)
+
+    def client(self, handler=None):
+        if handler:
+            transport = httpx.MockTransport(handler)
+        else:
+            app = Starlette(routes=file_routes(self.files))
+            transport = httpx.ASGITransport(app)
+        return httpx.AsyncClient(transport=transport, base_url='http://agent')
+
+    async def test_read_chunks(self):
+        chunks = [
+            chunk async for chunk in file_upload.read_chunks(self.path, 4096)
+        ]
+        self.assertEqual([len(chunk) for chunk in chunks], [4096, 4096, 1808])
+        self.assertEqual(b''.join(chunks), self.content)
+
+    async def test_upload_is_streamed_to_the_stub_agent(self):
+        async with self.client() as client:
+            uri = await file_upload.upload_file(
+                client, 'http://agent/files/', self.path
+            )
+            self.assertRegex(uri, r'^http://agent/files/[0-9a-f]+/report.txt$')
+            response = await client.get(uri)
+        self.assertEqual(response.content, self.content)
+
+    async def test_uri_is_taken_from_the_json_body(self):
+        def handler(request):
+            return httpx.Response(201, json={'uri': 'http://store/report'})
+
+        async with self.client(handler) as client:
+            uri = await file_upload.upload_file(
+                client, 'http://agent', self.path
+            )
+        self.assertEqual(uri, 'http://store/report')
+
+    async def test_uri_is_taken_from_the_location_header(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                201, headers={'Location': 'http://store/report'}
+            )
+
+        async with self.client(handler) as client:
+            uri = await file_upload.upload_file(
+                client, 'http://agent', self.path
+            )
+        self.assertEqual(uri, 'http://store/report')
+        self.assertEqual(requests[0].method, 'PUT')
+        self.assertEqual(
+            requests[0].headers['Content-Length'], str(len(self.content))
+        )
+        self.assertEqual(requests[0].headers['Content-Type'], 'text/plain')
+        self.assertEqual(requests[0].content, self.content)
+
+    async def test_upload_url_is_used_without_uri(self):
+        def handler(request):
+            return httpx.Response(204)
+
+        async with self.client(handler) as client:
+            uri = await file_upload.upload_file(
+                client, 'http://agent', self.path
+            )
+        self.assertRegex(uri, r'^http://agent/[0-9a-f]+/report.txt$')
+
+    async def test_failed_upload_raises(self):
+        def handler(request):
+            return httpx.Response(500)
+
+        async with self.client(handler) as client:
+            with self.assertRaises(httpx.HTTPStatusError):
+                await file_upload.upload_file(client, 'http://agent', self.path)
+
+    async def test_large_files_are_sent_by_reference(self):
+        async with self.client() as client:
+            part = await file_upload.create_file_part(
+                client, self.path, 'http://agent/files', inline_limit=1024
+            )
+        self.assertIsInstance(part.file, FileWithUri)
+        self.assertEqual(part.file.name, 'report.txt')
+
+    async def test_small_files_are_sent_inline(self):
+        async with self.client() as client:
+            part = await file_upload.create_file_part(
+                client, self.path, 'http://agent/files'
+            )
+        self.assertIsInstance(part.file, FileWithBytes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,12 +9,15 @@ from a2a.client import A2ACardResolver
 from a2a.types import (
     AgentCard,
     DataPart,
+    FileWithUri,
     Message,
     MessageSendConfiguration,
     MessageSendParams,
     Part,
     Task,
     TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
     TextPart,
 )
 from google.adk import Agent
@@ -23,7 +26,12 @@ from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
-from .remote_agent_connection import RemoteAgentConnections, TaskUpdateCallback
+from .remote_agent_connection import (
+    RemoteAgentBusyError,
+    RemoteAgentConnections,
+    TaskUpdateCallback,
+)
+from .remote_agent_registry import AgentUnavailableError, RemoteAgentRegistry
 
 
 class HostAgent:
@@ -38,16 +46,24 @@ class HostAgent:
         remote_agent_addresses: list[str],
         http_client: httpx.AsyncClient,
         task_callback: TaskUpdateCallback | None = None,
+        fan_out_timeout: float = 120.0,
     ):
         self.task_callback = task_callback
+        # Seconds each remote agent gets to answer a send_messages call
+        self.fan_out_timeout = fan_out_timeout
         self.httpx_client = http_client
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
-        self.agents: str = ''
+        # Tracks the health of the remote agents, re-registering their cards
+        # when revalidation finds that they changed.
+        self.registry = RemoteAgentRegistry(
+            http_client, on_card_updated=self.register_agent_card
+        )
         loop = asyncio.get_running_loop()
         loop.create_task(
             self.init_remote_agent_addresses(remote_agent_addresses)
         )
+        self.registry.start()
 
     async def init_remote_agent_addresses(
         self, remote_agent_addresses: list[str]
@@ -56,22 +72,24 @@ class HostAgent:
             for address in remote_agent_addresses:
                 task_group.create_task(self.retrieve_card(address))
         # The task groups run in the background and complete.
-        # Once completed the self.agents string is set and the remote
-        # connections are established.
+        # Once completed the remote connections are established.
 
     async def retrieve_card(self, address: str):
         card_resolver = A2ACardResolver(self.httpx_client, address)
         card = await card_resolver.get_agent_card()
-        self.register_agent_card(card)
+        self.register_agent_card(card, address)
 
-    def register_agent_card(self, card: AgentCard):
-        remote_connection = RemoteAgentConnections(self.httpx_client, card)
-        self.remote_agent_connections[card.name] = remote_connection
+    def register_agent_card(self, card: AgentCard, address: str | None = None):
+        remote_connection = self.remote_agent_connections.get(card.name)
+        if remote_connection:
+            # Keeps counting the requests already sent against the limit
+            remote_connection.update_card(card)
+        else:
+            self.remote_agent_connections[card.name] = RemoteAgentConnections(
+                self.httpx_client, card
+            )
         self.cards[card.name] = card
-        agent_info = []
-        for ra in self.list_remote_agents():
-            agent_info.append(json.dumps(ra))
-        self.agents = '\n'.join(agent_info)
+        self.registry.register(card, address)
 
     def create_agent(self) -> Agent:
         return Agent(
@@ -86,11 +104,14 @@ class HostAgent:
             tools=[
                 self.list_remote_agents,
                 self.send_message,
+                self.send_messages,
             ],
         )
 
     def root_instruction(self, context: ReadonlyContext) -> str:
         current_agent = self.check_state(context)
+        # Only offer the agents that are currently healthy
+        agents = '\n'.join(json.dumps(ra) for ra in self.list_remote_agents())
         return f"""You are an expert delegator that can delegate the user request to the
 appropriate remote agents.
 
@@ -100,6 +121,9 @@ can use to delegate the task.
 
 Execution:
 - For actionable requests, you can use `send_message` to interact with remote agents to take action.
+- When a request needs several remote agents and their work is independent,
+use `send_messages` to contact all of them at once instead of calling
+`send_message` repeatedly.
 
 Be sure to include the remote agent name when you respond to the user.
 
@@ -107,7 +131,7 @@ Please rely on tools to address the request, and don't make up the response. If
 Focus on the most recent parts of the conversation primarily.
 
 Agents:
-{self.agents}
+{agents}
 
 Current agent: {current_agent['active_agent']}
 """
@@ -137,9 +161,15 @@ Current agent: {current_agent['active_agent']}
 
         remote_agent_info = []
         for card in self.cards.values():
-            remote_agent_info.append(
-                {'name': card.name, 'description': card.description}
-            )
+            if not self.registry.is_available(card.name):
+                continue
+            info = {'name': card.name, 'description': card.description}
+            connection = self.remote_agent_connections.get(card.name)
+            if connection and connection.in_flight:
+                # Lets the model prefer idle agents when several could help
+                info['in_flight'] = connection.in_flight
+                info['busy'] = not connection.has_capacity
+            remote_agent_info.append(info)
         return remote_agent_info
 
     async def send_message(
@@ -167,25 +197,15 @@ Current agent: {current_agent['active_agent']}
         taskId = state.get('task_id', None)
         contextId = state.get('context_id', None)
         messageId = state.get('message_id', None)
-        task: Task
         if not messageId:
             messageId = str(uuid.uuid4())
-        request: MessageSendParams = MessageSendParams(
-            id=str(uuid.uuid4()),
-            message=Message(
-                role='user',
-                parts=[TextPart(text=message)],
-                messageId=messageId,
-                contextId=contextId,
-                taskId=taskId,
-            ),
-            configuration=MessageSendConfiguration(
-                acceptedOutputModes=['text', 'text/plain', 'image/png'],
-            ),
-        )
-        response = await client.send_message(request, self.task_callback)
+        async with self.registry.track(agent_name):
+            response = await client.send_message(
+                self._message_request(message, messageId, contextId, taskId),
+                self.task_callback,
+            )
         if isinstance(response, Message):
-            return await convert_parts(task.parts, tool_context)
+            return await convert_parts(response.parts, tool_context)
         task: Task = response
         # Assume completion unless a state returns that isn't complete
         state['session_active'] = task.status.state not in [
@@ -207,25 +227,225 @@ Current agent: {current_agent['active_agent']}
         elif task.status.state == TaskState.failed:
             # Raise error for failure
             raise ValueError(f'Agent {agent_name} task {task.id} failed')
-        response = []
-        if task.status.message:
-            # Assume the information is in the task message.
-            response.extend(
-                await convert_parts(task.status.message.parts, tool_context)
+        return await convert_task(task, tool_context)
+
+    async def send_messages(
+        self,
+        agent_names: list[str],
+        messages: list[str],
+        tool_context: ToolContext,
+    ):
+        """Sends messages to several remote agents at the same time.
+
+        Use this instead of calling send_message repeatedly when the work for
+        each agent does not depend on the answer of another agent. The
+        message at position i is sent to the agent at position i, a single
+        message is sent to every agent.
+
+        Args:
+          agent_names: The names of the agents to send the messages to.
+          messages: The messages to send, one per agent or one for all.
+          tool_context: The tool context this method runs in.
+
+        Returns:
+          A list with one entry per agent, holding the agent name, the status
+          of its task and its response. Agents that failed or did not answer
+          in time are reported with their status and an error instead.
+        """
+        if len(messages) == 1:
+            messages = messages * len(agent_names)
+        if len(messages) != len(agent_names):
+            raise ValueError(
+                'Provide one message per agent or a single message for all'
             )
-        if task.artifacts:
-            for artifact in task.artifacts:
-                response.extend(
-                    await convert_parts(artifact.parts, tool_context)
-                )
-        return response
+        state = tool_context.state
+        context_id = state.get('context_id', None)
+        active_agent = (
+            state.get('agent', None) if state.get('session_active') else None
+        )
+
+        async def send(agent_name: str, message: str):
+            client = self.remote_agent_connections.get(agent_name)
+            if not client:
+                return ValueError(f'Agent {agent_name} not found')
+            # Only the agent waiting for input continues its task
+            task_id = (
+                state.get('task_id', None)
+                if agent_name == active_agent
+                else None
+            )
+            request = self._message_request(
+                message, str(uuid.uuid4()), context_id, task_id
+            )
+            # Remote tasks created by the request, known once they started
+            task_ids = [task_id] if task_id else []
+            try:
+                async with self.registry.track(agent_name):
+                    return await asyncio.wait_for(
+                        client.send_message(
+                            request, self.task_callback, task_ids
+                        ),
+                        self.fan_out_timeout,
+                    )
+            except (AgentUnavailableError, RemoteAgentBusyError) as e:
+                # The request never reached the agent
+                return e
+            except Exception as e:
+                self._report_failure(client.get_agent(), request, e, task_ids)
+                return e
+
+        async def send_indexed(index: int, agent_name: str, message: str):
+            return index, await send(agent_name, message)
+
+        results: list[dict] = [{}] * len(agent_names)
+        pending = [
+            send_indexed(i, agent_name, message)
+            for i, (agent_name, message) in enumerate(
+                zip(agent_names, messages, strict=True)
+            )
+        ]
+        # Convert results in the order they arrive so artifacts are saved and
+        # progress is reported while slower agents are still working.
+        for next_result in asyncio.as_completed(pending):
+            index, response = await next_result
+            results[index] = await self._fan_out_result(
+                agent_names[index], response, tool_context
+            )
+        return results
+
+    async def _fan_out_result(
+        self,
+        agent_name: str,
+        response: Task | Message | Exception | None,
+        tool_context: ToolContext,
+    ) -> dict:
+        if isinstance(response, asyncio.TimeoutError):
+            return {
+                'agent': agent_name,
+                'status': 'timeout',
+                'error': f'No answer within {self.fan_out_timeout} seconds',
+            }
+        if isinstance(response, AgentUnavailableError):
+            return {
+                'agent': agent_name,
+                'status': 'unavailable',
+                'error': str(response),
+            }
+        if isinstance(response, RemoteAgentBusyError):
+            return {
+                'agent': agent_name,
+                'status': 'busy',
+                'error': str(response),
+            }
+        if isinstance(response, Exception):
+            return {
+                'agent': agent_name,
+                'status': 'error',
+                'error': str(response),
+            }
+        if isinstance(response, Message):
+            return {
+                'agent': agent_name,
+                'status': TaskState.completed.value,
+                'response': await convert_parts(response.parts, tool_context),
+            }
+        if response is None:
+            # The stream ended before the agent reported a task
+            return {
+                'agent': agent_name,
+                'status': 'error',
+                'error': f'Agent {agent_name} returned no task',
+            }
+        if response.status.state == TaskState.input_required:
+            # Hand the conversation to the agent that needs more input
+            state = tool_context.state
+            state['agent'] = agent_name
+            state['task_id'] = response.id
+            state['session_active'] = True
+            tool_context.actions.skip_summarization = True
+            tool_context.actions.escalate = True
+        return {
+            'agent': agent_name,
+            'status': response.status.state.value,
+            'response': await convert_task(response, tool_context),
+        }
+
+    def _message_request(
+        self,
+        message: str,
+        message_id: str,
+        context_id: str | None,
+        task_id: str | None,
+    ) -> MessageSendParams:
+        return MessageSendParams(
+            id=str(uuid.uuid4()),
+            message=Message(
+                role='user',
+                parts=[TextPart(text=message)],
+                messageId=message_id,
+                contextId=context_id,
+                taskId=task_id,
+            ),
+            configuration=MessageSendConfiguration(
+                acceptedOutputModes=['text', 'text/plain', 'image/png'],
+            ),
+        )
+
+    def _report_failure(
+        self,
+        card: AgentCard,
+        request: MessageSendParams,
+        error: Exception,
+        task_ids: list[str],
+    ):
+        """Marks the remote tasks of a failed or timed out request as failed.
+
+        When the agent failed before creating a task there is nothing to
+        mark, and the error is only returned to the model.
+        """
+        if not self.task_callback or not task_ids:
+            return
+        if isinstance(error, asyncio.TimeoutError):
+            text = f'{card.name} did not answer in time'
+        else:
+            text = f'{card.name} failed: {error}'
+        for task_id in task_ids:
+            self.task_callback(
+                TaskStatusUpdateEvent(
+                    taskId=task_id,
+                    contextId=request.message.contextId or '',
+                    final=True,
+                    status=TaskStatus(
+                        state=TaskState.failed,
+                        message=Message(
+                            role='agent',
+                            parts=[TextPart(text=text)],
+                            messageId=str(uuid.uuid4()),
+                            contextId=request.message.contextId,
+                            taskId=task_id,
+                        ),
+                    ),
+                ),
+                card,
+            )
+
+
+async def convert_task(task: Task, tool_context: ToolContext):
+    parts = []
+    if task.status.message:
+        # Assume the information is in the task message.
+        parts.extend(task.status.message.parts)
+    if task.artifacts:
+        for artifact in task.artifacts:
+            parts.extend(artifact.parts)
+    return await convert_parts(parts, tool_context)
 
 
 async def convert_parts(parts: list[Part], tool_context: ToolContext):
-    rval = []
-    for p in parts:
-        rval.append(await convert_part(p, tool_context))
-    return rval
+    # Parts are independent, so file parts are saved as artifacts concurrently
+    return list(
+        await asyncio.gather(*(convert_part(p, tool_context) for p in parts))
+    )
 
 
 async def convert_part(part: Part, tool_context: ToolContext):
@@ -234,17 +454,27 @@ async def convert_part(part: Part, tool_context: ToolContext):
     if part.root.kind == 'data':
         return part.root.data
     if part.root.kind == 'file':
-        # Repackage A2A FilePart to google.genai Blob
+        # Repackage A2A FilePart to google.genai Part. Files served by the
+        # remote agent are only referenced, whoever loads the artifact fetches
+        # them on demand. Inline bytes are decoded once and the artifact keeps
+        # that buffer, later loads share it instead of copying.
         # Currently not considering plain text as files
-        file_id = part.root.file.name
-        file_bytes = base64.b64decode(part.root.file.bytes)
-        file_part = types.Part(
-            inline_data=types.Blob(
-                mime_type=part.root.file.mimeType, data=file_bytes
+        file = part.root.file
+        file_id = file.name or f'file-{uuid.uuid4()}'
+        if isinstance(file, FileWithUri):
+            file_part = types.Part(
+                file_data=types.FileData(
+                    file_uri=file.uri, mime_type=file.mimeType
+                )
+            )
+        else:
+            file_part = types.Part(
+                inline_data=types.Blob(
+                    mime_type=file.mimeType, data=base64.b64decode(file.bytes)
+                )
             )
-        )
         await tool_context.save_artifact(file_id, file_part)
         tool_context.actions.skip_summarization = True
         tool_context.actions.escalate = True
         return DataPart(data={'artifact-file-id': file_id})
-    return f'Unknown type: {part.kind}'
+    return f'Unknown type: {part.root.kind}'
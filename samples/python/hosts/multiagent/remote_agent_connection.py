@@ -1,4 +1,6 @@
-from collections.abc import Callable
+import asyncio
+
+from collections.abc import Callable, Coroutine
 from uuid import uuid4
 
 import httpx
@@ -6,6 +8,8 @@ import httpx
 from a2a.client import A2AClient
 from a2a.types import (
     AgentCard,
+    CancelTaskRequest,
+    JSONRPCError,
     JSONRPCErrorResponse,
     Message,
     MessageSendParams,
@@ -13,6 +17,8 @@ from a2a.types import (
     SendStreamingMessageRequest,
     Task,
     TaskArtifactUpdateEvent,
+    TaskIdParams,
+    TaskState,
     TaskStatusUpdateEvent,
 )
 
@@ -20,22 +26,174 @@ from a2a.types import (
 TaskCallbackArg = Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent
 TaskUpdateCallback = Callable[[TaskCallbackArg, AgentCard], Task]
 
+# Agent card extension parameter advertising how many concurrent requests
+# the agent accepts, e.g. {"params": {"maxConcurrency": 4}}.
+MAX_CONCURRENCY_PARAM = 'maxConcurrency'
+
+_TERMINAL_STATES = (
+    TaskState.completed,
+    TaskState.canceled,
+    TaskState.failed,
+    TaskState.rejected,
+)
+
+
+class RemoteAgentBusyError(Exception):
+    """Raised when no request slot frees up within the queue timeout."""
+
+
+class RemoteAgentError(Exception):
+    """Raised when the remote agent answers with a JSON-RPC error."""
+
+    def __init__(self, agent_name: str, error: JSONRPCError):
+        super().__init__(
+            f'Agent {agent_name} returned error {error.code}: {error.message}'
+        )
+        self.error = error
+
+
+def max_concurrency_from_card(card: AgentCard) -> int | None:
+    """Returns the concurrency limit advertised in the agent card, if any."""
+    for extension in card.capabilities.extensions or []:
+        if extension.params and MAX_CONCURRENCY_PARAM in extension.params:
+            return int(extension.params[MAX_CONCURRENCY_PARAM])
+    return None
+
 
 class RemoteAgentConnections:
-    """A class to hold the connections to the remote agents."""
+    """A class to hold the connections to the remote agents.
 
-    def __init__(self, client: httpx.AsyncClient, agent_card: AgentCard):
+    At most max_concurrency requests are sent to the agent at a time, falling
+    back to the limit advertised in its card and unbounded otherwise. Further
+    requests wait up to queue_timeout seconds for a slot. When the caller
+    abandons a request, the remote task is canceled as well. update_card()
+    applies a changed card in place, so requests already sent keep counting
+    against the limit.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        agent_card: AgentCard,
+        max_concurrency: int | None = None,
+        queue_timeout: float | None = 30.0,
+    ):
+        self._http_client = client
         self.agent_client = A2AClient(client, agent_card)
         self.card = agent_card
-        self.pending_tasks = set()
+        # Ids of the remote tasks this host is currently waiting on
+        self.pending_tasks: set[str] = set()
+        self._max_concurrency_override = max_concurrency
+        self.max_concurrency = max_concurrency or max_concurrency_from_card(
+            agent_card
+        )
+        self.queue_timeout = queue_timeout
+        # Notified whenever a slot frees up or the limit changes
+        self._slot_freed = asyncio.Condition()
+        self._in_flight = 0
+        self._queued = 0
+        self._background: set[asyncio.Task] = set()
 
     def get_agent(self) -> AgentCard:
         return self.card
 
+    def update_card(self, agent_card: AgentCard) -> None:
+        """Switches to a new version of the agent card.
+
+        The concurrency limit follows the new card unless it was set
+        explicitly. Requests in flight keep their slots, and queued requests
+        keep waiting for the new limit.
+        """
+        self.agent_client = A2AClient(self._http_client, agent_card)
+        self.card = agent_card
+        max_concurrency = (
+            self._max_concurrency_override
+            or max_concurrency_from_card(agent_card)
+        )
+        if max_concurrency == self.max_concurrency:
+            return
+        self.max_concurrency = max_concurrency
+        if self._queued:
+            # A higher limit lets queued requests through
+            self._run_in_background(self._notify_all())
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently sent to the agent."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a free slot."""
+        return self._queued
+
+    @property
+    def has_capacity(self) -> bool:
+        return (
+            self.max_concurrency is None
+            or self._in_flight < self.max_concurrency
+        )
+
     async def send_message(
         self,
         request: MessageSendParams,
         task_callback: TaskUpdateCallback | None,
+        task_ids: list[str] | None = None,
+    ) -> Task | Message | None:
+        """Sends the request, waiting for a free slot first.
+
+        The ids of the remote tasks the request created are added to
+        task_ids as soon as they are known, so a caller can still refer to
+        them after a failure.
+        """
+        await self._acquire_slot()
+        if task_ids is None:
+            task_ids = []
+        try:
+            return await self._send_message(request, task_callback, task_ids)
+        except asyncio.CancelledError:
+            for task_id in task_ids:
+                if task_id in self.pending_tasks:
+                    self._cancel_remote_task(task_id)
+            raise
+        finally:
+            for task_id in task_ids:
+                self.pending_tasks.discard(task_id)
+            self._in_flight -= 1
+            if self._queued:
+                self._run_in_background(self._notify_all())
+
+    async def _acquire_slot(self) -> None:
+        if not self.has_capacity or self._queued:
+            self._queued += 1
+            try:
+                async with (
+                    asyncio.timeout(self.queue_timeout),
+                    self._slot_freed,
+                ):
+                    await self._slot_freed.wait_for(lambda: self.has_capacity)
+                    self._in_flight += 1
+                    return
+            except TimeoutError as e:
+                raise RemoteAgentBusyError(
+                    f'Agent {self.card.name} is busy with'
+                    f' {self._in_flight} requests'
+                ) from e
+            finally:
+                self._queued -= 1
+        self._in_flight += 1
+
+    async def _notify_all(self) -> None:
+        # Every waiter checks the limit again, so a wake-up is not lost when
+        # the waiter it went to has just timed out
+        async with self._slot_freed:
+            self._slot_freed.notify_all()
+
+    async def _send_message(
+        self,
+        request: MessageSendParams,
+        task_callback: TaskUpdateCallback | None,
+        task_ids: list[str],
     ) -> Task | Message | None:
         if self.card.capabilities.streaming:
             task = None
@@ -43,13 +201,14 @@ class RemoteAgentConnections:
                 SendStreamingMessageRequest(id=str(uuid4()), params=request)
             ):
                 if not response.root.result:
-                    return response.root.error
+                    raise RemoteAgentError(self.card.name, response.root.error)
                 # In the case a message is returned, that is the end of the interaction.
                 event = response.root.result
                 if isinstance(event, Message):
                     return event
 
                 # Otherwise we are in the Task + TaskUpdate cycle.
+                self._track_task(event, task_ids)
                 if task_callback and event:
                     task = task_callback(event, self.card)
                 if hasattr(event, 'final') and event.final:
@@ -60,10 +219,49 @@ class RemoteAgentConnections:
             SendMessageRequest(id=str(uuid4()), params=request)
         )
         if isinstance(response.root, JSONRPCErrorResponse):
-            return response.root.error
+            raise RemoteAgentError(self.card.name, response.root.error)
         if isinstance(response.root.result, Message):
             return response.root.result
 
         if task_callback:
             task_callback(response.root.result, self.card)
         return response.root.result
+
+    def _track_task(self, event: TaskCallbackArg, task_ids: list[str]):
+        if isinstance(event, Task):
+            task_id, state = event.id, event.status.state
+        else:
+            task_id = event.taskId
+            state = (
+                event.status.state
+                if isinstance(event, TaskStatusUpdateEvent)
+                else None
+            )
+        if task_id not in task_ids:
+            task_ids.append(task_id)
+        if state in _TERMINAL_STATES:
+            self.pending_tasks.discard(task_id)
+        else:
+            self.pending_tasks.add(task_id)
+
+    def _cancel_remote_task(self, task_id: str):
+        """Asks the agent to cancel a task without waiting for the answer."""
+
+        async def cancel():
+            try:
+                await self.agent_client.cancel_task(
+                    CancelTaskRequest(
+                        id=str(uuid4()), params=TaskIdParams(id=task_id)
+                    )
+                )
+            except Exception as e:
+                print(
+                    f'Failed to cancel task {task_id} on {self.card.name}: {e}'
+                )
+
+        self._run_in_background(cancel())
+
+    def _run_in_background(self, coro: Coroutine) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
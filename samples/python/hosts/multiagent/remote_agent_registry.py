@@ -0,0 +1,249 @@
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import enum
+import time
+
+from collections.abc import AsyncIterator, Callable
+
+import httpx
+
+from a2a.client import A2ACardResolver
+from a2a.types import AgentCard
+
+from .remote_agent_connection import RemoteAgentBusyError
+
+
+class CircuitState(str, enum.Enum):
+    """State of the circuit breaker guarding a remote agent."""
+
+    closed = 'closed'
+    open = 'open'
+    half_open = 'half-open'
+
+
+class AgentUnavailableError(ValueError):
+    """Raised when a call is rejected because the agent's circuit is open."""
+
+
+@dataclasses.dataclass
+class AgentHealth:
+    """Health statistics of a single remote agent."""
+
+    card: AgentCard
+    # Address the card was fetched from, used to fetch it again
+    address: str
+    # Outcomes of the most recent calls, True for success
+    outcomes: collections.deque[bool]
+    latency_ms: float | None = None
+    in_flight: int = 0
+    consecutive_failures: int = 0
+    state: CircuitState = CircuitState.closed
+    opened_at: float = 0.0
+    last_validated: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.card.name
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'state': self.state.value,
+            'latency_ms': self.latency_ms,
+            'error_rate': self.error_rate,
+            'in_flight': self.in_flight,
+            'consecutive_failures': self.consecutive_failures,
+        }
+
+
+class RemoteAgentRegistry:
+    """Tracks the health of remote agents and fails fast on broken ones.
+
+    Every call to a remote agent goes through track(), which records its
+    latency and outcome. After failure_threshold consecutive failures the
+    agent's circuit opens and calls are rejected immediately. Once
+    reset_timeout seconds have passed, or the agent card can be fetched again,
+    a single trial call is let through; its outcome closes or re-opens the
+    circuit.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        on_card_updated: Callable[[AgentCard], None] | None = None,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        window: int = 20,
+        revalidate_interval: float = 300.0,
+        latency_smoothing: float = 0.2,
+    ):
+        self.http_client = http_client
+        self.on_card_updated = on_card_updated
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.window = window
+        self.revalidate_interval = revalidate_interval
+        self.latency_smoothing = latency_smoothing
+        self._health: dict[str, AgentHealth] = {}
+        self._revalidate_task: asyncio.Task | None = None
+
+    def register(self, card: AgentCard, address: str | None = None):
+        """Starts tracking the agent or updates its card.
+
+        The card is fetched again from address when it is revalidated,
+        falling back to the address it was registered with before and then
+        to the URL in the card.
+        """
+        health = self._health.get(card.name)
+        if health is None:
+            self._health[card.name] = AgentHealth(
+                card=card,
+                address=address or card.url,
+                outcomes=collections.deque(maxlen=self.window),
+                last_validated=time.monotonic(),
+            )
+        else:
+            health.card = card
+            if address:
+                health.address = address
+            health.last_validated = time.monotonic()
+
+    def health(self, name: str) -> AgentHealth | None:
+        return self._health.get(name)
+
+    def stats(self) -> list[dict]:
+        return [health.to_dict() for health in self._health.values()]
+
+    def is_available(self, name: str) -> bool:
+        """Whether a call to the agent would currently be let through."""
+        health = self._health.get(name)
+        if health is None:
+            return True
+        if health.state == CircuitState.closed:
+            return True
+        if health.state == CircuitState.half_open:
+            # Only one trial call at a time
+            return health.in_flight == 0
+        return time.monotonic() - health.opened_at >= self.reset_timeout
+
+    @contextlib.asynccontextmanager
+    async def track(self, name: str) -> AsyncIterator[AgentHealth | None]:
+        """Guards and measures one call to the named agent.
+
+        Exceptions raised by the call, including RemoteAgentError for a
+        JSON-RPC error answer, count as failures of the agent.
+
+        Raises:
+          AgentUnavailableError: If the agent's circuit is open.
+        """
+        if not self.is_available(name):
+            raise AgentUnavailableError(
+                f'Agent {name} is unavailable after repeated failures'
+            )
+        health = self._health.get(name)
+        if health is None:
+            yield None
+            return
+        if health.state == CircuitState.open:
+            health.state = CircuitState.half_open
+        health.in_flight += 1
+        start = time.monotonic()
+        try:
+            yield health
+        except (asyncio.CancelledError, RemoteAgentBusyError):
+            # The caller gave up or the host's own concurrency limit was hit,
+            # this says nothing about the agent's health
+            raise
+        except Exception:
+            self._record(health, False, time.monotonic() - start)
+            raise
+        else:
+            self._record(health, True, time.monotonic() - start)
+        finally:
+            health.in_flight -= 1
+
+    def _record(
+        self, health: AgentHealth, success: bool, elapsed: float | None
+    ):
+        health.outcomes.append(success)
+        if elapsed is not None:
+            latency_ms = elapsed * 1000
+            if health.latency_ms is None:
+                health.latency_ms = latency_ms
+            else:
+                health.latency_ms += self.latency_smoothing * (
+                    latency_ms - health.latency_ms
+                )
+        if success:
+            health.consecutive_failures = 0
+            health.state = CircuitState.closed
+            return
+        health.consecutive_failures += 1
+        if (
+            health.state == CircuitState.half_open
+            or health.consecutive_failures >= self.failure_threshold
+        ):
+            health.state = CircuitState.open
+            health.opened_at = time.monotonic()
+
+    async def revalidate(self):
+        """Fetches the card of every agent that is due for validation."""
+        now = time.monotonic()
+        due = [
+            health
+            for health in self._health.values()
+            if health.state != CircuitState.closed
+            or now - health.last_validated >= self.revalidate_interval
+        ]
+        await asyncio.gather(*(self._revalidate(health) for health in due))
+
+    async def _revalidate(self, health: AgentHealth):
+        try:
+            card = await A2ACardResolver(
+                self.http_client, health.address
+            ).get_agent_card()
+        except Exception as e:
+            print(f'Failed to revalidate agent {health.name}: {e}')
+            self._record(health, False, None)
+            return
+        health.last_validated = time.monotonic()
+        if health.state == CircuitState.open:
+            # The agent is reachable again, allow a trial call
+            health.state = CircuitState.half_open
+        if not card.url:
+            card.url = health.card.url
+        if card.name == health.name and card != health.card:
+            health.card = card
+            if self.on_card_updated:
+                self.on_card_updated(card)
+
+    def start(self, interval: float | None = None):
+        """Starts revalidating agents in the background of the running loop."""
+        if self._revalidate_task and not self._revalidate_task.done():
+            return
+        self._revalidate_task = asyncio.get_running_loop().create_task(
+            self._revalidate_loop(interval or min(self.reset_timeout, 60.0))
+        )
+
+    async def stop(self):
+        if self._revalidate_task:
+            self._revalidate_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._revalidate_task
+            self._revalidate_task = None
+
+    async def _revalidate_loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.revalidate()
+            except Exception as e:
+                print(f'Failed to revalidate agents: {e}')